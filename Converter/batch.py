@@ -0,0 +1,166 @@
+# batch.py
+# Process-pool batch engine: fan (src_fmt, dst_fmt, in_path, out_path) jobs out to
+# long-lived worker processes that keep their warmed resources between jobs.
+import os
+import sys
+import time
+import importlib
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+
+# job     : the (src_fmt, dst_fmt, in_path, out_path) tuple
+# result  : whatever the runner returned (None → error is set)
+# error   : None on success, else a message
+# pid/rss_mb/seconds : which worker ran it, its RSS afterwards, wall time
+BatchResult = namedtuple("BatchResult", "job result error pid rss_mb seconds")
+
+# max_tasks_per_child appeared in Python 3.11
+_HAS_MAX_TASKS = sys.version_info >= (3, 11)
+
+
+def current_rss_mb() -> float:
+    """Resident set size of this process in MB (0.0 if it cannot be measured)."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports KB, macOS bytes
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    except Exception:
+        return 0.0
+
+
+def _resolve(target):
+    """Callable, or "module:function" string → callable."""
+    if callable(target):
+        return target
+    module_name, _, attr = target.partition(":")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def _init_worker(warmup):
+    """Pool initializer: preload fonts, OCR readers, ... once per worker process."""
+    for hook in warmup:
+        try:
+            _resolve(hook)()
+        except Exception as e:
+            print(f"⚠️ Worker warm-up {hook!r} failed: {e}")
+
+
+def _run_one(runner, job, options):
+    start = time.time()
+    try:
+        result = _resolve(runner)(*job, **(options or {}))
+        error = None if result is not None else "converter returned no output"
+    except Exception as e:
+        result, error = None, str(e) or e.__class__.__name__
+    return BatchResult(job, result, error, os.getpid(), current_rss_mb(), time.time() - start)
+
+
+class BatchEngine:
+    """
+    Run many conversions on a pool of worker processes.
+
+    runner              : run_conversion-like callable (or "module:function"),
+                          called as runner(src_fmt, dst_fmt, in_path, out_path, **options)
+    workers             : worker processes (default: os.cpu_count()); 1 → run in-process
+    max_jobs_per_worker : recycle a worker after this many jobs (None → never)
+    max_rss_mb          : recycle a worker once it reports RSS above this (None → never)
+    warmup              : callables / "module:function" run once in every new worker
+    window              : max jobs in flight (default 2 × workers) so a recycled worker
+                          only has to drain a few jobs
+
+    Every worker is its own single-process pool, so recycling one (RSS ceiling,
+    crash, job budget) replaces that process alone: the others keep running and
+    keep their warmed-up fonts and OCR readers.
+    """
+
+    def __init__(self, runner, workers=None, max_jobs_per_worker=None, max_rss_mb=None,
+                 warmup=(), window=None):
+        self.runner = runner
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.max_rss_mb = max_rss_mb
+        self.warmup = list(warmup)
+        self.window = window or self.workers * 2
+        self.recycles = 0
+
+    def _new_pool(self):
+        kwargs = {"max_workers": 1, "initializer": _init_worker, "initargs": (self.warmup,)}
+        if self.max_jobs_per_worker and _HAS_MAX_TASKS:
+            kwargs["max_tasks_per_child"] = self.max_jobs_per_worker
+        return ProcessPoolExecutor(**kwargs)
+
+    def _run_serial(self, jobs, options, on_result):
+        _init_worker(self.warmup)
+        results = []
+        for job in jobs:
+            res = _run_one(self.runner, job, options)
+            results.append(res)
+            if on_result:
+                on_result(res)
+        return results
+
+    def run(self, jobs, options=None, on_result=None):
+        """Run all jobs; returns BatchResults in job order. on_result(res) is called as jobs finish."""
+        jobs = list(jobs)
+        if self.workers == 1:
+            return self._run_serial(jobs, options, on_result)
+
+        results = [None] * len(jobs)
+        pending = deque(range(len(jobs)))
+        # Without max_tasks_per_child, emulate it by retiring a worker's pool
+        job_budget = None
+        if self.max_jobs_per_worker and not _HAS_MAX_TASKS:
+            job_budget = self.max_jobs_per_worker
+        per_worker = max(1, self.window // self.workers)
+
+        pools = [self._new_pool() for _ in range(self.workers)]
+        busy = [0] * self.workers          # jobs in flight per worker
+        submitted = [0] * self.workers     # jobs sent to the worker's current process
+        retiring = [False] * self.workers  # take no more jobs; replace once drained
+        in_flight = {}
+        try:
+            while pending or in_flight:
+                for w in range(self.workers):
+                    if retiring[w] and not busy[w] and pending:
+                        pools[w].shutdown(wait=True)
+                        pools[w] = self._new_pool()
+                        retiring[w], submitted[w] = False, 0
+                        self.recycles += 1
+                    while pending and not retiring[w] and busy[w] < per_worker:
+                        i = pending.popleft()
+                        in_flight[pools[w].submit(_run_one, self.runner, jobs[i], options)] = i, w
+                        busy[w] += 1
+                        submitted[w] += 1
+                        if job_budget is not None and submitted[w] >= job_budget:
+                            retiring[w] = True
+                if not in_flight:
+                    break
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    i, w = in_flight.pop(fut)
+                    busy[w] -= 1
+                    try:
+                        res = fut.result()
+                    except BrokenProcessPool as e:
+                        # the worker died (OOM kill, segfault in a native lib, ...)
+                        res = BatchResult(jobs[i], None, f"worker crashed: {e}", None, 0.0, 0.0)
+                        retiring[w] = True
+                    except Exception as e:
+                        res = BatchResult(jobs[i], None, str(e), None, 0.0, 0.0)
+                    if self.max_rss_mb and res.rss_mb > self.max_rss_mb:
+                        retiring[w] = True
+                    results[i] = res
+                    if on_result:
+                        on_result(res)
+        finally:
+            for pool in pools:
+                pool.shutdown(wait=True)
+        return results
@@ -0,0 +1,106 @@
+# checkpoint.py
+# Resumable long conversions.
+#
+# Every few pages a long PDF → CSV run records the last page whose rows are
+# fully on disk, together with the byte size of each output at that moment. A
+# resumed run truncates the outputs back to those sizes (dropping a half-written
+# page), reopens them for appending and carries on from the next page. XLSX
+# cannot be appended to, so its rows are spooled as JSON lines and the workbook
+# is only built once the whole document has been read.
+import json
+import os
+
+# Pages between two checkpoints
+CHECKPOINT_EVERY = 25
+# Documents with fewer pages are only checkpointed when resume is requested
+CHECKPOINT_MIN_PAGES = 200
+
+
+def source_stamp(path):
+    """Identity of an input file: a checkpoint is only reused for the same file."""
+    st = os.stat(path)
+    return {"path": os.path.abspath(path), "size": st.st_size, "mtime": int(st.st_mtime)}
+
+
+def synced_size(f):
+    """Flush `f` to disk and return the size of its file."""
+    f.flush()
+    os.fsync(f.fileno())
+    return os.path.getsize(f.name)
+
+
+def truncate_to(path, size):
+    with open(path, "r+b") as f:
+        f.truncate(size)
+
+
+class Checkpoint:
+    """
+    JSON checkpoint file for one conversion.
+
+    identity : settings the saved state is only valid for (input stamp, outputs,
+               delimiter, ...); a checkpoint written with different ones is ignored
+    """
+
+    def __init__(self, path, identity):
+        self.path = path
+        self.identity = identity
+
+    def load(self):
+        """Saved state, or None if there is no usable checkpoint."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get("identity") != self.identity:
+            print(f"⚠️ Ignoring checkpoint {self.path}: it belongs to a different input or settings")
+            return None
+        return data.get("state")
+
+    def save(self, **state):
+        # write-then-rename, so a crash never leaves a torn checkpoint behind
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"identity": self.identity, "state": state}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+
+    def clear(self):
+        for path in (self.path, self.path + ".tmp"):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+class RowSpool:
+    """Append-only JSON-lines file of table rows; resume_size → truncate and append."""
+
+    def __init__(self, path, resume_size=None):
+        self.path = path
+        if resume_size is not None and os.path.exists(path):
+            truncate_to(path, resume_size)
+            self._file = open(path, "a", encoding="utf-8")
+        else:
+            self._file = open(path, "w", encoding="utf-8")
+
+    def append(self, row):
+        self._file.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+    def sync(self):
+        return synced_size(self._file)
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+    def __iter__(self):
+        self.close()
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                yield json.loads(line)
+
+    def remove(self):
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
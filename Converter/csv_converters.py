@@ -125,82 +125,26 @@ def csv_to_json(csv_path, json_path, chunksize=50000):
         raise RuntimeError(f"❌ TXT conversion failed: {e}")
 
 # ---------- Script to Font mapping (for image conversion) ----------
-FALLBACK_FONTS = {
-    "LATIN": "arial.ttf", # Assuming Arial is available or will be handled
-    "DEVANAGARI": "NotoSansDevanagari-Medium.ttf", # Assuming Noto is available or will be handled
-    "CJK": "arialuni.ttf", # Arial Unicode MS
-    "ARABIC": "arial.ttf",
-    "GREEK": "arial.ttf",
-    "OTHER": "arialuni.ttf",
-    "DEFAULT": "arial.ttf"
-}
+try:
+    from Converter.scripts import classify_scripts, script_of
+except ImportError:  # run as a script from inside Converter/
+    from scripts import classify_scripts, script_of
+
+try:
+    from Converter.fonts import FALLBACK_FONTS, get_image_font
+except ImportError:  # run as a script from inside Converter/
+    from fonts import FALLBACK_FONTS, get_image_font
 
 def detect_script_simple(text: str) -> str:
     """
     Heuristic script detection based on Unicode codepoints.
     Returns one of: DEVANAGARI, CJK, ARABIC, GREEK, HANGUL, LATIN, OTHER
     """
-    if not text:
-        return "LATIN"
-    for ch in text:
-        cp = ord(ch)
-        if 0x0900 <= cp <= 0x097F:  # Devanagari (Hindi, etc)
-            return "DEVANAGARI"
-        if (0x4E00 <= cp <= 0x9FFF) or (0x3400 <= cp <= 0x4DBF) or (0x3040 <= cp <= 0x30FF):
-            return "CJK"
-        if 0xAC00 <= cp <= 0xD7AF:
-            return "HANGUL"
-        if 0x0600 <= cp <= 0x06FF or 0x0750 <= cp <= 0x077F:
-            return "ARABIC"
-        if 0x0370 <= cp <= 0x03FF:
-            return "GREEK"
-    if any(ord(ch) > 127 for ch in text):
-        return "OTHER"
-    return "LATIN"
+    return script_of(text)
 
 def get_font_path(script, default_size=12):
-    font_name = FALLBACK_FONTS.get(script, FALLBACK_FONTS["DEFAULT"])
-    # In a Colab environment, commonly available fonts are in specific paths
-    # You might need to adjust these paths or download fonts if needed.
-    # Example paths (may vary):
-    colab_font_paths = [
-        f"/usr/share/fonts/truetype/liberation/{font_name}", # Liberation fonts often present
-        f"/usr/share/fonts/truetype/msttcorefonts/{font_name}", # If ttf-mscorefonts-installer is run
-        f"/usr/share/fonts/truetype/noto/{font_name}", # Noto fonts
-        f"/content/{font_name}", # If user uploaded
-        font_name # As a last resort, try just the name
-    ]
-
-    for font_path in colab_font_paths:
-        if os.path.exists(font_path):
-            try:
-                return ImageFont.truetype(font_path, default_size)
-            except Exception as e:
-                print(f"⚠️ Could not load font {font_path}: {e}")
-
-    # If specific font not found, try a generic fallback font that supports Unicode
-    try:
-        # Try a widely available Unicode font like Arial Unicode MS or Noto Sans
-        fallback_unicode_fonts = ["arialuni.ttf", "NotoSans-Regular.ttf"]
-        for fb_font_name in fallback_unicode_fonts:
-            for fb_path in colab_font_paths:
-                 potential_path = fb_path.replace(font_name, fb_font_name)
-                 if os.path.exists(potential_path):
-                     try:
-                         return ImageFont.truetype(potential_path, default_size)
-                     except Exception:
-                         pass # Try next fallback
-    except Exception:
-        pass # Continue to reportlab fallback
-
-    # Fallback to ReportLab's default font if Pillow fails
-    print(f"⚠️ Font {font_name} not found or could not be loaded. Using default Pillow font.")
-    try:
-        # Attempt to return a basic Pillow font if no TTF found
-        return ImageFont.load_default()
-    except Exception as e:
-        print(f"❌ Could not load default Pillow font: {e}")
-        raise RuntimeError("Could not load any font.")
+    """Cached PIL font for (script, size) — see fonts.py."""
+    return get_image_font(script, default_size)
 
 
 def csv_to_image(csv_path, out_path, font_size=12, margin=40, line_height=18,
@@ -246,8 +190,8 @@ def csv_to_image(csv_path, out_path, font_size=12, margin=40, line_height=18,
             # --- Measure wrapped line count first ---
             total_wrapped_lines = 0
             wrapped_chunks = []
-            for line in chunk:
-                script = detect_script_simple(line)
+            scripts, _ = classify_scripts(chunk)
+            for line, script in zip(chunk, scripts):
                 font = get_font_path(script, font_size)
                 wrapped = textwrap.wrap(line, width=int((img_width - 2*margin) / (font_size*0.6)))
                 if not wrapped:
@@ -58,16 +58,13 @@ def schedule_delete(file_path, delay=300):  # 300 sec = 5 minutes
 
 def doc_to_txt(docx_path, txt_path):
     try:
-        doc = Document(docx_path)
         with open(txt_path, "w", encoding="utf-8") as out:
-            # Paragraphs
-            for para in doc.paragraphs:
-                out.write((para.text or "") + "\n")
-            # Tables (append as TSV)
-            for table in doc.tables:
-                for row in table.rows:
-                    cells = [c.text.replace("\n"," ").strip() for c in row.cells]
-                    out.write("\t".join(cells) + "\n")
+            # Paragraphs as lines, table rows as TSV, in document order
+            for item in iter_body(docx_path):
+                if isinstance(item, TableRow):
+                    out.write("\t".join(c.replace("\n", " ").strip() for c in item.cells) + "\n")
+                else:
+                    out.write(item.text + "\n")
         return txt_path
     except Exception as e:
       raise RuntimeError(f"Error converting DOCX to TXT: {e}") from e
@@ -81,27 +78,40 @@ def _which(cmd: str) -> Optional[str]:
 def _ensure_dir(path: str):
     os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
 
+# -------------------------
+# LibreOffice (long-running daemon when UNO is available)
+# -------------------------
+try:
+    from Converter.office import office_convert
+except ImportError:  # run as a script from inside Converter/
+    from office import office_convert
+
+# -------------------------
+# Streaming DOCX pre-flight checks (table widths, images) without the DOM
+# -------------------------
+try:
+    from Converter.docx_inspect import inspect_docx
+except ImportError:  # run as a script from inside Converter/
+    from docx_inspect import inspect_docx
+
+# -------------------------
+# Streaming DOCX body reader (paragraphs and table rows in document order)
+# -------------------------
+try:
+    from Converter.docx_body import iter_body, iter_tables, TableRow
+except ImportError:  # run as a script from inside Converter/
+    from docx_body import iter_body, iter_tables, TableRow
+
 # -------------------------
 # Script detection (used for font suggestions)
 # -------------------------
+try:
+    from Converter.scripts import script_of
+except ImportError:  # run as a script from inside Converter/
+    from scripts import script_of
+
 def detect_script_simple(text: str) -> str:
-    if not text:
-        return "LATIN"
-    for ch in text:
-        cp = ord(ch)
-        if 0x0900 <= cp <= 0x097F:  # Devanagari (Hindi, etc)
-            return "DEVANAGARI"
-        if (0x4E00 <= cp <= 0x9FFF) or (0x3400 <= cp <= 0x4DBF) or (0x3040 <= cp <= 0x30FF):
-            return "CJK"
-        if 0xAC00 <= cp <= 0xD7AF:
-            return "HANGUL"
-        if 0x0600 <= cp <= 0x06FF or 0x0750 <= cp <= 0x077F:
-            return "ARABIC"
-        if 0x0370 <= cp <= 0x03FF:
-            return "GREEK"
-    if any(ord(ch) > 127 for ch in text):
-        return "OTHER"
-    return "LATIN"
+    return script_of(text)
 
 # ---------------- Helpers: Fonts -----------------
 FONTS_DIR = "fonts"
@@ -111,8 +121,9 @@ FONTS_DIR = "fonts"
 # -------------------------
 def convert_doc_to_docx_if_needed(input_path: str) -> str:
     """
-    Converts .doc to .docx using LibreOffice (headless). Returns a path to a .docx file.
-    Raises RuntimeError if soffice is missing or conversion fails.
+    Converts .doc to .docx using LibreOffice (the process-wide office, see
+    Converter/office.py). Returns a path to a .docx file.
+    Raises RuntimeError (OfficeError) if soffice is missing or conversion fails.
     """
     if input_path.lower().endswith(".docx"):
         return input_path
@@ -120,20 +131,9 @@ def convert_doc_to_docx_if_needed(input_path: str) -> str:
     if not input_path.lower().endswith(".doc"):
         raise RuntimeError("Unsupported file (expecting .doc/.docx): " + input_path)
 
-    soffice = _which("soffice")
-    if not soffice:
-        raise RuntimeError(
-            "LibreOffice (soffice) not found. Install it to support .doc -> .docx conversion.\n"
-            "Linux/Colab:  sudo apt-get update && sudo apt-get install -y libreoffice"
-        )
-
     tmp_out = tempfile.mkdtemp(prefix="doc2docx_")
-    cmd = [soffice, "--headless", "--convert-to", "docx", "--outdir", tmp_out, input_path]
-    subprocess.check_call(cmd)
     out = os.path.join(tmp_out, os.path.splitext(os.path.basename(input_path))[0] + ".docx")
-    if not os.path.exists(out):
-        raise RuntimeError("LibreOffice did not produce DOCX.")
-    return out
+    return office_convert(input_path, out, "docx")
 
 # -------------------------
 # Attempt to install Noto fonts (best-effort for Linux/Colab)
@@ -210,22 +210,7 @@ def ensure_noto_fonts_for_scripts(scripts: set):
 # Convert .docx -> .pdf using LibreOffice (preferred)
 # -------------------------
 def convert_docx_to_pdf_libreoffice(docx_path: str, output_pdf: str) -> str:
-    soffice = _which("soffice")
-    if not soffice:
-        raise RuntimeError(
-            "LibreOffice (soffice) not found. Install it for high-fidelity DOCX->PDF.\n"
-            "Linux/Colab:  sudo apt-get update && sudo apt-get install -y libreoffice"
-        )
-    outdir = os.path.dirname(os.path.abspath(output_pdf)) or "."
-    _ensure_dir(output_pdf)
-    cmd = [soffice, "--headless", "--convert-to", "pdf", "--outdir", outdir, docx_path]
-    subprocess.check_call(cmd)
-    produced = os.path.join(outdir, os.path.splitext(os.path.basename(docx_path))[0] + ".pdf")
-    if not os.path.exists(produced):
-        raise RuntimeError("LibreOffice did not produce PDF.")
-    if os.path.abspath(produced) != os.path.abspath(output_pdf):
-        os.replace(produced, output_pdf)
-    return output_pdf
+    return office_convert(docx_path, output_pdf, "pdf")
 
 # ---------- Rasterize (guaranteed readability) ----------
 def rasterize_pdf_to_pdf(input_pdf: str, output_pdf: str, dpi: int = 200) -> str:
@@ -273,12 +258,7 @@ def doc_to_pdf(input_path: str,
     # --- Check if doc has wide tables (>=5 columns) ---
     has_wide_tables = False
     try:
-        from docx import Document
-        doc = Document(docx_path)
-        for tbl in doc.tables:
-            if tbl.rows and len(tbl.rows[0].cells) >= 5:
-                has_wide_tables = True
-                break
+        has_wide_tables = inspect_docx(docx_path).max_columns >= 5
     except Exception as e:
         print(f"⚠️ Could not inspect tables in DOCX: {e}")
 
@@ -288,10 +268,15 @@ def doc_to_pdf(input_path: str,
 
             with open(docx_path, "rb") as f:
                 html = mammoth.convert_to_html(f).value
-            tmp_html = os.path.join(tempfile.gettempdir(), "doc_tmp.html")
-            with open(tmp_html, "w", encoding="utf-8") as f:
-                f.write(html)
-            pdfkit.from_file(tmp_html, output_pdf)
+            # per-call scratch dir: parallel conversions must not share one HTML file
+            html_dir = tempfile.mkdtemp(prefix="doc2html_")
+            try:
+                tmp_html = os.path.join(html_dir, "doc.html")
+                with open(tmp_html, "w", encoding="utf-8") as f:
+                    f.write(html)
+                pdfkit.from_file(tmp_html, output_pdf)
+            finally:
+                shutil.rmtree(html_dir, ignore_errors=True)
             print(f"✅ Converted via HTML path (wide table support): {output_pdf}")
             return output_pdf
         except Exception as e:
@@ -328,29 +313,12 @@ def doc_to_docx_image(input_path: str) -> str:
     Ensure the input is in DOCX format.
     If it's a .doc, convert using LibreOffice headless.
     """
-    import tempfile, subprocess, os, glob
-
-    if input_path.lower().endswith(".docx"):
-        return input_path
-
-    if input_path.lower().endswith(".doc"):
-        tmp_dir = tempfile.mkdtemp(prefix="doc2docx_")
-        try:
-            subprocess.check_call([
-                "soffice", "--headless", "--convert-to", "docx",
-                "--outdir", tmp_dir, input_path
-            ])
-
-            # ✅ Find the .docx file inside tmp_dir
-            converted_files = glob.glob(os.path.join(tmp_dir, "*.docx"))
-            if not converted_files:
-                raise RuntimeError("DOC→DOCX conversion failed, file not created.")
-
-            return converted_files[0]  # Return the actual converted path
-        except Exception as e:
-            raise RuntimeError(f"Failed to convert .doc to .docx: {e}")
-    else:
+    if not input_path.lower().endswith((".doc", ".docx")):
         raise RuntimeError(f"Unsupported file type: {input_path}")
+    try:
+        return convert_doc_to_docx_if_needed(input_path)
+    except Exception as e:
+        raise RuntimeError(f"Failed to convert .doc to .docx: {e}")
 
 def doc_to_image(input_path, out_path, dpi=200):
     """
@@ -367,11 +335,7 @@ def doc_to_image(input_path, out_path, dpi=200):
         # ✅ Detect wide tables
         wide_table = False
         try:
-            doc = Document(docx_path)
-            for table in doc.tables:
-                if len(table.columns) > 5:
-                    wide_table = True
-                    break
+            wide_table = inspect_docx(docx_path).max_columns > 5
         except Exception as e:
             print(f"⚠️ Could not inspect tables: {e}")
 
@@ -398,15 +362,8 @@ def doc_to_image(input_path, out_path, dpi=200):
         else:
             print("✅ No wide tables → Using LibreOffice pipeline")
             tmp_dir = tempfile.mkdtemp(prefix="doc2pdf_")
-            subprocess.check_call([
-                "soffice", "--headless", "--convert-to", "pdf",
-                "--outdir", tmp_dir, docx_path
-            ])
-
-            pdf_files = glob.glob(os.path.join(tmp_dir, "*.pdf"))
-            if not pdf_files:
-                raise RuntimeError("DOCX→PDF failed, no PDF generated.")
-            pdf_path = pdf_files[0]
+            pdf_path = convert_docx_to_pdf_libreoffice(
+                docx_path, os.path.join(tmp_dir, os.path.splitext(os.path.basename(docx_path))[0] + ".pdf"))
 
         print(f"✅ PDF ready at: {pdf_path}", '3')
 
@@ -467,51 +424,46 @@ def doc_to_image(input_path, out_path, dpi=200):
         if tmp_dir and os.path.exists(tmp_dir):
             shutil.rmtree(tmp_dir, ignore_errors=True)
 
+def _docx_cell(text):
+    """Cell text for CSV/JSON rows: one line, trimmed, unencodable characters dropped."""
+    text = text.replace("\n", " ").strip()
+    if text:
+        text = text.encode("utf-8", "ignore").decode("utf-8")
+    return text
+
 def doc_to_csv(input_path, csv_path):
     try:
         # Step 1: normalize DOC → DOCX
         docx_path = doc_to_docx_image(input_path)
-        doc = Document(docx_path)
 
         # 🚫 Step 2: Reject if any images exist
-        for rel in doc.part.rels.values():
-            if "image" in rel.target_ref:
-                raise RuntimeError("❌ Not supported: Document contains images, cannot export to CSV.")
+        if inspect_docx(docx_path).has_images:
+            raise RuntimeError("❌ Not supported: Document contains images, cannot export to CSV.")
 
-        # Step 3: Scan all tables first
-        valid_tables = []
-        for table in doc.tables:
-            col_count = len(table.rows[0].cells) if table.rows else 0
-            row_count = len(table.rows)
-
-            if col_count < 4 or row_count < 2:
-                continue  
+        # Step 3: Stream the tables (one in memory at a time), writing only valid ones
+        wrote_any = False
+        with open(csv_path, "w", encoding="utf-8-sig", newline="") as out:
+            writer = csv.writer(out)
+            for _, rows in iter_tables(docx_path):
+                col_count = len(rows[0])
+                if col_count < 4 or len(rows) < 2:
+                    continue
 
-            meaningful_rows = 0
-            for row in table.rows:
-                texts = [c.text.strip() for c in row.cells if c.text.strip()]
-                if len(texts) >= (col_count // 2) and any(len(t) >= 3 for t in texts):
-                    meaningful_rows += 1
+                meaningful_rows = 0
+                for row in rows:
+                    texts = [c.strip() for c in row if c.strip()]
+                    if len(texts) >= (col_count // 2) and any(len(t) >= 3 for t in texts):
+                        meaningful_rows += 1
+                if meaningful_rows < 2:
+                    continue
 
-            if meaningful_rows >= 2:
-                valid_tables.append(table)
+                for row in rows:
+                    writer.writerow([_docx_cell(c) for c in row])
+                wrote_any = True
 
-        if not valid_tables:
+        if not wrote_any:
             raise RuntimeError("❌ Not supported: No valid table (≥4 columns, ≥2 rows, with real data).")
 
-        # ✅ Step 4: Now open CSV only if conversion is confirmed
-        with open(csv_path, "w", encoding="utf-8-sig", newline="") as out:
-            writer = csv.writer(out)
-            for table in valid_tables:
-                for row in table.rows:
-                    row_data = []
-                    for c in row.cells:
-                        text = c.text.replace("\n", " ").strip()
-                        if text:
-                            text = text.encode("utf-8", "ignore").decode("utf-8")
-                        row_data.append(text)
-                    writer.writerow(row_data)
-
         return csv_path
 
     except Exception as e:
@@ -582,16 +534,20 @@ def doc_to_json(input_path, json_path):
         # ✅ DOC → DOCX ensure
         docx_path = doc_to_docx_image(input_path)
 
-        # ✅ Load DOCX
-        doc = Document(docx_path)
-
         # ✅ Step 3: Image check
-        for rel in doc.part.rels.values():
-            if "image" in rel.reltype:
-                raise RuntimeError("❌ Not supported: Document contains images.")
-
-        # ✅ Step 4: Raw text join
-        raw_text = "\n".join([p.text.strip() for p in doc.paragraphs if p.text.strip()])
+        if inspect_docx(docx_path).has_images:
+            raise RuntimeError("❌ Not supported: Document contains images.")
+
+        # ✅ Step 4: One pass over the body: non-empty paragraph lines + candidate tables
+        lines, tables = [], []
+        for item in iter_body(docx_path):
+            if isinstance(item, TableRow):
+                if not tables or item.table != tables[-1][0]:
+                    tables.append((item.table, []))
+                tables[-1][1].append([_docx_cell(c) for c in item.cells])
+            elif item.text.strip():
+                lines.append(item.text.strip())
+        raw_text = "\n".join(lines)
 
         # ✅ Step 5: Detect JSON-like content
         if raw_text.strip().startswith(("{", "[")):
@@ -603,24 +559,11 @@ def doc_to_json(input_path, json_path):
             except Exception:
                 pass  # not valid JSON, fallback
 
-        # ✅ Step 6: Detect table data
-        valid_tables = []
-        for table in doc.tables:
-            if len(table.columns) >= 4 and len(table.rows) >= 2:
-                table_data = []
-                for row in table.rows:
-                    row_data = []
-                    for c in row.cells:
-                        text = c.text.replace("\n", " ").strip()
-                        if text:
-                            text = text.encode("utf-8", "ignore").decode("utf-8")
-                        row_data.append(text)
-                    table_data.append(row_data)
-                valid_tables.append(table_data)
+        # ✅ Step 6: Keep tables with ≥4 columns and ≥2 rows
+        valid_tables = [rows for _, rows in tables if len(rows) >= 2 and len(rows[0]) >= 4]
 
         # ✅ Step 7: Detect tab/comma separated plain text (like csv.docx)
         if not valid_tables:
-            lines = [p.text.strip() for p in doc.paragraphs if p.text.strip()]
             table_data = []
             for line in lines:
                 if "," in line or "\t" in line or ";" in line:
@@ -640,13 +583,13 @@ def doc_to_json(input_path, json_path):
 
         return json_path
 
-
     except Exception as e:
         # ⚠️ Error aane par partial file delete
         if os.path.exists(json_path):
             os.remove(json_path)
         raise RuntimeError(f"Error converting DOC/DOCX to JSON: {e}") from e
-        
+
+
 # ---------------- CLI MENU ---------------- #
 
 def main():
@@ -0,0 +1,111 @@
+# docx_body.py
+# Streaming reader for the body of a DOCX: paragraphs and table rows in document order.
+#
+# The DOCX → TXT/CSV/JSON converters used to load the python-docx DOM, then walk
+# doc.paragraphs and doc.tables separately (so every table landed after every
+# paragraph) and call cell.text, which rebuilds the cell's text from its XML on
+# every access. iter_body() streams word/document.xml with lxml's iterparse and
+# yields each top-level paragraph as it closes, and each row of a top-level
+# table as soon as its </w:tr> is read. Rows and paragraphs are freed once
+# yielded, so memory stays at about one row whatever the document size.
+#
+# Cell values follow python-docx's row.cells: a cell spanning n grid columns
+# appears n times, and a vertically merged continuation cell repeats the text
+# of the cell it continues.
+from collections import namedtuple
+from itertools import groupby
+import zipfile
+
+try:
+    from Converter.docx_inspect import DOCUMENT_PART, W
+except ImportError:  # run as a script from inside Converter/
+    from docx_inspect import DOCUMENT_PART, W
+
+# A top-level paragraph, and one row of the `table`-th (0-based) top-level table
+Paragraph = namedtuple("Paragraph", "text")
+TableRow = namedtuple("TableRow", "table cells")
+
+_BODY, _TBL, _TR, _TC, _P, _R = W + "body", W + "tbl", W + "tr", W + "tc", W + "p", W + "r"
+_T, _TAB, _BR, _CR, _NB_HYPHEN = W + "t", W + "tab", W + "br", W + "cr", W + "noBreakHyphen"
+_GRID_BEFORE = f"{W}trPr/{W}gridBefore"
+_GRID_SPAN = f"{W}tcPr/{W}gridSpan"
+_V_MERGE = f"{W}tcPr/{W}vMerge"
+_VAL, _TYPE = W + "val", W + "type"
+
+
+def paragraph_text(p):
+    """Text of a <w:p> like python-docx's paragraph.text (tabs → "\\t", line breaks → "\\n")."""
+    parts = []
+    for el in p.iter(_T, _TAB, _BR, _CR, _NB_HYPHEN):
+        if el.getparent().tag != _R:
+            continue            # e.g. <w:tab> tab stops in the paragraph properties
+        tag = el.tag
+        if tag == _T:
+            parts.append(el.text or "")
+        elif tag == _TAB:
+            parts.append("\t")
+        elif tag == _NB_HYPHEN:
+            parts.append("-")
+        elif tag == _CR or el.get(_TYPE) in (None, "textWrapping"):
+            parts.append("\n")  # page/column breaks add no text
+    return "".join(parts)
+
+
+def _grid_value(el, path):
+    found = el.find(path)
+    return int(found.get(_VAL) or 1) if found is not None else 0
+
+
+def _row_cells(tr, above):
+    """Cell texts of a <w:tr>; `above` maps grid column → text of the previous row's cell."""
+    cells = []
+    col = _grid_value(tr, _GRID_BEFORE)
+    for tc in tr.iterchildren(_TC):
+        span = max(1, _grid_value(tc, _GRID_SPAN))
+        merge = tc.find(_V_MERGE)
+        if merge is not None and merge.get(_VAL, "continue") == "continue":
+            text = above.get(col, "")
+        else:
+            text = "\n".join(paragraph_text(p) for p in tc.iterchildren(_P))
+        for _ in range(span):
+            above[col] = text
+            cells.append(text)
+            col += 1
+    return cells
+
+
+def _free(elem):
+    """Drop a finished element and the already-consumed siblings before it."""
+    parent = elem.getparent()
+    elem.clear()
+    while elem.getprevious() is not None:
+        del parent[0]
+
+
+def iter_body(docx_path):
+    """Yield Paragraph and TableRow items for the document body, in document order."""
+    from lxml import etree
+
+    table, above = 0, {}
+    with zipfile.ZipFile(docx_path) as zf, zf.open(DOCUMENT_PART) as stream:
+        for _, elem in etree.iterparse(stream, events=("end",), tag=(_P, _TR, _TBL)):
+            parent = elem.getparent()
+            if elem.tag == _TR:
+                # only rows of top-level tables; nested ones belong to their cell
+                if parent.tag == _TBL and parent.getparent().tag == _BODY:
+                    yield TableRow(table, _row_cells(elem, above))
+                    _free(elem)
+            elif parent.tag == _BODY:
+                if elem.tag == _P:
+                    yield Paragraph(paragraph_text(elem))
+                else:
+                    table += 1
+                    above = {}
+                _free(elem)
+
+
+def iter_tables(docx_path):
+    """Yield (table index, [row cells, ...]) per top-level table; holds one table at a time."""
+    rows = (item for item in iter_body(docx_path) if isinstance(item, TableRow))
+    for index, group in groupby(rows, key=lambda row: row.table):
+        yield index, [row.cells for row in group]
@@ -0,0 +1,111 @@
+# docx_inspect.py
+# One-pass DOCX pre-flight checks without the python-docx object model.
+#
+# Document(path) parses all of word/document.xml into an lxml tree and wraps
+# every paragraph, run and cell in Python proxies, which on a 100 MB file takes
+# seconds, just to answer questions like "is any table five columns wide?" or
+# "does it embed images?" (and it reads every media blob in the package on the
+# way). inspect_docx() streams only word/document.xml out of the zip with lxml's
+# iterparse, asks it for nothing but paragraph and table end events (the tag
+# filter runs in C), drops each top-level block once it has been measured, and
+# reads the image relationships from the small .rels part.
+import zipfile
+from collections import namedtuple
+
+try:
+    from Converter.scripts import script_histogram
+except ImportError:  # run as a script from inside Converter/
+    from scripts import script_histogram
+
+DOCUMENT_PART = "word/document.xml"
+DOCUMENT_RELS = "word/_rels/document.xml.rels"
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+RELATIONSHIP = "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+IMAGE_RELTYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/image"
+
+# Text fed to the script classifier; enough to see every script a document uses
+# without classifying all of a huge one
+SCRIPT_SAMPLE_CHARS = 200_000
+
+_BODY, _TBL, _TR, _TC, _P, _T = W + "body", W + "tbl", W + "tr", W + "tc", W + "p", W + "t"
+_GRID_COL = f"{W}tblGrid/{W}gridCol"
+_GRID_SPAN = f"{W}tcPr/{W}gridSpan"
+_VAL = W + "val"
+
+
+class DocxInfo(namedtuple("DocxInfo", "tables has_images paragraphs scripts")):
+    """
+    tables     : column count of every top-level table, in document order
+                 (the wider of its grid and its first row, merged cells expanded)
+    has_images : the document body references at least one image part
+    paragraphs : paragraphs outside tables (what python-docx's doc.paragraphs holds)
+    scripts    : frozenset of scripts.SCRIPTS labels found in the text
+    """
+
+    @property
+    def max_columns(self):
+        return max(self.tables, default=0)
+
+
+def _has_image_rels(zf):
+    from lxml import etree
+
+    try:
+        stream = zf.open(DOCUMENT_RELS)
+    except KeyError:
+        return False
+    with stream:
+        for _, rel in etree.iterparse(stream, tag=RELATIONSHIP):
+            if rel.get("Type") == IMAGE_RELTYPE:
+                return True
+    return False
+
+
+def _table_columns(tbl):
+    """Columns of a <w:tbl>: the wider of its grid and its first row (gridSpan expanded)."""
+    grid = len(tbl.findall(_GRID_COL))
+    row = tbl.find(_TR)
+    first_row = 0
+    if row is not None:
+        for tc in row.iterchildren(_TC):
+            span = tc.find(_GRID_SPAN)
+            first_row += int(span.get(_VAL) or 1) if span is not None else 1
+    return max(grid, first_row)
+
+
+def _scan_body(stream, sample_chars):
+    from lxml import etree
+
+    tables, paragraphs, sample, sampled = [], 0, [], 0
+    for _, elem in etree.iterparse(stream, events=("end",), tag=(_P, _TBL)):
+        body = elem.getparent()
+        if body.tag != _BODY:
+            # paragraphs and tables inside cells are measured with their table
+            continue
+        if elem.tag == _P:
+            paragraphs += 1
+        else:
+            tables.append(_table_columns(elem))
+        if sampled < sample_chars:
+            text = "".join(elem.itertext(_T))
+            sample.append(text)
+            sampled += len(text)
+        # the block is done: free it and everything before it
+        elem.clear()
+        while elem.getprevious() is not None:
+            del body[0]
+
+    return tables, paragraphs, "".join(sample)
+
+
+def inspect_docx(docx_path, sample_chars=SCRIPT_SAMPLE_CHARS):
+    """DocxInfo for docx_path, read in one streaming pass over the body."""
+    with zipfile.ZipFile(docx_path) as zf:
+        has_images = _has_image_rels(zf)
+        with zf.open(DOCUMENT_PART) as stream:
+            tables, paragraphs, sample = _scan_body(stream, sample_chars)
+
+    histogram = script_histogram(sample) if sample else {}
+    scripts = frozenset(label for label, count in histogram.items() if count)
+    return DocxInfo(tuple(tables), has_images, paragraphs, scripts)
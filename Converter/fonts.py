@@ -0,0 +1,200 @@
+# fonts.py
+# Process-wide font lookup + cache shared by every image renderer.
+#
+# Rendering used to call ImageFont.truetype() for every line, which probes a chain
+# of paths with os.path.exists() and re-parses the TTF file each time. Here the font
+# directories are indexed once per process and loaded fonts are kept in a bounded
+# LRU cache keyed by (script, size) / (path, size).
+import os
+import threading
+from functools import lru_cache
+
+from PIL import ImageFont
+
+# ---------- Script to Font mapping (for image conversions) ----------
+FALLBACK_FONTS = {
+    "LATIN": "arial.ttf",
+    "DEVANAGARI": "NotoSansDevanagari-Medium.ttf",
+    "CJK": "arialuni.ttf",
+    "ARABIC": "arial.ttf",
+    "GREEK": "arial.ttf",
+    "OTHER": "arialuni.ttf",
+    "DEFAULT": "arial.ttf"
+}
+
+# Tried (in order) when the font for a script is not installed
+UNICODE_FALLBACK_FONTS = ["arialuni.ttf", "NotoSans-Regular.ttf"]
+
+# Searched in order; the first directory containing a file name wins.
+FONT_DIRS = [
+    "/usr/share/fonts/truetype/liberation",      # Liberation fonts often present
+    "/usr/share/fonts/truetype/msttcorefonts",   # If ttf-mscorefonts-installer is run
+    "/usr/share/fonts/truetype/noto",            # Noto fonts
+    "/Library/Fonts",
+    "C:/Windows/Fonts",
+    "/content",                                  # If user uploaded (Colab)
+]
+
+# Number of (font, size) objects kept alive; each holds a parsed FreeType face.
+FONT_CACHE_SIZE = 64
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def _build_index():
+    index = {}
+    for d in FONT_DIRS:
+        try:
+            names = os.listdir(d)
+        except OSError:
+            continue
+        for name in names:
+            index.setdefault(name, os.path.join(d, name))
+    return index
+
+
+def font_index():
+    """{file name: absolute path} for every font in FONT_DIRS, built once per process."""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = _build_index()
+    return _index
+
+
+@lru_cache(maxsize=256)
+def find_font_path(font_name):
+    """Resolve a font file name (or path) to an existing file, or None."""
+    if os.path.isabs(font_name) or os.sep in font_name or "/" in font_name:
+        return font_name if os.path.exists(font_name) else None
+    path = font_index().get(font_name)
+    if path:
+        return path
+    # As a last resort, try just the name (relative to the working directory)
+    return font_name if os.path.exists(font_name) else None
+
+
+def font_path_for_script(script):
+    """Font file for a script label (LATIN, DEVANAGARI, ...), with Unicode fallbacks; None if none installed."""
+    font_name = FALLBACK_FONTS.get(script, FALLBACK_FONTS["DEFAULT"])
+    for name in [font_name] + UNICODE_FALLBACK_FONTS:
+        path = find_font_path(name)
+        if path:
+            return path
+    return None
+
+
+@lru_cache(maxsize=FONT_CACHE_SIZE)
+def load_font(path, size):
+    """ImageFont.truetype(path, size), parsed once per process for each (path, size)."""
+    return ImageFont.truetype(path, size)
+
+
+@lru_cache(maxsize=FONT_CACHE_SIZE)
+def get_image_font(script, size=12):
+    """PIL font for (script, size); falls back to Pillow's default font if nothing is installed."""
+    path = font_path_for_script(script)
+    if path:
+        try:
+            return load_font(path, size)
+        except Exception as e:
+            print(f"⚠️ Could not load font {path}: {e}")
+    print(f"⚠️ Font for {script} not found or could not be loaded. Using default Pillow font.")
+    try:
+        return ImageFont.load_default()
+    except Exception as e:
+        raise RuntimeError(f"Could not load any font: {e}")
+
+
+def clear_font_cache():
+    """Forget the directory index and every cached font (e.g. after installing new fonts)."""
+    global _index
+    with _index_lock:
+        _index = None
+    find_font_path.cache_clear()
+    load_font.cache_clear()
+    get_image_font.cache_clear()
+
+
+def warm_fonts(sizes=(12, 24), scripts=("LATIN", "DEVANAGARI", "CJK", "OTHER")):
+    """
+    Preload common fonts, e.g. once per batch worker process. Scripts without an
+    installed font are skipped quietly; the first real use still warns about them.
+    """
+    font_index()
+    for script in scripts:
+        if font_path_for_script(script) is None:
+            continue
+        for size in sizes:
+            get_image_font(script, size)
+
+
+# ---------- ReportLab (PDF) fonts ----------
+# Registering a TTFont parses the whole file, so it must happen once per process,
+# not once per line. Scripts whose font file is missing fall back to the base font,
+# and if that is missing too, to ReportLab's built-in Helvetica.
+
+# (script, registered name, font file, characters that select this font)
+PDF_SCRIPT_FONTS = [
+    ("DEVANAGARI", "NotoSansDevanagari", "NotoSansDevanagari-Medium.ttf", "\u0900-\u097F"),
+]
+PDF_BASE_FONT = ("NotoSans", "NotoSans-Regular.ttf")
+PDF_BUILTIN_FONT = "Helvetica"
+
+_pdf_fonts = None          # {script: registered font name}, "DEFAULT" included
+_pdf_font_selectors = []   # [(compiled char class, font name)] for non-default scripts
+_pdf_fonts_lock = threading.Lock()
+
+
+def _register_ttf(name, font_file):
+    """Register font_file under `name` with ReportLab; False if it is not installed/usable."""
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+
+    if name in pdfmetrics.getRegisteredFontNames():
+        return True
+    path = find_font_path(font_file)
+    if not path:
+        return False
+    try:
+        pdfmetrics.registerFont(TTFont(name, path))
+        return True
+    except Exception as e:
+        print(f"⚠️ Could not register font {path}: {e}")
+        return False
+
+
+def register_pdf_fonts():
+    """Register the PDF fonts once per process; returns {script: font name} (with "DEFAULT")."""
+    global _pdf_fonts, _pdf_font_selectors
+    if _pdf_fonts is not None:
+        return _pdf_fonts
+    with _pdf_fonts_lock:
+        if _pdf_fonts is None:
+            import re
+
+            base = PDF_BASE_FONT[0] if _register_ttf(*PDF_BASE_FONT) else PDF_BUILTIN_FONT
+            if base == PDF_BUILTIN_FONT:
+                print(f"⚠️ {PDF_BASE_FONT[1]} not found, using {PDF_BUILTIN_FONT} for PDF text")
+            fonts, selectors = {"DEFAULT": base, "LATIN": base}, []
+            for script, name, font_file, chars in PDF_SCRIPT_FONTS:
+                if _register_ttf(name, font_file):
+                    fonts[script] = name
+                    selectors.append((re.compile(f"[{chars}]"), name))
+                else:
+                    print(f"⚠️ {font_file} not found, {script} text will use {base}")
+                    fonts[script] = base
+            _pdf_font_selectors = selectors
+            _pdf_fonts = fonts
+    return _pdf_fonts
+
+
+def pdf_font_for_text(text):
+    """Registered ReportLab font name to draw `text` with (cheap; safe to call per line)."""
+    fonts = register_pdf_fonts()
+    for pattern, name in _pdf_font_selectors:
+        if pattern.search(text):
+            return name
+    return fonts["DEFAULT"]
@@ -5,30 +5,15 @@ from PIL import Image, ImageEnhance, ImageFilter
 import pytesseract
 from langdetect import detect
 import langid
-import easyocr # Import easyocr
-
-# Initialize EasyOCR reader (load models once)
-# Specify languages you expect to encounter, e.g., ['en', 'hi', 'es', 'fr', 'de']
-# Add more languages as needed. 'en' is default.
-# Download language models if they are not present.
-_EASYOCR_READER = None
-_EASYOCR_LANGS = []
+# EasyOCR readers (one per language set, loaded once) come from a shared pool
+try:
+    from Converter.ocr import get_reader
+except ImportError:  # run as a script from inside Converter/
+    from ocr import get_reader
 
 def _get_easyocr(langs=['en']):
-    global _EASYOCR_READER, _EASYOCR_LANGS
-    # Re-initialize if reader is not set or if requested languages are different from currently loaded languages
-    if _EASYOCR_READER is None or set(langs) != set(_EASYOCR_LANGS):
-        try:
-            import easyocr
-            # The Reader constructor takes a list of languages directly
-            _EASYOCR_READER = easyocr.Reader(langs, gpu=False) # Set gpu=True if you have a GPU
-            _EASYOCR_LANGS = langs # Update the stored languages
-            print(f"✅ Initialized EasyOCR with languages: {langs}")
-        except Exception as e:
-            print(f"Error initializing EasyOCR with languages {langs}: {e}")
-            _EASYOCR_READER = None
-            _EASYOCR_LANGS = [] # Clear languages on failure
-    return _EASYOCR_READER
+    """EasyOCR reader for langs from the shared LRU pool (see Converter/ocr.py); None if unavailable."""
+    return get_reader(langs)
 
 # Preprocessing function (optional but can help)
 def preprocess_image(image_path, strong=False):
@@ -100,23 +85,16 @@ def image_to_txt_ocr(in_path, txt_path, lang="auto"):
         # Handle 'auto' language detection
         target_langs = []
         if lang.lower() == 'auto':
-            # For auto-detection, load default EasyOCR languages and then try to detect
-            target_langs_for_easyocr = _parse_langs_for_easyocr(lang)
-            reader = _get_easyocr(target_langs_for_easyocr) # Load initial languages
-            if reader:
-                 # Now try to detect language from the image
-                 detected = detect_language_from_image(img)
-                 print(f"🌐 Detected language: {detected}")
-                 # Re-initialize EasyOCR with the detected language + English for robustness
-                 target_langs = list(set([detected, 'en'])) # Use set to avoid duplicates
-                 # Ensure the detected language is in the supported list for EasyOCR if not English
-                 if detected != 'en' and detected not in ['hi', 'es', 'fr', 'de', 'ru', 'ja', 'ko', 'ch_sim', 'ch_tra']: # Add more supported languages if needed
-                      print(f"⚠️ Detected language {detected} might not be fully supported by EasyOCR. Using English.")
-                      target_langs = ['en'] # Fallback to English
-                 reader = _get_easyocr(target_langs) # Re-initialize with detected/fallback languages
-            else:
-                 # If EasyOCR couldn't even initialize with defaults
-                 target_langs = ['en'] # Fallback to Tesseract with English
+            # Detect the language first (quick Tesseract pass), then load a single
+            # reader for detected + English instead of loading a default reader too
+            detected = detect_language_from_image(img)
+            print(f"🌐 Detected language: {detected}")
+            target_langs = list(set([detected, 'en'])) # Use set to avoid duplicates
+            # Ensure the detected language is in the supported list for EasyOCR if not English
+            if detected != 'en' and detected not in ['hi', 'es', 'fr', 'de', 'ru', 'ja', 'ko', 'ch_sim', 'ch_tra']: # Add more supported languages if needed
+                print(f"⚠️ Detected language {detected} might not be fully supported by EasyOCR. Using English.")
+                target_langs = ['en'] # Fallback to English
+            reader = _get_easyocr(target_langs)
         else:
             target_langs = _parse_langs_for_easyocr(lang)
             reader = _get_easyocr(target_langs) # Initialize with specified languages
@@ -24,6 +24,10 @@ import ijson
 import pdfkit
 import pypandoc
 from weasyprint import HTML
+try:
+    from Converter.fonts import find_font_path, register_pdf_fonts
+except ImportError:  # run as a script from inside Converter/
+    from fonts import find_font_path, register_pdf_fonts
 
 def _ensure_dir(file_path):
     os.makedirs(os.path.dirname(file_path), exist_ok=True)
@@ -32,13 +36,17 @@ def register_unicode_font(font_files=None):
     """
     Registers first available TrueType font for Unicode support.
     Returns the font name to be used in PDF.
+    Registration happens once per process; later calls return the cached name.
     """
     if font_files is None:
-        font_files = ["NotoSans-Regular.ttf", "NotoSansDevanagari.ttf"]
+        return register_pdf_fonts()["DEFAULT"]
+    if "UnicodeFont" in pdfmetrics.getRegisteredFontNames():
+        return "UnicodeFont"
     for f in font_files:
-        if os.path.exists(f):
+        path = find_font_path(f)
+        if path:
             try:
-                pdfmetrics.registerFont(TTFont("UnicodeFont", f))
+                pdfmetrics.registerFont(TTFont("UnicodeFont", path))
                 return "UnicodeFont"
             except Exception as e:
                 print(f"⚠️ Could not register font {f}: {e}")
@@ -0,0 +1,67 @@
+# json_stream.py
+# Incremental JSON writers for converters that produce one record per page/row.
+#
+# json.dump(records) needs every record in memory first. JSONArrayWriter writes
+# each record as soon as it is produced and yields byte-for-byte the same file
+# as json.dump(records, f, ensure_ascii=False, indent=indent); NDJSONWriter
+# writes one compact record per line for stream processors.
+import json
+
+
+class JSONArrayWriter:
+    """Write a JSON array to a text file one element at a time."""
+
+    def __init__(self, f, indent=2):
+        self._file = f
+        self.indent = indent
+        self.count = 0
+
+    def write(self, record):
+        text = json.dumps(record, ensure_ascii=False, indent=self.indent)
+        if self.indent is not None:
+            pad = " " * self.indent
+            text = "\n".join(pad + line for line in text.split("\n"))
+            self._file.write(("[\n" if self.count == 0 else ",\n") + text)
+        else:
+            self._file.write(("[" if self.count == 0 else ", ") + text)
+        self.count += 1
+
+    def close(self):
+        if self.count == 0:
+            self._file.write("[]")
+        else:
+            self._file.write("\n]" if self.indent is not None else "]")
+
+
+class NDJSONWriter:
+    """Write one compact JSON record per line."""
+
+    def __init__(self, f):
+        self._file = f
+        self.count = 0
+
+    def write(self, record):
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.count += 1
+
+    def close(self):
+        pass
+
+
+def is_ndjson_path(path):
+    return path.lower().endswith((".ndjson", ".jsonl"))
+
+
+def write_json_records(records, path, ndjson=None, indent=2):
+    """
+    Stream an iterable of records to `path` as a JSON array, or as NDJSON when
+    ndjson=True (None → by extension: .ndjson/.jsonl). Returns the record count.
+    """
+    if ndjson is None:
+        ndjson = is_ndjson_path(path)
+    with open(path, "w", encoding="utf-8") as out:
+        writer = NDJSONWriter(out) if ndjson else JSONArrayWriter(out, indent=indent)
+        for record in records:
+            writer.write(record)
+        writer.close()
+    return writer.count
@@ -0,0 +1,59 @@
+# lazy.py
+# Deferred imports for the heavy third-party libraries used by the converters.
+import importlib
+
+_UNSET = object()
+
+
+class LazyImport:
+    """
+    Stand-in for a module (or a name inside a module) that is imported on first use.
+
+    lazy_import("pandas")            -> behaves like `import pandas`
+    lazy_import("docx", "Document")  -> behaves like `from docx import Document`
+
+    Attribute access, attribute assignment (so unittest.mock.patch keeps working)
+    and calls are forwarded to the real object once it has been imported.
+    """
+
+    __slots__ = ("_lazy_module", "_lazy_attr", "_lazy_target")
+
+    def __init__(self, module, attr=None):
+        object.__setattr__(self, "_lazy_module", module)
+        object.__setattr__(self, "_lazy_attr", attr)
+        object.__setattr__(self, "_lazy_target", _UNSET)
+
+    def _resolve(self):
+        target = object.__getattribute__(self, "_lazy_target")
+        if target is _UNSET:
+            module = object.__getattribute__(self, "_lazy_module")
+            attr = object.__getattribute__(self, "_lazy_attr")
+            target = importlib.import_module(module)
+            if attr:
+                target = getattr(target, attr)
+            object.__setattr__(self, "_lazy_target", target)
+        return target
+
+    def __getattr__(self, name):
+        return getattr(self._resolve(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._resolve(), name, value)
+
+    def __delattr__(self, name):
+        delattr(self._resolve(), name)
+
+    def __call__(self, *args, **kwargs):
+        return self._resolve()(*args, **kwargs)
+
+    def __repr__(self):
+        module = object.__getattribute__(self, "_lazy_module")
+        attr = object.__getattribute__(self, "_lazy_attr")
+        name = f"{module}.{attr}" if attr else module
+        state = "loaded" if object.__getattribute__(self, "_lazy_target") is not _UNSET else "not loaded"
+        return f"<lazy {name} ({state})>"
+
+
+def lazy_import(module, attr=None):
+    """Return a LazyImport for `module` (or `module.attr`); nothing is imported yet."""
+    return LazyImport(module, attr)
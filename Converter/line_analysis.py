@@ -0,0 +1,101 @@
+# line_analysis.py
+# Whole-document script / language pass used to pick fonts for TXT → image / DOCX.
+#
+# Instead of running langdetect on every line, lines are classified by Unicode
+# script in one batch (see scripts.py), consecutive lines of the same script are
+# grouped into runs, and language ID runs once per run — and only for scripts
+# that do not already tell us the language (Latin, Han, Arabic, ...).
+from collections import namedtuple
+from functools import lru_cache
+
+try:
+    from Converter.scripts import classify_scripts
+except ImportError:  # run as a script from inside Converter/
+    from scripts import classify_scripts
+
+# Lines [start, stop) share `script` and `lang` (a langdetect-style code, e.g. "hi", "zh-cn")
+LineRun = namedtuple("LineRun", "start stop script lang")
+
+# Language assumed for a script when language ID is skipped or fails
+SCRIPT_LANGS = {
+    "LATIN": "en",
+    "DEVANAGARI": "hi",
+    "CJK": "zh-cn",
+    "KANA": "ja",
+    "HANGUL": "ko",
+    "ARABIC": "ar",
+    "GREEK": "el",
+    "OTHER": "en",
+}
+
+# Scripts shared by several languages: only these are worth a language ID call
+AMBIGUOUS_SCRIPTS = ("LATIN", "CJK", "ARABIC", "OTHER")
+
+# Characters of a run handed to language ID (langdetect is happy with far less)
+LANG_SAMPLE_CHARS = 2000
+
+
+@lru_cache(maxsize=4096)
+def detect_language(sample):
+    """langdetect code for `sample`, memoized (repeated headers/lines cost nothing); None on failure."""
+    try:
+        from langdetect import detect
+        return detect(sample)
+    except Exception:
+        return None
+
+
+def _runs(scripts):
+    """[(start, stop, script)] for consecutive equal labels."""
+    runs = []
+    for i, script in enumerate(scripts):
+        if runs and runs[-1][2] == script:
+            runs[-1][1] = i + 1
+        else:
+            runs.append([i, i + 1, script])
+    return runs
+
+
+def analyze_lines(lines, detect_scripts=AMBIGUOUS_SCRIPTS, sample_chars=LANG_SAMPLE_CHARS):
+    """
+    Split `lines` into LineRuns of one script and language.
+
+    Blank lines inherit the script of the line before them so they do not
+    break a run. Language ID (langdetect) is only called for
+    runs whose script is in `detect_scripts`; pass () to never call it.
+    """
+    lines = list(lines)
+    if not lines:
+        return []
+    scripts, _ = classify_scripts(lines, merge=None)
+    prev = None
+    for i, line in enumerate(lines):
+        if not line.strip() and prev is not None:
+            scripts[i] = prev
+        prev = scripts[i]
+
+    result = []
+    for start, stop, script in _runs(scripts):
+        lang = None
+        if script in detect_scripts:
+            sample, size = [], 0
+            for line in lines[start:stop]:
+                line = line.strip()
+                if line:
+                    sample.append(line)
+                    size += len(line)
+                    if size >= sample_chars:
+                        break
+            if sample:
+                lang = detect_language("\n".join(sample)[:sample_chars])
+        result.append(LineRun(start, stop, script, lang or SCRIPT_LANGS.get(script, "en")))
+    return result
+
+
+def line_values(lines, value_for_run, **kwargs):
+    """One value per line: value_for_run(run) computed once per run (e.g. a font)."""
+    values = []
+    for run in analyze_lines(lines, **kwargs):
+        value = value_for_run(run)
+        values.extend([value] * (run.stop - run.start))
+    return values
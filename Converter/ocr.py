@@ -0,0 +1,191 @@
+# ocr.py
+# OCR engine helpers shared by the image and PDF converters.
+#
+# Scanned PDFs are OCR'd page by page on a thread pool: every task renders one
+# page and runs Tesseract on it (both are external processes, so threads scale),
+# and the page texts are joined back in page order.
+#
+# EasyOCR readers take seconds (and hundreds of MB) to build, so they are kept in
+# a small LRU pool keyed by the *set* of languages: ['en', 'hi'] and ['hi', 'en']
+# share one reader, and a batch that alternates between two language sets does
+# not rebuild a model on every file.
+import os
+import gc
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+try:
+    from Converter.batch import current_rss_mb
+    from Converter.raster import pdf_page_count, render_page
+except ImportError:  # run as a script from inside Converter/
+    from batch import current_rss_mb
+    from raster import pdf_page_count, render_page
+
+# Readers kept alive at once (each holds its detection + recognition models)
+EASYOCR_POOL_SIZE = 2
+# Evict least recently used readers while this process is above this RSS (None → no cap)
+EASYOCR_MAX_RSS_MB = None
+
+
+def _new_easyocr_reader(langs, gpu=False):
+    import easyocr
+    return easyocr.Reader(langs, gpu=gpu)  # Set gpu=True if you have a GPU
+
+
+class ReaderPool:
+    """
+    LRU pool of EasyOCR readers keyed by frozenset(langs).
+
+    max_readers : readers kept alive at once
+    max_rss_mb  : after loading a reader, evict older ones while RSS is above this
+    factory     : factory(langs, gpu) → reader (default: easyocr.Reader)
+    """
+
+    def __init__(self, max_readers=EASYOCR_POOL_SIZE, max_rss_mb=EASYOCR_MAX_RSS_MB,
+                 factory=_new_easyocr_reader, gpu=False):
+        self.max_readers = max(1, max_readers)
+        self.max_rss_mb = max_rss_mb
+        self.factory = factory
+        self.gpu = gpu
+        self._readers = OrderedDict()
+        self._failed = set()        # language sets that could not be loaded
+        self._lock = threading.RLock()
+
+    def __contains__(self, langs):
+        return frozenset(langs) in self._readers
+
+    def __len__(self):
+        return len(self._readers)
+
+    def _evict(self, keep):
+        while len(self._readers) > self.max_readers:
+            self._readers.popitem(last=False)
+        if self.max_rss_mb:
+            while len(self._readers) > 1 and current_rss_mb() > self.max_rss_mb:
+                key = next(k for k in self._readers if k != keep)
+                del self._readers[key]
+                gc.collect()
+
+    def get(self, langs):
+        """Reader for `langs` (loaded on first use), or None if EasyOCR cannot load them."""
+        key = frozenset(langs)
+        with self._lock:
+            reader = self._readers.get(key)
+            if reader is not None:
+                self._readers.move_to_end(key)
+                return reader
+            if key in self._failed:
+                return None
+            try:
+                reader = self.factory(sorted(key), self.gpu)
+                print(f"✅ Initialized EasyOCR with languages: {sorted(key)}")
+            except Exception as e:
+                print(f"Error initializing EasyOCR with languages {sorted(key)}: {e}")
+                self._failed.add(key)
+                return None
+            self._readers[key] = reader
+            self._evict(keep=key)
+            return reader
+
+    def warm(self, *lang_sets):
+        """Preload readers, e.g. in a batch worker before its first job."""
+        for langs in lang_sets:
+            self.get(langs)
+
+    def clear(self):
+        with self._lock:
+            self._readers.clear()
+            self._failed.clear()
+        gc.collect()
+
+
+# Process-wide pool used by the converters
+READERS = ReaderPool()
+
+
+def get_reader(langs):
+    """EasyOCR reader for this language set from the process-wide pool (None if unavailable)."""
+    return READERS.get(langs)
+
+
+def warm_readers(lang_sets=(("en",),)):
+    """Batch warm-up hook: load the given language sets into the process-wide pool."""
+    READERS.warm(*lang_sets)
+
+
+def configure_readers(max_readers=None, max_rss_mb=None):
+    """Resize the process-wide pool (readers over the new limits are evicted on next load)."""
+    if max_readers is not None:
+        READERS.max_readers = max(1, max_readers)
+    if max_rss_mb is not None:
+        READERS.max_rss_mb = max_rss_mb
+
+
+# ---------- Page-parallel Tesseract ----------
+
+# DPI pdf2image uses when none is given; rendering with it keeps output identical
+# to convert_from_path(pdf_path)
+OCR_DPI = 200
+
+
+@contextmanager
+def omp_thread_limit(threads):
+    """
+    Set OMP_THREAD_LIMIT for the Tesseract processes started inside the block.
+    Each page already runs in its own worker, so letting every Tesseract spawn
+    one OpenMP thread per core would oversubscribe the machine.
+    """
+    if threads is None:
+        yield
+        return
+    previous = os.environ.get("OMP_THREAD_LIMIT")
+    os.environ["OMP_THREAD_LIMIT"] = str(threads)
+    try:
+        yield
+    finally:
+        if previous is None:
+            os.environ.pop("OMP_THREAD_LIMIT", None)
+        else:
+            os.environ["OMP_THREAD_LIMIT"] = previous
+
+
+def _render_page(pdf_path, pageno, dpi):
+    return render_page(pdf_path, pageno, dpi=dpi)
+
+
+def _tesseract(img, lang, config):
+    import pytesseract
+    return pytesseract.image_to_string(img, lang=lang, config=config)
+
+
+def _ocr_page(pdf_path, pageno, lang, config, dpi):
+    img = _render_page(pdf_path, pageno, dpi)
+    try:
+        return _tesseract(img, lang, config)
+    finally:
+        img.close()
+
+
+def ocr_pdf_pages(pdf_path, lang="eng", pages=None, workers=None, config="", dpi=OCR_DPI,
+                  omp_threads=1):
+    """
+    OCR text of each page (1-based `pages`, default all) in page order.
+
+    workers     : pages OCR'd at once (default: os.cpu_count()); 1 → serial
+    omp_threads : OMP_THREAD_LIMIT for Tesseract while the pool runs
+                  (None → leave the environment alone)
+
+    Only `workers` pages are rendered at a time, and the result is the same
+    as OCRing convert_from_path(pdf_path, dpi) page by page.
+    """
+    if pages is None:
+        pages = range(1, pdf_page_count(pdf_path) + 1)
+    pages = list(pages)
+    workers = max(1, min(workers or os.cpu_count() or 1, len(pages) or 1))
+    if workers == 1:
+        return [_ocr_page(pdf_path, p, lang, config, dpi) for p in pages]
+    with omp_thread_limit(omp_threads), ThreadPoolExecutor(max_workers=workers) as pool:
+        # map() yields in submission order → ordered reassembly
+        return list(pool.map(lambda p: _ocr_page(pdf_path, p, lang, config, dpi), pages))
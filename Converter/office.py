@@ -0,0 +1,573 @@
+# office.py
+# LibreOffice conversions without paying office start-up for every file.
+#
+# `soffice --headless --convert-to` boots a whole office (2-5 s) per call.
+# OfficeDaemon starts one headless soffice that listens on a local socket and
+# drives it over UNO: documents are loaded and stored by the running process, so
+# a batch pays start-up once. The daemon is restarted if it crashes, and killed
+# and restarted if a conversion hangs past its timeout.
+#
+# Without the UNO bridge (python3-uno) SubprocessOffice offers the same
+# convert() call with one soffice run per file. Both use a private profile
+# (-env:UserInstallation) and scratch directory, so they never collide with a
+# desktop LibreOffice or with each other.
+#
+# LibreOffice allows one running instance per profile, so parallelism means
+# several offices with several profiles: OfficePool keeps N of them and hands
+# each conversion (or chunk of them) to an idle one. Batch worker processes each
+# get their own office.
+#
+# Where no daemon can run, a directory batch converts its DOC → DOCX and
+# DOCX → PDF steps up front with OfficePrefetch: many files per soffice run,
+# results filed by content hash. office_convert() in any worker then finds its
+# file there instead of starting soffice for it.
+import hashlib
+import json
+import os
+import shutil
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Seconds one conversion may take before the office is killed
+OFFICE_TIMEOUT = 300
+# Seconds to wait for a freshly started daemon to accept connections
+OFFICE_STARTUP_TIMEOUT = 60
+# Offices behind get_office() (>1 → an OfficePool shared by this process's threads)
+OFFICE_WORKERS = 1
+# Files per soffice run in batch mode
+OFFICE_CHUNK_SIZE = 50
+# Seconds a whole multi-file soffice run may take (OFFICE_TIMEOUT per file, up to
+# this cap); past it the chunk is retried file by file, so one hung file costs
+# at most this much extra
+OFFICE_CHUNK_TIMEOUT = 900
+# Directory of an active OfficePrefetch (inherited by batch worker processes)
+PREFETCH_ENV = "FILE_TOOLKIT_OFFICE_PREFETCH"
+
+# Output format → LibreOffice export filter (UNO storeToURL)
+FILTERS = {
+    "pdf": "writer_pdf_Export",
+    "docx": "MS Word 2007 XML",
+    "odt": "writer8",
+    "html": "HTML (StarWriter)",
+    "txt": "Text",
+}
+
+SOFFICE_MISSING = ("LibreOffice (soffice) not found. Install it to convert .doc/.docx files.\n"
+                   "Linux/Colab:  sudo apt-get update && sudo apt-get install -y libreoffice")
+
+
+class OfficeError(RuntimeError):
+    """A LibreOffice conversion failed (missing soffice, timeout, crash, no output)."""
+
+
+def find_soffice():
+    return shutil.which("soffice") or shutil.which("libreoffice")
+
+
+def uno_available():
+    try:
+        import uno  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class _Office:
+    """Shared parts: soffice path, private profile and scratch directory, timeout."""
+
+    def __init__(self, soffice=None, profile_dir=None, timeout=OFFICE_TIMEOUT):
+        self.soffice = soffice or find_soffice()
+        if not self.soffice:
+            raise OfficeError(SOFFICE_MISSING)
+        self._own_profile = profile_dir is None
+        self.profile_dir = profile_dir or tempfile.mkdtemp(prefix="lo_profile_")
+        self.scratch_dir = tempfile.mkdtemp(prefix="lo_scratch_")
+        self.timeout = timeout
+
+    def _profile_arg(self):
+        return "-env:UserInstallation=" + Path(os.path.abspath(self.profile_dir)).as_uri()
+
+    def close(self):
+        shutil.rmtree(self.scratch_dir, ignore_errors=True)
+        if self._own_profile:
+            shutil.rmtree(self.profile_dir, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class SubprocessOffice(_Office):
+    """
+    soffice --convert-to runs (no UNO bridge needed). convert_many() passes a
+    whole chunk of files to one run, so start-up is paid once per chunk.
+    """
+
+    def convert(self, src, out_path, fmt):
+        """Convert src to `fmt` (e.g. "pdf", "docx") at out_path; returns out_path."""
+        [(_, out, error)] = self.convert_many([(src, out_path, fmt)])
+        if error:
+            raise OfficeError(error)
+        return out
+
+    def convert_many(self, jobs):
+        """
+        Convert (src, out_path, fmt) jobs that share one fmt and have distinct file
+        stems with a single soffice run. Returns [(job, out_path or None, error or None)];
+        a file soffice skipped gets its own error, and if the whole run fails the
+        files are retried one by one so a single bad file cannot sink the chunk.
+        """
+        fmt = jobs[0][2]
+        out_dir = tempfile.mkdtemp(prefix="out_", dir=self.scratch_dir)
+        try:
+            cmd = [self.soffice, self._profile_arg(), "--headless", "--norestore",
+                   "--convert-to", fmt, "--outdir", out_dir] + [os.path.abspath(src) for src, _, _ in jobs]
+            try:
+                timeout = self.timeout if len(jobs) == 1 else \
+                    min(self.timeout * len(jobs), max(self.timeout, OFFICE_CHUNK_TIMEOUT))
+                subprocess.run(cmd, check=True, timeout=timeout,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            except (subprocess.TimeoutExpired, subprocess.CalledProcessError) as e:
+                if len(jobs) > 1:
+                    return [result for job in jobs for result in self.convert_many([job])]
+                if isinstance(e, subprocess.TimeoutExpired):
+                    error = f"LibreOffice timed out after {self.timeout}s on {jobs[0][0]}"
+                else:
+                    error = f"LibreOffice failed on {jobs[0][0]}: {(e.stderr or b'').decode(errors='ignore').strip()}"
+                return [(jobs[0], None, error)]
+
+            results = []
+            for job in jobs:
+                src, out_path, _ = job
+                produced = os.path.join(out_dir, Path(src).stem + "." + fmt.split(":")[0])
+                if os.path.exists(produced):
+                    shutil.move(produced, out_path)
+                    results.append((job, out_path, None))
+                else:
+                    results.append((job, None, f"LibreOffice did not produce {fmt.upper()} for {src}"))
+            return results
+        finally:
+            shutil.rmtree(out_dir, ignore_errors=True)
+
+
+class OfficeDaemon(_Office):
+    """
+    Long-running headless soffice driven over UNO.
+
+    timeout         : seconds per conversion; on expiry the office is killed and
+                      restarted and OfficeError is raised for that file
+    startup_timeout : seconds to wait for the office to accept connections
+    """
+
+    def __init__(self, soffice=None, profile_dir=None, timeout=OFFICE_TIMEOUT,
+                 startup_timeout=OFFICE_STARTUP_TIMEOUT):
+        super().__init__(soffice, profile_dir, timeout)
+        self.startup_timeout = startup_timeout
+        self.restarts = 0
+        self._started = False
+        self._proc = None
+        self._desktop = None
+        self._lock = threading.Lock()
+
+    def alive(self):
+        return self._proc is not None and self._proc.poll() is None
+
+    def start(self):
+        if self.alive():
+            return
+        import uno
+
+        self._started = True
+        port = _free_port()
+        accept = f"socket,host=127.0.0.1,port={port};urp;StarOffice.ComponentContext"
+        self._proc = subprocess.Popen(
+            [self.soffice, self._profile_arg(), "--headless", "--invisible", "--nologo",
+             "--nodefault", "--norestore", "--nolockcheck", f"--accept={accept}"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+        local = uno.getComponentContext()
+        resolver = local.ServiceManager.createInstanceWithContext("com.sun.star.bridge.UnoUrlResolver", local)
+        deadline = time.monotonic() + self.startup_timeout
+        while True:
+            try:
+                ctx = resolver.resolve(f"uno:{accept}")
+                self._desktop = ctx.ServiceManager.createInstanceWithContext("com.sun.star.frame.Desktop", ctx)
+                return
+            except Exception:
+                if self._proc.poll() is not None:
+                    raise OfficeError(f"soffice exited during start-up (code {self._proc.returncode})")
+                if time.monotonic() > deadline:
+                    self.stop()
+                    raise OfficeError(f"soffice did not start within {self.startup_timeout}s")
+                time.sleep(0.25)
+
+    def stop(self):
+        proc, self._proc = self._proc, None
+        desktop, self._desktop = self._desktop, None
+        if proc is None:
+            return
+        try:
+            if desktop is not None and proc.poll() is None:
+                desktop.terminate()
+        except Exception:
+            pass
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+    def _kill(self):
+        proc, self._proc, self._desktop = self._proc, None, None
+        if proc is not None:
+            proc.kill()
+            proc.wait()
+
+    def restart(self):
+        self.stop()
+        self.restarts += 1
+        self.start()
+
+    def _store(self, src, out_path, fmt):
+        import uno
+        from com.sun.star.beans import PropertyValue
+
+        def prop(name, value):
+            p = PropertyValue()
+            p.Name, p.Value = name, value
+            return p
+
+        url = uno.systemPathToFileUrl(os.path.abspath(src))
+        doc = self._desktop.loadComponentFromURL(url, "_blank", 0, (prop("Hidden", True), prop("ReadOnly", True)))
+        if doc is None:
+            raise OfficeError(f"LibreOffice could not open {src}")
+        try:
+            doc.storeToURL(uno.systemPathToFileUrl(os.path.abspath(out_path)),
+                           (prop("FilterName", FILTERS[fmt]),))
+        finally:
+            doc.close(True)
+
+    def _store_with_timeout(self, src, out_path, fmt):
+        outcome = {}
+
+        def target():
+            try:
+                self._store(src, out_path, fmt)
+            except BaseException as e:
+                outcome["error"] = e
+
+        worker = threading.Thread(target=target, daemon=True)
+        worker.start()
+        worker.join(self.timeout)
+        if worker.is_alive():
+            # a hung office only lets go when it is killed
+            self._kill()
+            raise OfficeError(f"LibreOffice timed out after {self.timeout}s on {src}")
+        if "error" in outcome:
+            raise outcome["error"]
+
+    def convert(self, src, out_path, fmt):
+        """Convert src to `fmt` (a FILTERS key) at out_path; returns out_path."""
+        if fmt not in FILTERS:
+            raise OfficeError(f"Unsupported office output format: {fmt}")
+        with self._lock:
+            for attempt in (1, 2):
+                if not self.alive():
+                    if self._started:
+                        print("⚠️ LibreOffice daemon is down, restarting it")
+                        self.restart()
+                    else:
+                        self.start()
+                try:
+                    self._store_with_timeout(src, out_path, fmt)
+                    break
+                except OfficeError:
+                    raise
+                except Exception as e:
+                    # the bridge died with the office (crash) → restart once and retry
+                    if self.alive() or attempt == 2:
+                        raise OfficeError(f"LibreOffice failed on {src}: {e}")
+                    self._kill()
+        if not os.path.exists(out_path):
+            raise OfficeError(f"LibreOffice did not produce {fmt.upper()} for {src}")
+        return out_path
+
+    def close(self):
+        self.stop()
+        super().close()
+
+
+def new_office(**kwargs):
+    """An OfficeDaemon if the UNO bridge is importable, else a SubprocessOffice."""
+    return OfficeDaemon(**kwargs) if uno_available() else SubprocessOffice(**kwargs)
+
+
+def plan_chunks(jobs, size):
+    """
+    Split (src, out_path, fmt) jobs into chunks of at most `size` that share a
+    format and have distinct file stems (soffice names outputs after the stem),
+    keeping job order within each chunk.
+    """
+    chunks = []
+    open_chunks = {}    # fmt → chunk being filled
+    for job in jobs:
+        fmt = job[2]
+        chunk = open_chunks.get(fmt)
+        stem = Path(job[0]).stem
+        if chunk is None or len(chunk) >= size or any(Path(j[0]).stem == stem for j in chunk):
+            chunk = open_chunks[fmt] = []
+            chunks.append(chunk)
+        chunk.append(job)
+    return chunks
+
+
+class OfficePool:
+    """
+    Up to `size` offices, each with its own profile and scratch directory, started
+    on demand. convert() runs on whichever office is idle, so `size` threads can
+    convert at once.
+    """
+
+    def __init__(self, size=None, factory=new_office):
+        self.size = max(1, size or OFFICE_WORKERS)
+        self.factory = factory
+        self._offices = []
+        self._idle = queue.Queue()
+        self._lock = threading.Lock()
+
+    def _checkout(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if len(self._offices) < self.size:
+                office = self.factory()
+                self._offices.append(office)
+                return office
+        return self._idle.get()
+
+    def convert(self, src, out_path, fmt):
+        office = self._checkout()
+        try:
+            return office.convert(src, out_path, fmt)
+        finally:
+            self._idle.put(office)
+
+    def _run_chunk(self, chunk):
+        office = self._checkout()
+        try:
+            if hasattr(office, "convert_many"):
+                return office.convert_many(chunk)
+            results = []
+            for job in chunk:
+                try:
+                    results.append((job, office.convert(*job), None))
+                except Exception as e:
+                    results.append((job, None, str(e)))
+            return results
+        finally:
+            self._idle.put(office)
+
+    def map(self, jobs, chunk_size=None):
+        """
+        Yield (job, out_path, error) for (src, out_path, fmt) jobs, in job order.
+        Jobs are handed out in chunks (one soffice run per chunk for subprocess
+        offices), small enough that every office gets work.
+        """
+        jobs = list(jobs)
+        if not jobs:
+            return
+        if chunk_size is None:
+            chunk_size = min(OFFICE_CHUNK_SIZE, -(-len(jobs) // self.size))
+        chunks = plan_chunks(jobs, chunk_size)
+        with ThreadPoolExecutor(max_workers=min(self.size, len(chunks))) as pool:
+            for results in pool.map(self._run_chunk, chunks):
+                yield from results
+
+    def warm(self):
+        """Start every office of the pool now instead of on first use."""
+        offices = [self._checkout() for _ in range(self.size)]
+        try:
+            for office in offices:
+                if isinstance(office, OfficeDaemon):
+                    office.start()
+        finally:
+            for office in offices:
+                self._idle.put(office)
+
+    def close(self):
+        with self._lock:
+            offices, self._offices = self._offices, []
+        for office in offices:
+            office.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+# ---------- Process-wide office ----------
+
+_office = None
+_office_lock = threading.Lock()
+_cleanup_pid = None
+
+
+def _register_cleanup():
+    # Pool workers leave through os._exit(), which skips atexit handlers; the
+    # multiprocessing finalizers still run there (and at interpreter exit in the
+    # main process), so the office, its profile and scratch dir go with the process.
+    global _cleanup_pid
+    if _cleanup_pid != os.getpid():
+        from multiprocessing import util
+        util.Finalize(None, shutdown_office, exitpriority=10)
+        _cleanup_pid = os.getpid()
+
+
+def get_office():
+    """This process's office converter (an OfficePool when OFFICE_WORKERS > 1)."""
+    global _office
+    with _office_lock:
+        if _office is None:
+            _office = new_office() if OFFICE_WORKERS <= 1 else OfficePool(OFFICE_WORKERS)
+            _register_cleanup()
+        return _office
+
+
+def shutdown_office():
+    global _office
+    with _office_lock:
+        office, _office = _office, None
+    if office is not None:
+        office.close()
+
+
+def _forget_inherited_office():
+    # a forked batch worker must not share its parent's office or profile
+    global _office, _office_lock
+    _office = None
+    _office_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_inherited_office)
+
+
+def warm_office():
+    """Batch warm-up hook: start this worker's office(s) before its first job."""
+    office = get_office()
+    if isinstance(office, OfficeDaemon):
+        office.start()
+    elif isinstance(office, OfficePool):
+        office.warm()
+
+
+# ---------- Batch prefetch ----------
+
+def _content_key(path, fmt):
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return f"{digest.hexdigest()}:{fmt}"
+
+
+class OfficePrefetch:
+    """
+    Conversions done ahead of time in chunks, filed under the content hash of
+    their input, so a later office_convert() of the same bytes (even a copy
+    under another name) is a file copy. activate() exposes them to this process
+    and to worker processes started afterwards.
+    """
+
+    def __init__(self, root=None):
+        self.root = root or tempfile.mkdtemp(prefix="lo_prefetch_")
+        self.entries = {}
+        self._previous_env = None
+
+    def run(self, sources, fmt, workers=None, chunk_size=None):
+        """Convert every source to `fmt`; returns {src: converted path or None}, errors are printed."""
+        jobs = []
+        for n, src in enumerate(dict.fromkeys(sources)):
+            out_dir = os.path.join(self.root, fmt, str(n))
+            os.makedirs(out_dir, exist_ok=True)
+            jobs.append((src, os.path.join(out_dir, Path(src).stem + "." + fmt), fmt))
+        made = {}
+        if not jobs:
+            return made
+        with OfficePool(workers or os.cpu_count() or 1, factory=SubprocessOffice) as pool:
+            for (src, _, _), out, error in pool.map(jobs, chunk_size=chunk_size):
+                made[src] = out
+                if error:
+                    print(f"⚠️ Batch {fmt.upper()} conversion skipped {src}: {error}")
+                else:
+                    self.entries[_content_key(src, fmt)] = out
+        with open(os.path.join(self.root, "manifest.json"), "w", encoding="utf-8") as f:
+            json.dump(self.entries, f)
+        return made
+
+    def activate(self):
+        self._previous_env = os.environ.get(PREFETCH_ENV)
+        os.environ[PREFETCH_ENV] = self.root
+
+    def close(self):
+        if os.environ.get(PREFETCH_ENV) == self.root:
+            if self._previous_env is None:
+                os.environ.pop(PREFETCH_ENV, None)
+            else:
+                os.environ[PREFETCH_ENV] = self._previous_env
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+_manifest_cache = {}
+
+
+def prefetched(src, fmt):
+    """Path of an active prefetch's conversion of src to fmt, or None."""
+    root = os.environ.get(PREFETCH_ENV)
+    manifest = os.path.join(root, "manifest.json") if root else None
+    if not manifest or not os.path.exists(manifest):
+        return None
+    stamp = os.path.getmtime(manifest)
+    cached = _manifest_cache.get(root)
+    if cached is None or cached[0] != stamp:
+        try:
+            with open(manifest, encoding="utf-8") as f:
+                cached = _manifest_cache[root] = (stamp, json.load(f))
+        except (OSError, ValueError):
+            return None
+    path = cached[1].get(_content_key(src, fmt))
+    return path if path and os.path.exists(path) else None
+
+
+def office_convert(src, out_path, fmt):
+    """Convert src (.doc/.docx/...) to `fmt` at out_path with the process-wide office."""
+    os.makedirs(os.path.dirname(os.path.abspath(out_path)), exist_ok=True)
+    ready = prefetched(src, fmt)
+    if ready:
+        shutil.copyfile(ready, out_path)
+        return out_path
+    return get_office().convert(src, out_path, fmt)
@@ -0,0 +1,182 @@
+# pdf_backends.py
+# Interchangeable PDF backends for plain text and rasterization.
+#
+# pdfplumber builds a dict for every character and clusters words itself, which
+# table extraction needs but plain text does not. For text-only work pdfminer's
+# own layout analysis (with LAParams tuned for speed) or pypdf's content-stream
+# extractor do the same job for a fraction of the cost. Every text backend
+# yields PageText(number, text, width, height), so callers can run the same
+# text-layer checks whichever engine produced the text.
+#
+# Pages are rendered with pdf2image (poppler's pdftoppm) when it is installed,
+# otherwise with pypdfium2, which ships with pdfplumber.
+#
+# Compare the text engines on a real file with:
+#     python -m Converter.pdf_backends some.pdf --repeat 3
+import argparse
+import shutil
+import sys
+import time
+from collections import namedtuple
+
+PageText = namedtuple("PageText", "number text width height")
+
+# Plain-text layout analysis: no text inside figures, no vertical-writing pass,
+# and boxes_flow=None skips pdfminer's costly text-box ordering (boxes are read
+# top to bottom, which is what a .txt export wants anyway)
+PDFMINER_LAPARAMS = dict(line_margin=0.5, char_margin=2.0, word_margin=0.1,
+                         boxes_flow=None, detect_vertical=False, all_texts=False)
+
+# Text engine used when the caller does not pick one
+DEFAULT_TEXT_ENGINE = "pdfminer"
+# "auto" → pdf2image if poppler is on PATH, else pdfium
+RASTER_ENGINE = "auto"
+
+
+def _box_size(box):
+    x0, y0, x1, y1 = (float(v) for v in box)
+    return abs(x1 - x0), abs(y1 - y0)
+
+
+def _pdfplumber_pages(pdf_path):
+    import pdfplumber
+
+    with pdfplumber.open(pdf_path) as pdf:
+        for page in pdf.pages:
+            try:
+                yield PageText(page.page_number, page.extract_text() or "", page.width, page.height)
+            finally:
+                page.close()
+
+
+def _pdfminer_pages(pdf_path):
+    from pdfminer.converter import PDFPageAggregator
+    from pdfminer.layout import LAParams, LTTextBox
+    from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+    from pdfminer.pdfpage import PDFPage
+
+    resources = PDFResourceManager(caching=True)
+    device = PDFPageAggregator(resources, laparams=LAParams(**PDFMINER_LAPARAMS))
+    interpreter = PDFPageInterpreter(resources, device)
+    with open(pdf_path, "rb") as fp:
+        for number, page in enumerate(PDFPage.get_pages(fp), start=1):
+            interpreter.process_page(page)
+            # one line per text line, boxes back to back (no blank line between boxes)
+            text = "".join(box.get_text() for box in device.get_result() if isinstance(box, LTTextBox))
+            yield PageText(number, text.rstrip("\n"), *_box_size(page.mediabox))
+
+
+def _pypdf_pages(pdf_path):
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        from PyPDF2 import PdfReader
+
+    reader = PdfReader(pdf_path)
+    for number, page in enumerate(reader.pages, start=1):
+        yield PageText(number, page.extract_text() or "", *_box_size(page.mediabox))
+
+
+TEXT_ENGINES = {
+    "pdfminer": _pdfminer_pages,
+    "pypdf": _pypdf_pages,
+    "pdfplumber": _pdfplumber_pages,
+}
+
+
+def iter_page_texts(pdf_path, engine=None):
+    """Yield PageText for every page of the PDF using `engine` (default DEFAULT_TEXT_ENGINE)."""
+    name = engine or DEFAULT_TEXT_ENGINE
+    if name not in TEXT_ENGINES:
+        raise ValueError(f"unknown PDF engine {name!r} (choose from {', '.join(TEXT_ENGINES)})")
+    return TEXT_ENGINES[name](pdf_path)
+
+
+# ---------- Rasterization ----------
+
+def raster_engine():
+    """Rasterizer to use: RASTER_ENGINE, with "auto" resolved for this machine."""
+    if RASTER_ENGINE != "auto":
+        return RASTER_ENGINE
+    return "pdf2image" if shutil.which("pdftoppm") else "pdfium"
+
+
+def page_count(pdf_path):
+    if raster_engine() == "pdfium":
+        import pypdfium2 as pdfium
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
+    from pdf2image import pdfinfo_from_path
+    return int(pdfinfo_from_path(pdf_path)["Pages"])
+
+
+def page_sizes(pdf_path):
+    """
+    (width, height) in points of the area render_pages() draws for each page,
+    rotation applied: pdfium renders the CropBox, pdftoppm the MediaBox.
+    """
+    if raster_engine() == "pdfium":
+        import pypdfium2 as pdfium
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            return [pdf[i].get_size() for i in range(len(pdf))]
+        finally:
+            pdf.close()
+    import pdfplumber
+    sizes = []
+    with pdfplumber.open(pdf_path) as pdf:
+        for page in pdf.pages:
+            w, h = _box_size(page.mediabox)
+            sizes.append((h, w) if (page.rotation or 0) % 180 else (w, h))
+    return sizes
+
+
+def render_pages(pdf_path, first_page, last_page, dpi=200, **kwargs):
+    """PIL images of pages first_page..last_page (1-based, inclusive)."""
+    if raster_engine() == "pdfium":
+        import pypdfium2 as pdfium
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            return [pdf[i].render(scale=dpi / 72.0).to_pil() for i in range(first_page - 1, last_page)]
+        finally:
+            pdf.close()
+    from pdf2image import convert_from_path
+    return convert_from_path(pdf_path, dpi=dpi, first_page=first_page, last_page=last_page, **kwargs)
+
+
+# ---------- Benchmark ----------
+
+def benchmark(pdf_path, engines=None, repeat=1):
+    """[(engine, best seconds, pages, characters)] for each text engine on pdf_path."""
+    results = []
+    for name in engines or TEXT_ENGINES:
+        best = None
+        for _ in range(max(1, repeat)):
+            start = time.perf_counter()
+            pages = list(iter_page_texts(pdf_path, name))
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        results.append((name, best, len(pages), sum(len(p.text) for p in pages)))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare PDF text extraction engines on a file.")
+    parser.add_argument("pdf")
+    parser.add_argument("--engines", default=",".join(TEXT_ENGINES),
+                        help=f"comma-separated subset of: {', '.join(TEXT_ENGINES)}")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per engine (best time is kept)")
+    args = parser.parse_args(argv)
+
+    print(f"{'engine':<12}{'seconds':>10}{'pages/s':>10}{'chars':>12}")
+    for name, seconds, pages, chars in benchmark(args.pdf, args.engines.split(","), args.repeat):
+        rate = pages / seconds if seconds else float("inf")
+        print(f"{name:<12}{seconds:>10.3f}{rate:>10.1f}{chars:>12}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
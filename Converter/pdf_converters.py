@@ -145,41 +145,17 @@ def pdf_to_image(pdf_path, out_dir, fmt="png", dpi=150, base_name="page"):
         return None
 
 # ---------- Helpers: script detection & font mapping ----------
+try:
+    from Converter.scripts import classify_scripts, script_of
+except ImportError:  # run as a script from inside Converter/
+    from scripts import classify_scripts, script_of
+
 def detect_script_simple(text):
     """
     Heuristic script detection based on Unicode codepoints.
     Returns one of: DEVANAGARI, CJK, ARABIC, GREEK, HANGUL, LATIN, OTHER
     """
-    if not text:
-        return "LATIN"
-    for ch in text:
-        cp = ord(ch)
-        # Devanagari
-        if 0x0900 <= cp <= 0x097F:
-            return "DEVANAGARI"
-        # CJK unified ideographs (Chinese)
-        if 0x4E00 <= cp <= 0x9FFF or 0x3400 <= cp <= 0x4DBF:
-            return "CJK"
-        # Hiragana / Katakana / Kanji ranges also considered CJK/Japanese
-        if 0x3040 <= cp <= 0x30FF:
-            return "CJK"
-        # Hangul (Korean)
-        if 0xAC00 <= cp <= 0xD7AF:
-            return "HANGUL"
-        # Arabic
-        if 0x0600 <= cp <= 0x06FF or 0x0750 <= cp <= 0x077F:
-            return "ARABIC"
-        # Greek
-        if 0x0370 <= cp <= 0x03FF:
-            return "GREEK"
-        # Basic Latin (ASCII)
-        if cp <= 0x007F:
-            continue
-        # If many other non-ascii chars, mark OTHER as fallback
-    # fallback: if there are non-ascii chars but not matched above
-    if any(ord(ch) > 127 for ch in text):
-        return "OTHER"
-    return "LATIN"
+    return script_of(text)
 
 # Font mapping for XLSX cells (set to fonts commonly available on Windows; adjust if you prefer others)
 FONT_MAP = {
@@ -292,8 +268,8 @@ def pdf_to_csv(pdf_path, csv_path=None, xlsx_path=None,
 
                     if ws:
                         cells = []
-                        for cell_val in out_row:
-                            script = detect_script_simple(cell_val)
+                        scripts, _ = classify_scripts(out_row)
+                        for cell_val, script in zip(out_row, scripts):
                             font_name = excel_font_map.get(script, excel_font_map.get("DEFAULT", "Arial"))
                             cell = WriteOnlyCell(ws, value=cell_val)
                             cell.font = Font(name=font_name, size=11)
@@ -0,0 +1,132 @@
+# pdf_engine.py
+# Page-parallel pdfplumber extraction.
+#
+# Table/text extraction in pdfplumber is pure Python and CPU-bound, so long PDFs
+# are split into page ranges and every worker process opens the file on its own
+# and runs a per-page extraction callable. Results come back to the caller in
+# page order, so a single writer (CSV/XLSX/JSON/DOCX) can consume them as if the
+# pages had been walked serially.
+#
+# Memory stays flat on multi-thousand-page files: each page's cached layout
+# objects (chars, rects, lines, ...) are released right after extraction, and
+# the file is reopened for every page range so pdfminer's object cache does not
+# grow with the document. An optional RSS ceiling turns runaway growth into a
+# clear error instead of swapping.
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from Converter.batch import _resolve, current_rss_mb
+except ImportError:  # run as a script from inside Converter/
+    from batch import _resolve, current_rss_mb
+
+# Pages handed to a worker per task
+PAGES_PER_TASK = 25
+# Below this many pages a process pool costs more than it saves
+MIN_PAGES_FOR_POOL = 50
+
+
+class MemoryLimitError(RuntimeError):
+    """Raised when a PDF extraction goes above its max_rss_mb ceiling."""
+
+
+def check_memory(max_rss_mb, where):
+    """Raise MemoryLimitError if this process is above max_rss_mb (None → no limit)."""
+    if not max_rss_mb:
+        return
+    rss = current_rss_mb()
+    if rss > max_rss_mb:
+        raise MemoryLimitError(
+            f"memory limit exceeded at {where}: {rss:.0f} MB resident > {max_rss_mb} MB "
+            f"(use fewer page workers or a higher limit)")
+
+
+def pdf_page_total(pdf_path):
+    import pdfplumber
+    with pdfplumber.open(pdf_path) as pdf:
+        return len(pdf.pages)
+
+
+def _extract_range(pdf_path, first, last, extract, max_rss_mb=None):
+    """Worker task: [(pageno, extract(page))] for pages first..last (1-based, inclusive)."""
+    import pdfplumber
+
+    extract = _resolve(extract)
+    out = []
+    with pdfplumber.open(pdf_path, pages=range(first, last + 1)) as pdf:
+        for page in pdf.pages:
+            try:
+                out.append((page.page_number, extract(page)))
+            finally:
+                # drop cached chars/rects/lines/textmap of this page
+                page.close()
+            check_memory(max_rss_mb, f"page {page.page_number}")
+    return out
+
+
+class PageEngine:
+    """
+    Run extract(page) over every page of a PDF, in parallel, yielding results in page order.
+
+    extract        : callable(pdfplumber page) → picklable result, or "module:function"
+                     (must be importable by worker processes)
+    workers        : worker processes; None → os.cpu_count() for long PDFs, 1 for short ones;
+                     1 → run in this process
+    pages_per_task : page range handed to a worker at a time
+    max_rss_mb     : raise MemoryLimitError when a worker (or the caller) goes above this
+    """
+
+    def __init__(self, extract, workers=None, pages_per_task=None, max_rss_mb=None):
+        self.extract = extract
+        self.workers = workers
+        self.pages_per_task = max(1, pages_per_task or PAGES_PER_TASK)
+        self.max_rss_mb = max_rss_mb
+
+    def _workers_for(self, page_count):
+        if self.workers:
+            return max(1, min(self.workers, -(-page_count // self.pages_per_task)))
+        if page_count < MIN_PAGES_FOR_POOL:
+            return 1
+        return max(1, min(os.cpu_count() or 1, -(-page_count // self.pages_per_task)))
+
+    def run(self, pdf_path, page_count=None, first_page=1):
+        """Yield (pageno, result) for every page from first_page on, in page order."""
+        if page_count is None:
+            page_count = pdf_page_total(pdf_path)
+        first_page = max(1, first_page)
+        if page_count < first_page:
+            return
+        workers = self._workers_for(page_count - first_page + 1)
+        ranges = [(first, min(first + self.pages_per_task - 1, page_count))
+                  for first in range(first_page, page_count + 1, self.pages_per_task)]
+
+        if workers == 1:
+            for first, last in ranges:
+                yield from _extract_range(pdf_path, first, last, self.extract, self.max_rss_mb)
+            return
+
+        # Keep a bounded number of ranges in flight and hand them out in order
+        window = workers * 2
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = list(reversed(ranges))
+            in_flight = []
+            try:
+                while pending or in_flight:
+                    while pending and len(in_flight) < window:
+                        first, last = pending.pop()
+                        in_flight.append(pool.submit(_extract_range, pdf_path, first, last,
+                                                     self.extract, self.max_rss_mb))
+                    results = in_flight.pop(0).result()
+                    # the caller's writer holds state too (e.g. the JSON page list)
+                    if results:
+                        check_memory(self.max_rss_mb, f"page {results[-1][0]} (writer)")
+                    yield from results
+            finally:
+                for fut in in_flight:
+                    fut.cancel()
+
+
+def extract_pages(pdf_path, extract, workers=None, pages_per_task=None, max_rss_mb=None, first_page=1):
+    """Shortcut: PageEngine(extract, ...).run(pdf_path, first_page=first_page)."""
+    return PageEngine(extract, workers=workers, pages_per_task=pages_per_task,
+                      max_rss_mb=max_rss_mb).run(pdf_path, first_page=first_page)
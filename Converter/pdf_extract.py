@@ -0,0 +1,165 @@
+# pdf_extract.py
+# Per-page extraction callables for the pdfplumber converters. They run inside
+# PageEngine workers (see pdf_engine.py), so they live in an importable module
+# and return plain picklable data.
+#
+# Each callable accepts a pdfplumber page or a PageAnalysis of it, so a caller
+# that needs several outputs for one page (text + tables + images) computes
+# them from a single analysis.
+import io
+
+try:
+    from Converter.pdf_pages import PageAnalysis, looks_like_table
+except ImportError:  # run as a script from inside Converter/
+    from pdf_pages import PageAnalysis, looks_like_table
+
+
+def table_rows(page):
+    """
+    Try to extract tables from a pdfplumber page as rows.
+    If no tables detected, fall back to extracting text lines and splitting heuristically.
+    Returns a list of row-lists.
+    """
+    analysis = PageAnalysis.of(page)
+    rows = []
+    # 1) Try extract_tables (pdfplumber)
+    try:
+        tables = analysis.tables  # returns list of tables, each table is list of rows
+        if tables:
+            for table in tables:
+                # table: list of rows (cells may be None)
+                for row in table:
+                    rows.append([cell for cell in row])
+            if rows:
+                return rows
+    except Exception:
+        # continue to fallback
+        pass
+
+    # 2) Fallback: use the page text and split lines by common delimiters (tab or comma)
+    # attempt to detect delimiter by checking first non-empty line
+    lines = analysis.lines
+    if not lines:
+        return []
+    first = lines[0]
+    # choose delimiter heuristically
+    delim = "\t"
+    if "," in first and first.count(",") >= 1:
+        delim = ","
+    elif "|" in first and first.count("|") >= 1:
+        delim = "|"
+    # split each line
+    for ln in lines:
+        parts = [p.strip() for p in ln.split(delim)]
+        rows.append(parts)
+    return rows
+
+
+def strict_table_rows(page):
+    """table_rows(page), or None when the page clearly has no table (extraction skipped)."""
+    analysis = PageAnalysis.of(page)
+    if not looks_like_table(analysis):
+        return None
+    return table_rows(analysis)
+
+
+def page_record(page):
+    """{"page": n, "text": ..., "tables": [...]} for PDF → JSON ("tables" only when present)."""
+    analysis = PageAnalysis.of(page)
+    record = {"page": analysis.page_number, "text": analysis.text}
+    # Try tables too
+    tables = analysis.tables
+    if tables:
+        record["tables"] = tables
+    return record
+
+
+def _name(obj):
+    from pdfminer.pdftypes import resolve1
+    obj = resolve1(obj)
+    return getattr(obj, "name", obj)
+
+
+def _pil_mode(colorspace, bits):
+    """(PIL mode, palette bytes or None) for a PDF image colour space, or None if unsupported."""
+    from pdfminer.pdftypes import resolve1
+
+    cs = resolve1(colorspace)
+    family = _name(cs[0]) if isinstance(cs, list) and cs else _name(cs)
+    if family == "ICCBased":
+        family = {1: "DeviceGray", 3: "DeviceRGB"}.get(resolve1(cs[1]).get("N"))
+    if family == "DeviceGray":
+        return {8: ("L", None), 1: ("1", None)}.get(bits)
+    if family == "DeviceRGB" and bits == 8:
+        return "RGB", None
+    if family == "Indexed" and bits == 8 and _pil_mode(cs[1], 8) == ("RGB", None):
+        lookup = resolve1(cs[3])
+        return "P", lookup if isinstance(lookup, bytes) else lookup.get_data()
+    return None
+
+
+def _png_bytes(img):
+    buf = io.BytesIO()
+    img.save(buf, "PNG")
+    return buf.getvalue()
+
+
+def embedded_image(img):
+    """
+    The image XObject behind a pdfplumber page.images entry, as bytes python-docx
+    can embed (JPEG streams as they are, JPEG 2000 / Flate pixels as PNG), or
+    None when it has to be rendered instead (masks, CMYK, CCITT/JBIG2, ...).
+    """
+    from PIL import Image
+    from pdfminer.pdftypes import LITERALS_DCT_DECODE, LITERALS_JPX_DECODE, LITERALS_FLATE_DECODE
+
+    stream = img.get("stream")
+    if stream is None or img.get("imagemask") or any(stream.get(k) for k in ("SMask", "Mask", "Decode")):
+        return None
+    filters = [f for f, _ in stream.get_filters()]
+    last = filters[-1] if filters else None
+    data = stream.get_data()   # undoes ASCII85/Flate/LZW/... but leaves DCT and JPX encoded
+    bits = stream.get("BitsPerComponent", 8)
+
+    if last in LITERALS_DCT_DECODE:
+        # CMYK JPEGs (often Adobe-inverted) only look right inside a PDF
+        return None if _pil_mode(stream.get("ColorSpace"), bits) is None else data
+    if last in LITERALS_JPX_DECODE:
+        with Image.open(io.BytesIO(data)) as im:
+            return _png_bytes(im)
+    if last is not None and last not in LITERALS_FLATE_DECODE:
+        return None
+
+    mode = _pil_mode(stream.get("ColorSpace"), bits)
+    if mode is None:
+        return None
+    mode, palette = mode
+    im = Image.frombytes(mode, (stream["Width"], stream["Height"]), data)
+    if palette:
+        im.putpalette(palette)
+    return _png_bytes(im)
+
+
+def docx_content(page, image_resolution=150):
+    """
+    (text lines, [JPEG/PNG bytes of each embedded image]) for PDF → DOCX.
+    Images are taken from their XObject streams; only those that cannot be
+    decoded directly are rendered (at image_resolution) from the page.
+    """
+    analysis = PageAnalysis.of(page)
+    images = []
+    for img in analysis.page.images:
+        try:
+            data = None
+            try:
+                data = embedded_image(img)
+            except Exception:
+                pass   # corrupt or unusual stream → render it
+            if data is None:
+                # every fallback crop comes from one render of the page
+                bbox = (img["x0"], img["top"], img["x1"], img["bottom"])
+                data = _png_bytes(analysis.crop_image(bbox, image_resolution))
+            images.append(data)
+        except Exception as e:
+            print(f"⚠️ Image on page {analysis.page_number} skipped: {e}")
+    return analysis.text.splitlines(), images
@@ -0,0 +1,198 @@
+# pdf_pages.py
+# Per-page PDF helpers: deciding whether a page's text layer is usable or the
+# page has to be rasterized and OCR'd, and PageAnalysis, the per-page cache the
+# text, table and image extractors share.
+#
+# Asking a pdfplumber page for its text, then its tables, then a crop of each
+# image repeats work: the fallback paths re-extract text, and every image crop
+# renders the whole page again. A PageAnalysis computes each view at most once
+# (one text pass, one table-finder pass, one render per resolution) and hands
+# the cached result to every consumer of that page.
+import re
+from collections import Counter, namedtuple
+
+# A page whose text layer is sparser than this (non-space chars per 10,000 pt²,
+# ≈ 48 chars on a Letter page) is treated as scanned.
+MIN_TEXT_DENSITY = 1.0
+# ... or whose extracted text is more than this fraction garbage
+MAX_GARBAGE_RATIO = 0.25
+
+# Unmapped glyphs come out as "(cid:123)", U+FFFD, private-use or control characters
+_GARBAGE = re.compile(r"\(cid:\d+\)|[\ufffd\ue000-\uf8ff\x00-\x08\x0b\x0c\x0e-\x1f]")
+_SPACE = re.compile(r"\s+")
+
+# chars          : non-whitespace characters in the text layer
+# density        : chars per 10,000 pt² of page area
+# garbage_ratio  : fraction of those characters that are unmapped glyphs
+TextLayer = namedtuple("TextLayer", "chars density garbage_ratio")
+
+
+def text_layer_stats(text, width, height):
+    """TextLayer metrics for a page's extracted text and its size in points."""
+    compact = _SPACE.sub("", text or "")
+    chars = len(compact)
+    garbage = sum(len(m) for m in _GARBAGE.findall(compact))
+    area = max(float(width) * float(height), 1.0)
+    return TextLayer(chars, chars * 10000.0 / area, garbage / chars if chars else 0.0)
+
+
+def has_usable_text(stats, min_density=MIN_TEXT_DENSITY, max_garbage=MAX_GARBAGE_RATIO):
+    """True when the text layer can be used as is (no OCR needed)."""
+    return stats.density >= min_density and stats.garbage_ratio <= max_garbage
+
+
+# ---------- Table prefilter ----------
+
+# Ruling segments (line/rect/curve edges) from which pdfplumber could build a cell
+MIN_RULINGS = 4
+# Lines that must share the same number of delimiters to look like delimited rows,
+# and the share of the page's lines they must make up (prose commas vary per line)
+MIN_DELIMITED_LINES = 2
+MIN_DELIMITED_SHARE = 0.5
+# Lines that must start a word at the same x (after a wide gap) to form a column
+MIN_ALIGNED_ROWS = 3
+# Word x0 positions within this many points are one column
+COLUMN_TOLERANCE = 3.0
+# Gap before a word (pt) wider than a normal space, i.e. a column break
+MIN_COLUMN_GAP = 6.0
+
+_DELIMITERS = (",", "\t", "|")
+
+# rulings         : edges on the page
+# delimited_lines : most lines sharing one delimiter count (",", tab or "|"),
+#                   0 if they are under MIN_DELIMITED_SHARE of the page
+# aligned_columns : x positions where words start after a wide gap on several lines
+TableScore = namedtuple("TableScore", "rulings delimited_lines aligned_columns")
+
+
+def _delimited_lines(lines):
+    best = 0
+    for delim in _DELIMITERS:
+        counts = Counter(ln.count(delim) for ln in lines if delim in ln)
+        if counts:
+            best = max(best, counts.most_common(1)[0][1])
+    return best if best >= MIN_DELIMITED_SHARE * len(lines) else 0
+
+
+def _aligned_columns(words):
+    rows = {}
+    for w in words:
+        rows.setdefault(round(w["top"]), []).append(w)
+    columns = Counter()
+    for row in rows.values():
+        row.sort(key=lambda w: w["x0"])
+        starts = {round(w["x0"] / COLUMN_TOLERANCE)
+                  for prev, w in zip(row, row[1:]) if w["x0"] - prev["x1"] >= MIN_COLUMN_GAP}
+        columns.update(starts)
+    return sum(1 for n in columns.values() if n >= MIN_ALIGNED_ROWS)
+
+
+def table_score(page):
+    """
+    TableScore of a pdfplumber page (or PageAnalysis), cheapest signal first:
+    later signals are only computed while the earlier ones found nothing.
+    """
+    analysis = PageAnalysis.of(page)
+    rulings = len(analysis.page.edges)
+    if rulings >= MIN_RULINGS:
+        return TableScore(rulings, 0, 0)
+    delimited = _delimited_lines(analysis.lines)
+    if delimited >= MIN_DELIMITED_LINES:
+        return TableScore(rulings, delimited, 0)
+    return TableScore(rulings, delimited, _aligned_columns(analysis.words))
+
+
+def looks_like_table(page):
+    """False only for pages that clearly hold no table (no rulings, delimiters or columns)."""
+    score = table_score(page)
+    return (score.rulings >= MIN_RULINGS or score.delimited_lines >= MIN_DELIMITED_LINES
+            or score.aligned_columns > 0)
+
+
+class PageAnalysis:
+    """
+    Lazily computed, cached views of one pdfplumber page.
+
+    table_settings : pdfplumber table settings for find_tables() (None → defaults)
+    """
+
+    def __init__(self, page, table_settings=None):
+        self.page = page
+        self.table_settings = table_settings
+        self._cache = {}
+
+    @classmethod
+    def of(cls, page, table_settings=None):
+        """`page` itself if it is already a PageAnalysis, otherwise a new one for it."""
+        return page if isinstance(page, cls) else cls(page, table_settings)
+
+    def _get(self, key, compute):
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    @property
+    def page_number(self):
+        return self.page.page_number
+
+    @property
+    def chars(self):
+        return self._get("chars", lambda: self.page.chars)
+
+    @property
+    def text(self):
+        return self._get("text", lambda: self.page.extract_text() or "")
+
+    @property
+    def lines(self):
+        """Non-blank text lines."""
+        return self._get("lines", lambda: [ln for ln in self.text.splitlines() if ln.strip()])
+
+    @property
+    def words(self):
+        return self._get("words", lambda: self.page.extract_words())
+
+    @property
+    def table_candidates(self):
+        """pdfplumber Table objects found on the page (one table-finder pass)."""
+        return self._get("table_candidates", lambda: self.page.find_tables(self.table_settings))
+
+    @property
+    def tables(self):
+        """
+        Each table as a list of rows (cells may be None). Table.extract() places
+        chars in cells before grouping them into words, so text packed against a
+        cell border never runs into the next cell.
+        """
+        return self._get("tables", lambda: [t.extract() for t in self.table_candidates])
+
+    @property
+    def text_layer(self):
+        return self._get("text_layer", lambda: text_layer_stats(self.text, self.page.width, self.page.height))
+
+    @property
+    def needs_ocr(self):
+        return not has_usable_text(self.text_layer)
+
+    def render(self, resolution=150):
+        """PIL image of the whole page at `resolution` dpi, rendered once per resolution."""
+        return self._get(("render", resolution),
+                         lambda: self.page.to_image(resolution=resolution).original)
+
+    def crop_image(self, bbox, resolution=150):
+        """PIL image of the (x0, top, x1, bottom) region, cut from the cached page render."""
+        full = self.render(resolution)
+        px0, ptop, px1, pbottom = self.page.bbox
+        scale = full.width / float(px1 - px0)
+        # clip to the page, like page.crop() would
+        box = (max(bbox[0], px0) - px0, max(bbox[1], ptop) - ptop,
+               min(bbox[2], px1) - px0, min(bbox[3], pbottom) - ptop)
+        return full.crop(tuple(int(v * scale) for v in box))
+
+    def close(self):
+        """Drop everything cached here and in the underlying page."""
+        for key, value in self._cache.items():
+            if isinstance(key, tuple) and key[0] == "render":
+                value.close()
+        self._cache.clear()
+        self.page.close()
@@ -0,0 +1,94 @@
+# raster.py
+# Page-at-a-time PDF rasterization.
+#
+# convert_from_path(pdf) returns every page as a decoded PIL image at once — a
+# 500-page PDF at 200 dpi is several GB. iter_pdf_pages() asks pdftoppm for a
+# window of pages at a time (first_page/last_page) and hands them out one by one,
+# so at most `window` decoded pages are alive at any moment. Pages are rendered
+# by the backend chosen in pdf_backends.py (poppler, or pdfium without it).
+import os
+import math
+
+try:
+    from Converter import pdf_backends
+    from Converter.tall_png import write_tall_png
+except ImportError:  # run as a script from inside Converter/
+    import pdf_backends
+    from tall_png import write_tall_png
+
+# Pages rendered per pdftoppm call (peak memory ≈ window × one decoded page)
+RASTER_WINDOW = 4
+
+
+def pdf_page_count(pdf_path):
+    return pdf_backends.page_count(pdf_path)
+
+
+def render_pages(pdf_path, first_page, last_page, dpi=200, **kwargs):
+    """PIL images of pages first_page..last_page (1-based, inclusive)."""
+    return pdf_backends.render_pages(pdf_path, first_page, last_page, dpi=dpi, **kwargs)
+
+
+def render_page(pdf_path, pageno, dpi=200, **kwargs):
+    return render_pages(pdf_path, pageno, pageno, dpi=dpi, **kwargs)[0]
+
+
+def iter_pdf_pages(pdf_path, dpi=200, window=RASTER_WINDOW, first_page=1, last_page=None, **kwargs):
+    """
+    Yield (pageno, PIL image) for each page, rendering `window` pages per call.
+    The generator drops its reference to a page once it has been handed out,
+    so callers that save-and-forget keep memory bounded by the window.
+    """
+    if last_page is None:
+        last_page = pdf_page_count(pdf_path)
+    window = max(1, window or 1)
+    for start in range(first_page, last_page + 1, window):
+        stop = min(start + window - 1, last_page)
+        images = render_pages(pdf_path, start, stop, dpi=dpi, **kwargs)
+        images.reverse()            # pop() from the end in page order
+        pageno = start
+        while images:
+            yield pageno, images.pop()
+            pageno += 1
+
+
+def save_pages(pdf_path, out_dir, fmt="png", dpi=200, base_name="page", window=RASTER_WINDOW):
+    """Render every page to out_dir/<base_name>_<n>.<fmt>; returns the list of paths."""
+    os.makedirs(out_dir, exist_ok=True)
+    paths = []
+    for pageno, img in iter_pdf_pages(pdf_path, dpi=dpi, window=window):
+        path = os.path.join(out_dir, f"{base_name}_{pageno}.{fmt}")
+        img.save(path, fmt.upper())
+        img.close()
+        paths.append(path)
+    return paths
+
+
+def rasterize_to_pdf(pdf_path, output_pdf, dpi=200, window=RASTER_WINDOW):
+    """Rasterize every page and write them to output_pdf one page at a time (PIL append mode)."""
+    count = 0
+    for pageno, img in iter_pdf_pages(pdf_path, dpi=dpi, window=window):
+        page = img if img.mode == "RGB" else img.convert("RGB")
+        page.save(output_pdf, "PDF", append=count > 0)
+        img.close()
+        count += 1
+    return count
+
+
+def pdf_page_pixel_widths(pdf_path, dpi=200):
+    """
+    Pixel width the page renderer will produce for each page at `dpi`, read from
+    the page box it draws (see pdf_backends.page_sizes) without rendering anything.
+    """
+    scale = dpi / 72.0   # the scale render_pages() renders at
+    return [int(math.ceil(w * scale)) for w, _ in pdf_backends.page_sizes(pdf_path)]
+
+
+def merge_pdf_pages(pdf_path, out_path, dpi=200, window=RASTER_WINDOW):
+    """
+    Stack every page into one tall PNG, streaming page by page (memory ≈ one
+    window of pages, not pages + canvas). Returns the (width, height) written.
+    """
+    width = max(pdf_page_pixel_widths(pdf_path, dpi=dpi))
+    pages = (img for _, img in iter_pdf_pages(pdf_path, dpi=dpi, window=window))
+    return write_tall_png(pages, out_path, width)
@@ -0,0 +1,83 @@
+# registry.py
+# (src_fmt, dst_fmt) -> converter registry with lazily resolved entries.
+import importlib
+from collections.abc import Mapping
+
+
+class ConverterRegistry(Mapping):
+    """
+    Read-only mapping of (src_fmt, dst_fmt) -> converter callable.
+
+    Entries are registered as:
+      - a callable                      -> used as-is
+      - "module.path:function"          -> imported on first lookup
+      - "function"                      -> looked up in `default_module` on first lookup
+
+    Nothing is imported until a conversion is actually requested, so asking for
+    csv → txt never loads the OCR / HTML / PDF stacks used by other entries.
+    """
+
+    def __init__(self, default_module=None, entries=None, aliases=()):
+        self._default_module = default_module
+        self._entries = {}
+        self._resolved = {}
+        # fmt -> every spelling of the same format, e.g. "xls" -> ("xlsx", "xls")
+        self._aliases = {}
+        for group in aliases:
+            for fmt in group:
+                self._aliases[fmt] = tuple(group)
+        for key, target in (entries or {}).items():
+            self.register(key[0], key[1], target)
+
+    def register(self, src_fmt, dst_fmt, target):
+        key = (src_fmt.lower(), dst_fmt.lower())
+        self._entries[key] = target
+        self._resolved.pop(key, None)
+        return key
+
+    def _resolve(self, key):
+        target = self._entries[key]
+        if callable(target):
+            return target
+        module_name, _, func_name = target.rpartition(":")
+        module_name = module_name or self._default_module
+        if not module_name:
+            raise LookupError(f"No module given for converter {target!r}")
+        func = getattr(importlib.import_module(module_name), func_name)
+        self._resolved[key] = func
+        return func
+
+    def __getitem__(self, key):
+        if key in self._resolved:
+            return self._resolved[key]
+        return self._resolve(key)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _spellings(self, fmt):
+        fmt = fmt.lower().strip()
+        return [fmt] + [a for a in self._aliases.get(fmt, ()) if a != fmt]
+
+    def find_key(self, src_fmt, dst_fmt):
+        """Return the registered key for src → dst, trying format aliases; None if unsupported."""
+        for src in self._spellings(src_fmt):
+            for dst in self._spellings(dst_fmt):
+                if (src, dst) in self._entries:
+                    return (src, dst)
+        return None
+
+    def find(self, src_fmt, dst_fmt):
+        """Return the converter for src → dst (alias aware), or None if unsupported."""
+        key = self.find_key(src_fmt, dst_fmt)
+        return self[key] if key else None
+
+    def target_of(self, key):
+        """Return the registered (unresolved) target for `key`, without importing anything."""
+        return self._entries[key]
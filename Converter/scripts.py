@@ -0,0 +1,124 @@
+# scripts.py
+# Batch Unicode script classification.
+#
+# The converters used to walk every string character by character in Python
+# (ord() range checks, unicodedata.name() lookups) to pick a font. Here a whole
+# batch of strings is encoded to UTF-32 once, and every code point is classified
+# with a single NumPy searchsorted against a sorted table of Unicode ranges.
+import threading
+
+try:
+    from Converter.lazy import lazy_import
+except ImportError:  # run as a script from inside Converter/
+    from lazy import lazy_import
+
+np = lazy_import("numpy")
+
+# Labels (index = code used in the classification arrays).
+# LATIN is plain ASCII, OTHER any code point outside the table and above ASCII.
+SCRIPTS = ["LATIN", "OTHER", "DEVANAGARI", "CJK", "KANA", "HANGUL", "ARABIC", "GREEK"]
+_LATIN, _OTHER = 0, 1
+
+# (first, last, label), inclusive, must not overlap
+SCRIPT_RANGES = [
+    (0x0370, 0x03FF, "GREEK"),
+    (0x0600, 0x06FF, "ARABIC"),
+    (0x0750, 0x077F, "ARABIC"),
+    (0x08A0, 0x08FF, "ARABIC"),
+    (0x0900, 0x097F, "DEVANAGARI"),
+    (0x1100, 0x11FF, "HANGUL"),        # Jamo
+    (0x1F00, 0x1FFF, "GREEK"),         # Greek Extended
+    (0x3040, 0x30FF, "KANA"),          # Hiragana + Katakana
+    (0x3130, 0x318F, "HANGUL"),        # Compatibility Jamo
+    (0x3400, 0x4DBF, "CJK"),           # Extension A
+    (0x4E00, 0x9FFF, "CJK"),           # Unified Ideographs
+    (0xAC00, 0xD7AF, "HANGUL"),        # Syllables
+    (0xF900, 0xFAFF, "CJK"),           # Compatibility Ideographs
+    (0xFB50, 0xFDFF, "ARABIC"),        # Presentation Forms-A
+    (0xFE70, 0xFEFF, "ARABIC"),        # Presentation Forms-B
+    (0x20000, 0x2FA1F, "CJK"),         # Extensions B.. + Compatibility Supplement
+]
+
+# Label used by the per-string "dominant" script for each caller. Callers that
+# do not distinguish e.g. Japanese kana from Han ideographs merge them here.
+FONT_SCRIPT = {"KANA": "CJK"}          # → keys of FALLBACK_FONTS / FALLBACK_FONTS_PDF
+
+_table = None
+_table_lock = threading.Lock()
+
+
+def _range_table():
+    """(starts, ends, codes) arrays for SCRIPT_RANGES, built on first use."""
+    global _table
+    if _table is None:
+        with _table_lock:
+            if _table is None:
+                ranges = sorted(SCRIPT_RANGES)
+                starts = np.array([r[0] for r in ranges], dtype=np.uint32)
+                ends = np.array([r[1] for r in ranges], dtype=np.uint32)
+                codes = np.array([SCRIPTS.index(r[2]) for r in ranges], dtype=np.uint8)
+                _table = (starts, ends, codes)
+    return _table
+
+
+def classify_codepoints(cps):
+    """Script code (index into SCRIPTS) for each code point in a uint32 array."""
+    starts, ends, codes = _range_table()
+    idx = np.searchsorted(starts, cps, side="right") - 1
+    safe = np.maximum(idx, 0)
+    in_range = (idx >= 0) & (cps <= ends[safe])
+    fallback = np.where(cps <= 0x7F, _LATIN, _OTHER).astype(np.uint8)
+    return np.where(in_range, codes[safe], fallback)
+
+
+def classify_scripts(texts, merge=FONT_SCRIPT):
+    """
+    Classify a batch of strings at once.
+
+    Returns (labels, histogram):
+      labels    : one label per string — the script of its first non-Latin,
+                  non-OTHER character; else "OTHER" if it has any non-ASCII
+                  character; else "LATIN". `merge` maps labels together
+                  (by default kana → CJK, matching the font tables).
+      histogram : {label: character count} over the whole batch (unmerged).
+    """
+    texts = ["" if t is None else (t if isinstance(t, str) else str(t)) for t in texts]
+    n = len(texts)
+    histogram = dict.fromkeys(SCRIPTS, 0)
+    joined = "".join(texts)
+    if joined.isascii():
+        # Common case (plain English cells/lines): no need to touch NumPy
+        histogram["LATIN"] = len(joined)
+        return ["LATIN"] * n, histogram
+
+    cps = np.frombuffer(joined.encode("utf-32-le", errors="surrogatepass"), dtype="<u4")
+    codes = classify_codepoints(cps)
+    lengths = np.fromiter(map(len, texts), dtype=np.int64, count=n)
+    owner = np.repeat(np.arange(n), lengths)
+
+    result = np.full(n, _LATIN, dtype=np.uint8)
+    other_pos = np.flatnonzero(codes == _OTHER)
+    result[owner[other_pos]] = _OTHER
+    named_pos = np.flatnonzero(codes > _OTHER)
+    if named_pos.size:
+        # positions are ascending, so the first index per owner is its first named char
+        owners, first = np.unique(owner[named_pos], return_index=True)
+        result[owners] = codes[named_pos[first]]
+
+    for code, count in enumerate(np.bincount(codes, minlength=len(SCRIPTS))):
+        histogram[SCRIPTS[code]] = int(count)
+    merge = merge or {}
+    labels = [merge.get(SCRIPTS[c], SCRIPTS[c]) for c in result.tolist()]
+    return labels, histogram
+
+
+def script_of(text, merge=FONT_SCRIPT):
+    """Label for a single string (see classify_scripts)."""
+    if not text or text.isascii():
+        return "LATIN"
+    return classify_scripts([text], merge)[0][0]
+
+
+def script_histogram(text):
+    """{label: character count} for one (possibly long) string."""
+    return classify_scripts([text])[1]
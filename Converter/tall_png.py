@@ -0,0 +1,106 @@
+# tall_png.py
+# Streaming writer for very tall PNGs ("merge all pages into one image").
+#
+# Pasting N pages into one Image.new() canvas needs the canvas plus the pages in
+# memory at once. TallPNGWriter instead writes the PNG by hand: scanlines of each
+# page go straight through a zlib compressor into IDAT chunks, so memory stays at
+# about one page whatever the page count. The height in IHDR is patched on close,
+# so callers only need the final width up front.
+import struct
+import zlib
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# Uncompressed bytes fed to zlib per write, and max size of one IDAT chunk
+ROWS_PER_STRIP = 64
+IDAT_CHUNK_SIZE = 1 << 20
+
+
+def _chunk(tag, data):
+    return (struct.pack(">I", len(data)) + tag + data
+            + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF))
+
+
+class TallPNGWriter:
+    """
+    Write an RGB PNG of fixed `width` by appending images top to bottom.
+
+    Narrower images are padded with `background` on the right, wider ones are
+    cropped. Use as a context manager or call close().
+    """
+
+    def __init__(self, path, width, background=(255, 255, 255), compress_level=6):
+        if width <= 0:
+            raise ValueError("width must be positive")
+        self.path = path
+        self.width = int(width)
+        self.height = 0
+        self.background = tuple(background)
+        self._file = open(path, "wb")
+        self._file.write(PNG_SIGNATURE)
+        self._ihdr_offset = self._file.tell()
+        self._file.write(self._ihdr())
+        self._zlib = zlib.compressobj(compress_level)
+        self._pending = bytearray()
+
+    def _ihdr(self):
+        # 8-bit truecolor, deflate, adaptive filtering (we use filter 0), no interlace
+        return _chunk(b"IHDR", struct.pack(">IIBBBBB", self.width, max(self.height, 1), 8, 2, 0, 0, 0))
+
+    def _emit(self, data):
+        self._pending += data
+        while len(self._pending) >= IDAT_CHUNK_SIZE:
+            self._file.write(_chunk(b"IDAT", bytes(self._pending[:IDAT_CHUNK_SIZE])))
+            del self._pending[:IDAT_CHUNK_SIZE]
+
+    def add(self, img):
+        """Append a PIL image below what has been written so far."""
+        from PIL import Image
+
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+        if img.width != self.width:
+            padded = Image.new("RGB", (self.width, img.height), self.background)
+            padded.paste(img.crop((0, 0, min(img.width, self.width), img.height)), (0, 0))
+            img = padded
+        stride = self.width * 3
+        for top in range(0, img.height, ROWS_PER_STRIP):
+            rows = img.crop((0, top, self.width, min(top + ROWS_PER_STRIP, img.height))).tobytes()
+            strip = b"".join(b"\x00" + rows[i:i + stride] for i in range(0, len(rows), stride))
+            self._emit(self._zlib.compress(strip))
+        self.height += img.height
+
+    def close(self):
+        if self._file is None:
+            return
+        if self.height == 0:
+            # a PNG needs at least one row
+            self.add(_blank_row(self.width, self.background))
+        self._emit(self._zlib.flush())
+        if self._pending:
+            self._file.write(_chunk(b"IDAT", bytes(self._pending)))
+        self._file.write(_chunk(b"IEND", b""))
+        # now that the real height is known, rewrite IHDR in place (same length)
+        self._file.seek(self._ihdr_offset)
+        self._file.write(self._ihdr())
+        self._file.close()
+        self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def _blank_row(width, background):
+    from PIL import Image
+    return Image.new("RGB", (width, 1), background)
+
+
+def write_tall_png(images, path, width, background=(255, 255, 255)):
+    """Stack an iterable of PIL images into one PNG at `path`; returns its (width, height)."""
+    with TallPNGWriter(path, width, background) as writer:
+        for img in images:
+            writer.add(img)
+            img.close()
+    return writer.width, writer.height
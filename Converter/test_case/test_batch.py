@@ -0,0 +1,64 @@
+import os
+import pytest
+
+from Converter.batch import BatchEngine
+
+
+def pid_runner(src_fmt, dst_fmt, in_path, out_path):
+    if in_path == "boom":
+        raise ValueError("bad input")
+    return os.getpid()
+
+
+JOBS = [("csv", "txt", f"in_{i}", f"out_{i}") for i in range(6)]
+
+
+@pytest.mark.quick
+def test_serial_engine_keeps_order_and_reports_errors():
+    jobs = JOBS[:2] + [("csv", "txt", "boom", "x")]
+    results = BatchEngine(pid_runner, workers=1).run(jobs)
+    assert [r.job for r in results] == jobs
+    assert results[0].result == os.getpid() and results[0].error is None
+    assert results[2].error == "bad input"
+
+
+@pytest.mark.quick
+def test_workers_are_recycled_after_n_jobs():
+    results = BatchEngine(pid_runner, workers=2, max_jobs_per_worker=1).run(JOBS)
+    assert [r.job for r in results] == JOBS
+    assert all(r.error is None for r in results)
+    assert len({r.result for r in results}) == len(JOBS)
+
+
+@pytest.mark.quick
+def test_rss_ceiling_recycles_workers():
+    engine = BatchEngine(pid_runner, workers=2, max_rss_mb=0.001, window=2)
+    results = engine.run(JOBS)
+    assert all(r.error is None for r in results)
+    assert engine.recycles >= 1
+
+
+_hoard = []
+
+
+def fat_runner(src_fmt, dst_fmt, in_path, out_path):
+    import time
+    if in_path == "fat":
+        _hoard.append(b"x" * (300 << 20))
+    time.sleep(0.05)
+    return os.getpid()
+
+
+@pytest.mark.quick
+def test_rss_ceiling_recycles_only_that_worker():
+    from Converter.batch import current_rss_mb
+
+    jobs = [("csv", "txt", "fat", "out_fat")] + JOBS * 4
+    engine = BatchEngine(fat_runner, workers=2, max_rss_mb=current_rss_mb() + 150, window=2)
+    results = engine.run(jobs)
+    assert all(r.error is None for r in results)
+    pids = [r.pid for r in results]
+    # the worker that ran "fat" took no more jobs; the other one kept running
+    assert pids.count(pids[0]) == 1
+    assert pids.count(pids[1]) >= 2
+    assert engine.recycles == 1
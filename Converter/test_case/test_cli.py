@@ -0,0 +1,106 @@
+import os
+import csv
+import json
+import pytest
+
+import Converter.universal_converter as uc
+
+
+def _write_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        csv.writer(f).writerows(rows)
+    return str(path)
+
+
+@pytest.fixture(autouse=True)
+def no_input(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("non-interactive CLI must not prompt")
+    monkeypatch.setattr("builtins.input", fail)
+    monkeypatch.setattr(uc, "INTERACTIVE", True)
+
+
+@pytest.mark.quick
+def test_convert_command(tmp_path):
+    src = _write_csv(tmp_path / "in.csv", [["a", "b"], ["1", "2"]])
+    dst = str(tmp_path / "out.json")
+    assert uc.main(["convert", src, dst, "--to", "json"]) == 0
+    with open(dst, encoding="utf-8") as f:
+        assert json.load(f) == [{"a": "1", "b": "2"}]
+
+
+@pytest.mark.quick
+def test_convert_unsupported_target_fails(tmp_path):
+    src = _write_csv(tmp_path / "in.csv", [["a"]])
+    assert uc.main(["convert", src, str(tmp_path / "out.zzz"), "--to", "zzz"]) == 1
+
+
+@pytest.mark.quick
+def test_convert_dir_skips_unsupported_files(tmp_path):
+    in_dir = tmp_path / "in"
+    in_dir.mkdir()
+    _write_csv(in_dir / "x.csv", [["a", "b"], ["1", "2"]])
+    _write_csv(in_dir / "y.csv", [["c", "d"], ["3", "4"]])
+    (in_dir / "notes.md").write_text("skip me", encoding="utf-8")
+    out_dir = tmp_path / "out"
+
+    assert uc.main(["convert-dir", str(in_dir), str(out_dir), "--to", "txt"]) == 0
+    assert sorted(os.listdir(out_dir)) == ["x.txt", "y.txt"]
+
+
+@pytest.mark.quick
+def test_image_prompt_uses_default_policy(tmp_path):
+    src = _write_csv(tmp_path / "big.csv", [[str(i), "row"] for i in range(80)])
+    assert uc.main(["convert", src, str(tmp_path / "big.png"), "--to", "png"]) == 0
+    assert os.path.exists(tmp_path / "big.zip")
+    assert uc.main(["convert", src, str(tmp_path / "tall.png"), "--to", "png", "--merge"]) == 0
+    assert os.path.exists(tmp_path / "tall.png")
+
+
+@pytest.mark.quick
+def test_registry_aliases():
+    assert uc.CONVERTERS.find_key("pdf", "png") == ("pdf", "image")
+    assert uc.CONVERTERS.find_key("xls", "csv") == ("xlsx", "csv")
+    assert uc.CONVERTERS.find_key("csv", "mp3") is None
+
+
+@pytest.mark.quick
+def test_convert_dir_workers_never_prompt(tmp_path):
+    # the CLI's default --max-jobs-per-worker makes the pool spawn fresh interpreters
+    in_dir = tmp_path / "in"
+    in_dir.mkdir()
+    for name in ("a", "b"):
+        _write_csv(in_dir / f"{name}.csv", [[str(i), "row"] for i in range(80)])
+    out_dir = tmp_path / "out"
+
+    assert uc.main(["convert-dir", str(in_dir), str(out_dir), "--to", "png", "--jobs", "2"]) == 0
+    assert sorted(os.listdir(out_dir)) == ["a.zip", "b.zip"]
+
+
+@pytest.mark.quick
+def test_lang_reaches_pdf_ocr(tmp_path, monkeypatch):
+    canvas = pytest.importorskip("reportlab.pdfgen.canvas")
+    pdf = tmp_path / "scan.pdf"
+    c = canvas.Canvas(str(pdf))
+    c.showPage()   # blank → OCR'd
+    c.save()
+    langs = []
+    monkeypatch.setattr(uc, "ocr_pdf_pages",
+                        lambda path, lang, pages=None, workers=None: langs.append(lang) or ["text"])
+
+    for target in ("txt", "txt ocr"):
+        for lang, expected in (("en,hi", "eng+hin"), ("eng+jpn", "eng+jpn")):
+            assert uc.main(["convert", str(pdf), str(tmp_path / "out.txt"), "--to", target, "--lang", lang]) == 0
+            assert langs[-1] == expected
+    assert uc.main(["convert", str(pdf), str(tmp_path / "out.txt"), "--to", "txt ocr", "--lang", "auto"]) == 0
+    assert langs[-1] == "eng+hin"
+
+
+@pytest.mark.quick
+def test_script_runs_from_inside_converter_dir(tmp_path):
+    import subprocess
+    import sys
+    script = os.path.join(os.path.dirname(os.path.dirname(uc.__file__)), "Converter", "universal_converter.py")
+    proc = subprocess.run([sys.executable, script, "-h"], cwd=tmp_path, capture_output=True, text=True, timeout=120)
+    assert proc.returncode == 0, proc.stderr
+    assert "convert-dir" in proc.stdout
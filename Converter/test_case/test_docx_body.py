@@ -0,0 +1,51 @@
+import csv
+
+import pytest
+
+docx = pytest.importorskip("docx")
+
+from Converter.docx_body import Paragraph, TableRow, iter_body
+
+
+@pytest.fixture
+def report_docx(tmp_path):
+    doc = docx.Document()
+    doc.add_paragraph("Quarterly report")
+    table = doc.add_table(rows=3, cols=4)
+    for r, row in enumerate([["Region", "Sales", "Costs", "Margin"],
+                             ["North", "1200", "800", "400"],
+                             ["South", "900", "700", "200"]]):
+        for c, value in enumerate(row):
+            table.cell(r, c).text = value
+    table.cell(1, 1).add_paragraph("est.")
+    table.cell(1, 3).merge(table.cell(2, 3))
+    doc.add_paragraph("Notes\tend")
+    path = tmp_path / "report.docx"
+    doc.save(str(path))
+    return str(path)
+
+
+@pytest.mark.quick
+def test_body_streams_in_document_order(report_docx):
+    items = list(iter_body(report_docx))
+    assert items[0] == Paragraph("Quarterly report")
+    assert items[-1] == Paragraph("Notes\tend")
+    rows = [item for item in items if isinstance(item, TableRow)]
+    reference = docx.Document(report_docx).tables[0]
+    assert [row.cells for row in rows] == [[c.text for c in r.cells] for r in reference.rows]
+    assert {row.table for row in rows} == {0}
+
+
+@pytest.mark.quick
+def test_doc_converters_keep_tables_in_place(report_docx, tmp_path):
+    import Converter.universal_converter as uc
+
+    txt = uc.doc_to_txt(report_docx, str(tmp_path / "out.txt"))
+    lines = open(txt, encoding="utf-8").read().splitlines()
+    assert lines[0] == "Quarterly report"
+    assert lines[1] == "Region\tSales\tCosts\tMargin"
+    assert lines[-1] == "Notes\tend"
+
+    out = uc.doc_to_csv(report_docx, str(tmp_path / "out.csv"))
+    with open(out, encoding="utf-8-sig", newline="") as f:
+        assert list(csv.reader(f))[1] == ["North", "1200 est.", "800", "400 200"]
@@ -0,0 +1,39 @@
+import io
+
+import pytest
+
+docx = pytest.importorskip("docx")
+
+from Converter.docx_inspect import inspect_docx
+
+
+@pytest.mark.quick
+def test_inspect_matches_python_docx(tmp_path):
+    from docx.shared import Inches
+    from PIL import Image
+
+    doc = docx.Document()
+    doc.add_paragraph("hello")
+    doc.add_paragraph("नमस्ते दुनिया")
+    wide = doc.add_table(rows=3, cols=6)
+    wide.cell(0, 0).merge(wide.cell(0, 1))
+    # a nested table is part of its cell, not a table of its own
+    wide.cell(1, 2).add_table(rows=1, cols=9)
+    doc.add_table(rows=2, cols=3)
+    path = tmp_path / "plain.docx"
+    doc.save(str(path))
+
+    info = inspect_docx(str(path))
+    reference = docx.Document(str(path))
+    assert info.tables == tuple(len(t.columns) for t in reference.tables) == (6, 3)
+    assert info.max_columns == 6
+    assert info.paragraphs == len(reference.paragraphs)
+    assert info.scripts == {"LATIN", "DEVANAGARI"}
+    assert not info.has_images
+
+    png = io.BytesIO()
+    Image.new("RGB", (4, 4)).save(png, "PNG")
+    png.seek(0)
+    doc.add_picture(png, width=Inches(1))
+    doc.save(str(path))
+    assert inspect_docx(str(path)).has_images
@@ -0,0 +1,64 @@
+import os
+import shutil
+import pytest
+
+from Converter import fonts
+
+
+@pytest.fixture
+def font_dir(tmp_path, monkeypatch):
+    reportlab = pytest.importorskip("reportlab")
+    vera = os.path.join(os.path.dirname(reportlab.__file__), "fonts", "Vera.ttf")
+    shutil.copy(vera, tmp_path / "arial.ttf")
+    monkeypatch.setattr(fonts, "FONT_DIRS", [str(tmp_path)])
+    fonts.clear_font_cache()
+    yield tmp_path
+    fonts.clear_font_cache()
+
+
+@pytest.mark.quick
+def test_image_font_is_cached_per_script_and_size(font_dir):
+    first = fonts.get_image_font("LATIN", 14)
+    assert fonts.get_image_font("LATIN", 14) is first
+    assert fonts.get_image_font("LATIN", 20) is not first
+    # Same file for ARABIC (arial.ttf) → the parsed face is shared through load_font
+    assert fonts.get_image_font("ARABIC", 14) is first
+
+
+@pytest.mark.quick
+def test_font_index_is_built_once(font_dir, monkeypatch):
+    calls = []
+    real_listdir = os.listdir
+    monkeypatch.setattr(fonts.os, "listdir", lambda d: calls.append(d) or real_listdir(d))
+    for size in (10, 11, 12):
+        fonts.get_image_font("LATIN", size)
+    assert calls == [str(font_dir)]
+    assert fonts.font_path_for_script("LATIN") == os.path.join(str(font_dir), "arial.ttf")
+
+
+@pytest.mark.quick
+def test_pdf_fonts_registered_once(font_dir, monkeypatch):
+    from reportlab.pdfbase import pdfmetrics
+
+    for name in ("NotoSans-Regular.ttf", "NotoSansDevanagari-Medium.ttf"):
+        shutil.copy(font_dir / "arial.ttf", font_dir / name)
+    fonts.clear_font_cache()
+    monkeypatch.setattr(fonts, "_pdf_fonts", None)
+    calls = []
+    real_register = pdfmetrics.registerFont
+    monkeypatch.setattr(pdfmetrics, "registerFont", lambda f: calls.append(f.fontName) or real_register(f))
+
+    names = [fonts.pdf_font_for_text(line) for line in ["hello", "नमस्ते", "abc"] * 100]
+    assert names[:3] == ["NotoSans", "NotoSansDevanagari", "NotoSans"]
+    assert len(calls) <= 2
+
+
+@pytest.mark.quick
+def test_warm_fonts_is_quiet_about_missing_fonts(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(fonts, "FONT_DIRS", [str(tmp_path)])
+    fonts.clear_font_cache()
+    try:
+        fonts.warm_fonts()
+        assert capsys.readouterr().out == ""
+    finally:
+        fonts.clear_font_cache()
@@ -0,0 +1,49 @@
+import os
+import sys
+import json
+import subprocess
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Modules a plain CSV conversion must never pull in.
+HEAVY_MODULES = [
+    "torch", "easyocr", "weasyprint", "pdfplumber", "pytesseract",
+    "pypandoc", "mammoth", "deep_translator",
+]
+
+CSV_RUN = r"""
+import sys, json
+import Converter.universal_converter as uc
+uc.run_conversion("csv", "txt", sys.argv[1], sys.argv[2])
+print(json.dumps(sorted(m for m in sys.modules if m.split(".")[0] in sys.argv[3].split(","))))
+"""
+
+
+@pytest.mark.quick
+def test_csv_conversion_does_not_import_heavy_modules(tmp_path):
+    pytest.importorskip("pandas")
+    csv_file = tmp_path / "in.csv"
+    csv_file.write_text("a,b\n1,2\n", encoding="utf-8")
+    txt_file = tmp_path / "out.txt"
+
+    proc = subprocess.run(
+        [sys.executable, "-c", CSV_RUN, str(csv_file), str(txt_file), ",".join(HEAVY_MODULES)],
+        cwd=REPO_ROOT, capture_output=True, text=True, timeout=120,
+    )
+    assert proc.returncode == 0, proc.stderr
+    loaded = json.loads(proc.stdout.strip().splitlines()[-1])
+    assert loaded == [], f"CSV → TXT imported heavy modules: {loaded}"
+    assert txt_file.read_text(encoding="utf-8").startswith("a\tb")
+
+
+@pytest.mark.quick
+def test_registry_resolves_entries_lazily():
+    from Converter.registry import ConverterRegistry
+
+    reg = ConverterRegistry("os.path", {("a", "b"): "join", ("a", "c"): "json:dumps"})
+    assert ("a", "b") in reg and len(reg) == 2
+    assert reg.target_of(("a", "c")) == "json:dumps"
+    assert reg[("a", "b")] is os.path.join
+    assert reg[("a", "c")] is json.dumps
+    assert reg.get(("x", "y")) is None
@@ -0,0 +1,40 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from Converter import line_analysis
+from Converter.line_analysis import analyze_lines, line_values
+
+
+@pytest.fixture
+def fake_langid(monkeypatch):
+    calls = []
+
+    def detect_language(sample):
+        calls.append(sample)
+        return "ja" if "日本" in sample else "fr"
+
+    monkeypatch.setattr(line_analysis, "detect_language", detect_language)
+    return calls
+
+
+@pytest.mark.quick
+def test_runs_group_lines_and_detect_once_per_ambiguous_run(fake_langid):
+    lines = ["bonjour", "", "le monde", "नमस्ते", "दुनिया", "日本語です", "hello"]
+    runs = analyze_lines(lines)
+    assert [(r.start, r.stop, r.script, r.lang) for r in runs] == [
+        (0, 3, "LATIN", "fr"),
+        (3, 5, "DEVANAGARI", "hi"),   # script alone decides, no language ID
+        (5, 6, "CJK", "ja"),
+        (6, 7, "LATIN", "fr"),
+    ]
+    assert fake_langid == ["bonjour\nle monde", "日本語です", "hello"]
+
+
+@pytest.mark.quick
+def test_line_values_computes_once_per_run(fake_langid):
+    computed = []
+    values = line_values(["a"] * 1000 + ["한국어"] * 10, lambda run: computed.append(run) or run.lang,
+                         detect_scripts=())
+    assert values == ["en"] * 1000 + ["ko"] * 10
+    assert len(computed) == 2 and fake_langid == []
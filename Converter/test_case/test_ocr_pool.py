@@ -0,0 +1,65 @@
+import pytest
+
+from Converter import ocr
+from Converter.ocr import ReaderPool
+
+
+class FakeFactory:
+    def __init__(self):
+        self.loaded = []
+
+    def __call__(self, langs, gpu):
+        if "xx" in langs:
+            raise ValueError("unsupported language")
+        self.loaded.append(tuple(langs))
+        return object()
+
+
+@pytest.mark.quick
+def test_readers_are_keyed_by_language_set_and_evicted_lru():
+    factory = FakeFactory()
+    pool = ReaderPool(max_readers=2, factory=factory)
+    en_hi = pool.get(["en", "hi"])
+    assert pool.get(["hi", "en"]) is en_hi
+    pool.get(["en"])
+    pool.get(["en", "hi"])          # touch → most recently used
+    pool.get(["fr"])                # evicts ["en"]
+    assert ["en", "hi"] in pool and ["fr"] in pool and ["en"] not in pool
+    assert factory.loaded == [("en", "hi"), ("en",), ("fr",)]
+
+
+@pytest.mark.quick
+def test_failed_language_sets_are_not_retried_and_rss_cap_evicts(monkeypatch):
+    factory = FakeFactory()
+    pool = ReaderPool(max_readers=5, max_rss_mb=1, factory=factory)
+    assert pool.get(["xx"]) is None and pool.get(["xx"]) is None
+    monkeypatch.setattr(ocr, "current_rss_mb", lambda: 10.0)
+    pool.warm(["en"], ["hi"])
+    assert len(pool) == 1 and ["hi"] in pool
+
+
+@pytest.mark.quick
+def test_parallel_page_ocr_matches_serial_order(monkeypatch):
+    import os
+    import random
+    import time
+    from PIL import Image
+
+    seen_limits = set()
+
+    def render(pdf_path, pageno, dpi):
+        time.sleep(random.random() / 100)   # finish out of order
+        return Image.new("L", (1, 1), pageno)
+
+    def tesseract(img, lang, config):
+        seen_limits.add(os.environ.get("OMP_THREAD_LIMIT"))
+        return f"page {img.getpixel((0, 0))} {lang}\n"
+
+    monkeypatch.setattr(ocr, "_render_page", render)
+    monkeypatch.setattr(ocr, "_tesseract", tesseract)
+    monkeypatch.delenv("OMP_THREAD_LIMIT", raising=False)
+    pages = range(1, 41)
+    serial = ocr.ocr_pdf_pages("x.pdf", "eng", pages=pages, workers=1)
+    parallel = ocr.ocr_pdf_pages("x.pdf", "eng", pages=pages, workers=8)
+    assert parallel == serial and serial[0] == "page 1 eng\n"
+    assert "1" in seen_limits and "OMP_THREAD_LIMIT" not in os.environ
@@ -0,0 +1,225 @@
+import os
+import sys
+import time
+
+import pytest
+
+from Converter import office
+
+
+@pytest.fixture
+def fake_soffice(tmp_path):
+    """A stand-in soffice: writes <outdir>/<stem>.<fmt> and logs its arguments."""
+    script = tmp_path / "soffice"
+    script.write_text(
+        f"#!{sys.executable}\n"
+        "import os, sys\n"
+        "args = sys.argv[1:]\n"
+        "open(os.environ['FAKE_SOFFICE_LOG'], 'a').write(' '.join(args) + '\\n')\n"
+        "fmt, outdir = args[args.index('--convert-to') + 1], args[args.index('--outdir') + 1]\n"
+        "for src in args[args.index('--outdir') + 2:]:\n"
+        "    if 'broken' in src:\n"
+        "        continue\n"
+        "    stem = os.path.splitext(os.path.basename(src))[0]\n"
+        "    open(os.path.join(outdir, stem + '.' + fmt), 'w').write('converted ' + src)\n")
+    script.chmod(0o755)
+    return str(script)
+
+
+@pytest.mark.quick
+def test_subprocess_office_uses_private_profile(fake_soffice, tmp_path, monkeypatch):
+    log = tmp_path / "calls.log"
+    monkeypatch.setenv("FAKE_SOFFICE_LOG", str(log))
+    src = tmp_path / "letter.doc"
+    src.write_text("x")
+
+    (tmp_path / "out").mkdir()
+
+    with office.SubprocessOffice(soffice=fake_soffice) as lo:
+        out = lo.convert(str(src), str(tmp_path / "out" / "letter.docx"), "docx")
+        assert open(out).read() == f"converted {src}"
+        assert "-env:UserInstallation=file://" in log.read_text()
+        profile = lo.profile_dir
+        with pytest.raises(office.OfficeError, match="did not produce"):
+            lo.convert(str(tmp_path / "broken.doc"), str(tmp_path / "out" / "broken.docx"), "docx")
+    assert not os.path.exists(profile)
+
+
+class _FakeProc:
+    returncode = None
+
+    def poll(self):
+        return self.returncode
+
+    def kill(self):
+        self.returncode = -9
+
+    def wait(self, timeout=None):
+        return self.returncode
+
+
+class _FlakyDaemon(office.OfficeDaemon):
+    crash = hang = False
+
+    def start(self):
+        self._started = True
+        self._proc = _FakeProc()
+
+    def _store(self, src, out_path, fmt):
+        if self.crash:
+            self.crash = False
+            self._proc.returncode = 1          # office died mid-request
+            raise ConnectionError("bridge disposed")
+        if self.hang:
+            self.hang = False
+            time.sleep(1)
+        with open(out_path, "w") as f:
+            f.write(src)
+
+
+@pytest.mark.quick
+def test_daemon_restarts_after_crash_and_timeout(fake_soffice, tmp_path):
+    daemon = _FlakyDaemon(soffice=fake_soffice, timeout=0.2)
+    out = str(tmp_path / "a.pdf")
+
+    daemon.crash = True
+    assert daemon.convert("a.docx", out, "pdf") == out
+    assert daemon.restarts == 1
+
+    daemon.hang = True
+    with pytest.raises(office.OfficeError, match="timed out"):
+        daemon.convert("b.docx", out, "pdf")
+    assert not daemon.alive()
+    assert daemon.convert("c.docx", out, "pdf") == out
+    assert daemon.restarts == 2
+    daemon.close()
+
+
+@pytest.mark.quick
+def test_office_pool_spreads_jobs_over_isolated_profiles(fake_soffice, tmp_path, monkeypatch):
+    log = tmp_path / "calls.log"
+    monkeypatch.setenv("FAKE_SOFFICE_LOG", str(log))
+    names = ["a", "b", "broken", "c", "d", "e"]
+    for name in names:
+        (tmp_path / f"{name}.doc").write_text(name)
+    jobs = [(str(tmp_path / f"{n}.doc"), str(tmp_path / "out" / f"{n}.docx"), "docx") for n in names]
+    (tmp_path / "out").mkdir()
+
+    with office.OfficePool(3, factory=lambda: office.SubprocessOffice(soffice=fake_soffice)) as pool:
+        results = list(pool.map(jobs))
+        scratch = {o.scratch_dir for o in pool._offices}
+
+    assert [job for job, _, _ in results] == jobs
+    assert [out is not None for _, out, _ in results] == [True, True, False, True, True, True]
+    assert "did not produce" in results[2][2]
+    profiles = {line.split()[0] for line in log.read_text().splitlines()}
+    assert 1 <= len(profiles) <= 3 and len(scratch) == len(profiles)
+    assert not any(os.path.exists(d) for d in scratch)
+
+
+@pytest.mark.quick
+def test_chunks_run_many_files_per_soffice_call(fake_soffice, tmp_path, monkeypatch):
+    import shutil
+
+    log = tmp_path / "calls.log"
+    monkeypatch.setenv("FAKE_SOFFICE_LOG", str(log))
+    monkeypatch.setattr(office, "find_soffice", lambda: fake_soffice)
+    (tmp_path / "sub").mkdir()
+    srcs = []
+    for name in ("a", "b", "broken", "c", "sub/a"):
+        (tmp_path / f"{name}.doc").write_text(name)
+        srcs.append(str(tmp_path / f"{name}.doc"))
+
+    chunks = office.plan_chunks([(s, s + "x", "docx") for s in srcs] + [(srcs[0], "p", "pdf")], 10)
+    # same stem "a" twice → second chunk; pdf jobs never share a docx chunk
+    assert [[office.Path(j[0]).stem for j in c] for c in chunks] == [["a", "b", "broken", "c"], ["a"], ["a"]]
+
+    with office.OfficePrefetch() as prefetch:
+        made = prefetch.run(srcs, "docx", workers=1)
+        assert len(log.read_text().splitlines()) == 2          # two soffice runs for five files
+        assert made[srcs[2]] is None and all(made[s] for s in srcs if "broken" not in s)
+
+        prefetch.activate()
+        copy = tmp_path / "renamed.doc"
+        shutil.copyfile(srcs[1], copy)
+        out = office.office_convert(str(copy), str(tmp_path / "out" / "b.docx"), "docx")
+        assert open(out).read() == f"converted {srcs[1]}"      # served from the batch, no new run
+        assert len(log.read_text().splitlines()) == 2
+    assert office.PREFETCH_ENV not in os.environ
+
+
+def _worker_office_dirs():
+    lo = office.get_office()
+    return lo.profile_dir, lo.scratch_dir
+
+
+@pytest.mark.quick
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs the fork start method")
+def test_forked_worker_office_is_cleaned_up(fake_soffice, tmp_path, monkeypatch):
+    import multiprocessing
+    import tempfile
+    from concurrent.futures import ProcessPoolExecutor
+
+    monkeypatch.setattr(office, "find_soffice", lambda: fake_soffice)
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    # fork workers leave through os._exit(): atexit handlers never run there
+    with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("fork"),
+                             initializer=office.warm_office) as pool:
+        profile, scratch = pool.submit(_worker_office_dirs).result()
+        assert os.path.isdir(profile) and os.path.isdir(scratch)
+    assert not os.path.exists(profile) and not os.path.exists(scratch)
+
+
+@pytest.mark.quick
+def test_hung_chunk_is_cut_off_and_retried_per_file(tmp_path, monkeypatch):
+    # a stand-in soffice that hangs whenever it is given more than one file
+    script = tmp_path / "soffice"
+    script.write_text(
+        f"#!{sys.executable}\n"
+        "import os, sys, time\n"
+        "args = sys.argv[1:]\n"
+        "fmt, outdir = args[args.index('--convert-to') + 1], args[args.index('--outdir') + 1]\n"
+        "srcs = args[args.index('--outdir') + 2:]\n"
+        "if len(srcs) > 1:\n"
+        "    time.sleep(30)\n"
+        "for src in srcs:\n"
+        "    stem = os.path.splitext(os.path.basename(src))[0]\n"
+        "    open(os.path.join(outdir, stem + '.' + fmt), 'w').write('converted')\n")
+    script.chmod(0o755)
+    monkeypatch.setattr(office, "OFFICE_CHUNK_TIMEOUT", 1)
+    jobs = []
+    for name in "abc":
+        (tmp_path / f"{name}.doc").write_text("x")
+        jobs.append((str(tmp_path / f"{name}.doc"), str(tmp_path / f"{name}.docx"), "docx"))
+
+    start = time.monotonic()
+    with office.SubprocessOffice(soffice=str(script), timeout=2) as lo:
+        results = lo.convert_many(jobs)
+    # capped at max(2 s, 1 s) instead of 3 × 2 s
+    assert time.monotonic() - start < 5
+    assert [error for _, _, error in results] == [None, None, None]
+
+
+@pytest.mark.quick
+def test_prefetch_skips_documents_bound_for_the_html_path(fake_soffice, tmp_path, monkeypatch):
+    docx = pytest.importorskip("docx")
+    import Converter.universal_converter as uc
+
+    log = tmp_path / "calls.log"
+    monkeypatch.setenv("FAKE_SOFFICE_LOG", str(log))
+    monkeypatch.setattr(office, "find_soffice", lambda: fake_soffice)
+    monkeypatch.setattr(uc, "find_soffice", lambda: fake_soffice)
+    monkeypatch.setattr(uc, "uno_available", lambda: False)
+    planned = []
+    for name, cols in (("narrow", 3), ("wide", 6)):
+        doc = docx.Document()
+        doc.add_table(rows=2, cols=cols)
+        doc.save(str(tmp_path / f"{name}.docx"))
+        planned.append(("docx", "pdf", str(tmp_path / f"{name}.docx"), str(tmp_path / "out" / f"{name}.pdf")))
+
+    prefetch = uc._office_prefetch(planned, workers=1)
+    try:
+        runs = log.read_text().splitlines()
+        assert len(runs) == 1 and "narrow.docx" in runs[0] and "wide.docx" not in runs[0]
+    finally:
+        prefetch.close()
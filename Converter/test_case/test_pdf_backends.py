@@ -0,0 +1,41 @@
+import pytest
+
+pytest.importorskip("pdfplumber")
+canvas = pytest.importorskip("reportlab.pdfgen.canvas")
+
+from Converter import pdf_backends
+
+
+@pytest.fixture
+def two_page_pdf(tmp_path):
+    path = tmp_path / "text.pdf"
+    c = canvas.Canvas(str(path))
+    for line in range(30):
+        c.drawString(40, 800 - 18 * line, f"line {line} of page one")
+    c.showPage()
+    c.drawString(40, 800, "page two")
+    c.save()
+    return str(path)
+
+
+@pytest.mark.quick
+@pytest.mark.parametrize("engine", sorted(pdf_backends.TEXT_ENGINES))
+def test_text_engines_agree_on_simple_pages(two_page_pdf, engine):
+    pages = list(pdf_backends.iter_page_texts(two_page_pdf, engine))
+    assert [p.number for p in pages] == [1, 2]
+    assert pages[0].text.splitlines()[:2] == ["line 0 of page one", "line 1 of page one"]
+    assert pages[1].text.strip() == "page two"
+    assert round(pages[0].width) == 595 and round(pages[0].height) == 842
+
+
+@pytest.mark.quick
+def test_pdfminer_engine_matches_pdfplumber_and_benchmark_runs(two_page_pdf, capsys):
+    fast = [p.text for p in pdf_backends.iter_page_texts(two_page_pdf, "pdfminer")]
+    assert fast == [p.text for p in pdf_backends.iter_page_texts(two_page_pdf, "pdfplumber")]
+
+    with pytest.raises(ValueError, match="unknown PDF engine"):
+        pdf_backends.iter_page_texts(two_page_pdf, "nope")
+
+    assert pdf_backends.main([two_page_pdf, "--engines", "pdfminer,pdfplumber"]) == 0
+    rows = capsys.readouterr().out.splitlines()
+    assert [r.split()[0] for r in rows] == ["engine", "pdfminer", "pdfplumber"]
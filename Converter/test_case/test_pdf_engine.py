@@ -0,0 +1,120 @@
+import pytest
+
+pytest.importorskip("pdfplumber")
+canvas = pytest.importorskip("reportlab.pdfgen.canvas")
+
+from Converter import pdf_engine
+from Converter.pdf_engine import PageEngine
+
+
+def page_number_and_first_line(page):
+    return page.page_number, (page.extract_text() or "").splitlines()[:1]
+
+
+@pytest.fixture
+def table_pdf(tmp_path):
+    path = tmp_path / "table.pdf"
+    c = canvas.Canvas(str(path))
+    for pageno in range(1, 8):
+        for row in range(5):
+            c.drawString(40, 800 - 16 * row, f"p{pageno},r{row},v{pageno * row}")
+        c.showPage()
+    c.save()
+    return str(path)
+
+
+@pytest.mark.quick
+def test_parallel_engine_returns_pages_in_order(table_pdf):
+    serial = list(PageEngine(page_number_and_first_line, workers=1, pages_per_task=2).run(table_pdf))
+    parallel = list(PageEngine(page_number_and_first_line, workers=3, pages_per_task=2).run(table_pdf))
+    assert parallel == serial
+    assert [n for n, _ in serial] == list(range(1, 8))
+    assert serial[0][1] == (1, ["p1,r0,v0"])
+
+
+@pytest.mark.quick
+def test_pdf_to_csv_is_identical_with_page_workers(table_pdf, tmp_path, monkeypatch):
+    import Converter.universal_converter as uc
+
+    monkeypatch.setattr(pdf_engine, "PAGES_PER_TASK", 2)
+    outputs = []
+    for workers in (1, 3):
+        out = tmp_path / f"out_{workers}.csv"
+        result = uc.pdf_to_csv(table_pdf, csv_path=str(out), csv_delimiter=",", page_workers=workers)
+        assert result["rows"] == 35
+        outputs.append(out.read_text(encoding="utf-8-sig"))
+    assert outputs[0] == outputs[1]
+    assert outputs[0].splitlines()[:2] == ["p1,r0,v0", "p1,r1,v1"]
+
+
+@pytest.mark.quick
+def test_pages_are_released_and_memory_ceiling_raises(table_pdf, monkeypatch):
+    from pdfplumber.page import Page
+
+    events = []
+    real_close = Page.close
+    monkeypatch.setattr(Page, "close", lambda self: events.append(("close", self.page_number)) or real_close(self))
+
+    def extract(page):
+        events.append(("extract", page.page_number))
+
+    list(PageEngine(extract, workers=1, pages_per_task=3).run(table_pdf, page_count=7))
+    # each page is released before the next one is parsed
+    assert events[:4] == [("extract", 1), ("close", 1), ("extract", 2), ("close", 2)]
+
+    with pytest.raises(pdf_engine.MemoryLimitError, match="memory limit exceeded at page 1"):
+        list(PageEngine(page_number_and_first_line, workers=1, max_rss_mb=1).run(table_pdf))
+
+
+@pytest.mark.quick
+def test_pdf_to_csv_resumes_from_checkpoint(table_pdf, tmp_path, monkeypatch):
+    import os
+    import Converter.universal_converter as uc
+    from openpyxl import load_workbook
+
+    full = uc.pdf_to_csv(table_pdf, csv_path=str(tmp_path / "full.csv"), csv_delimiter=",")
+    expected = (tmp_path / "full.csv").read_text(encoding="utf-8-sig")
+
+    real_extract = uc.extract_pages
+    def crash_on_page_6(*args, **kwargs):
+        for pageno, rows in real_extract(*args, **kwargs):
+            if pageno == 6:
+                raise OSError("node preempted")
+            yield pageno, rows
+
+    out, xlsx = tmp_path / "out.csv", tmp_path / "out.xlsx"
+    monkeypatch.setattr(uc, "extract_pages", crash_on_page_6)
+    with pytest.raises(RuntimeError, match="node preempted"):
+        uc.pdf_to_csv(table_pdf, csv_path=str(out), xlsx_path=str(xlsx), csv_delimiter=",",
+                      resume=True, checkpoint_every=2)
+    assert os.path.exists(f"{out}.checkpoint.json") and not xlsx.exists()
+
+    started = []
+    def record_start(*args, **kwargs):
+        started.append(kwargs["first_page"])
+        return real_extract(*args, **kwargs)
+    monkeypatch.setattr(uc, "extract_pages", record_start)
+    result = uc.pdf_to_csv(table_pdf, csv_path=str(out), xlsx_path=str(xlsx), csv_delimiter=",",
+                           resume=True, checkpoint_every=2)
+
+    assert started == [5]            # page 4 was the last checkpoint, page 5 is redone
+    assert result["rows"] == full["rows"] == 35
+    assert out.read_text(encoding="utf-8-sig") == expected
+    assert load_workbook(str(xlsx)).active.max_row == 35
+    assert not os.path.exists(f"{out}.checkpoint.json") and not os.path.exists(f"{xlsx}.rows.jsonl")
+
+
+@pytest.mark.quick
+def test_pdf_to_json_streams_array_and_ndjson(table_pdf, tmp_path):
+    import json
+    import Converter.universal_converter as uc
+
+    out = tmp_path / "out.json"
+    assert uc.pdf_to_json(table_pdf, str(out)) == str(out)
+    pages = json.loads(out.read_text(encoding="utf-8"))
+    assert [p["page"] for p in pages] == list(range(1, 8))
+    assert out.read_text(encoding="utf-8") == json.dumps(pages, ensure_ascii=False, indent=2)
+
+    nd = tmp_path / "out.ndjson"
+    assert uc.pdf_to_json(table_pdf, str(nd)) == str(nd)
+    assert [json.loads(line) for line in nd.read_text(encoding="utf-8").splitlines()] == pages
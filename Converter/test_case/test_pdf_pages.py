@@ -0,0 +1,158 @@
+import pytest
+
+from Converter.pdf_pages import text_layer_stats, has_usable_text
+
+
+@pytest.mark.quick
+def test_text_layer_stats_flag_sparse_and_garbled_pages():
+    letter = (612, 792)
+    assert has_usable_text(text_layer_stats("Some real words. " * 20, *letter))
+    assert not has_usable_text(text_layer_stats("", *letter))
+    assert not has_usable_text(text_layer_stats("(cid:12)(cid:7)(cid:9) " * 40, *letter))
+
+
+@pytest.mark.quick
+def test_pdf_to_txt_only_ocrs_pages_without_text(tmp_path, monkeypatch):
+    pytest.importorskip("pdfplumber")
+    canvas = pytest.importorskip("reportlab.pdfgen.canvas")
+    import Converter.universal_converter as uc
+
+    pdf = tmp_path / "mixed.pdf"
+    c = canvas.Canvas(str(pdf))
+    for line in range(40):
+        c.drawString(40, 800 - 18 * line, f"digital line {line} of the first page")
+    c.showPage()
+    c.showPage()   # blank → "scanned"
+    c.save()
+
+    calls = []
+    def fake_ocr(pdf_path, lang, pages=None, workers=None):
+        calls.append(list(pages))
+        return [f"ocr page {p}\n" for p in pages]
+    monkeypatch.setattr(uc, "ocr_pdf_pages", fake_ocr)
+
+    out = tmp_path / "out.txt"
+    assert uc.pdf_to_txt(str(pdf), str(out)) == str(out)
+    text = out.read_text(encoding="utf-8")
+    assert calls == [[2]]
+    assert text.startswith("digital line 0") and text.endswith("ocr page 2")
+
+    assert uc.pdf_to_txt(str(pdf), str(out), force_ocr=True) == str(out)
+    assert calls[-1] == [1, 2]
+    assert out.read_text(encoding="utf-8") == "ocr page 1\n\nocr page 2"
+
+
+@pytest.mark.quick
+def test_page_analysis_parses_text_and_tables_once(tmp_path, monkeypatch):
+    pytest.importorskip("pdfplumber")
+    canvas = pytest.importorskip("reportlab.pdfgen.canvas")
+    import pdfplumber
+    from pdfplumber.page import Page
+    from Converter.pdf_pages import PageAnalysis
+    from Converter.pdf_extract import page_record, table_rows
+
+    pdf = tmp_path / "prose.pdf"
+    c = canvas.Canvas(str(pdf))
+    c.drawString(40, 800, "a,b,c")
+    c.drawString(40, 780, "1,2,3")
+    c.save()
+
+    calls = []
+    for name in ("extract_text", "find_tables"):
+        real = getattr(Page, name)
+        monkeypatch.setattr(Page, name, lambda self, *a, _n=name, _f=real, **k: calls.append(_n) or _f(self, *a, **k))
+
+    with pdfplumber.open(str(pdf)) as doc:
+        analysis = PageAnalysis(doc.pages[0])
+        assert page_record(analysis) == {"page": 1, "text": "a,b,c\n1,2,3"}
+        # no ruled table → falls back to the (already extracted) text lines
+        assert table_rows(analysis) == [["a", "b", "c"], ["1", "2", "3"]]
+    assert sorted(calls) == ["extract_text", "find_tables"]
+
+
+@pytest.mark.quick
+def test_pdf_to_csv_skips_prose_pages_before_table_extraction(tmp_path):
+    pytest.importorskip("pdfplumber")
+    canvas = pytest.importorskip("reportlab.pdfgen.canvas")
+    import Converter.universal_converter as uc
+
+    pdf = tmp_path / "report.pdf"
+    c = canvas.Canvas(str(pdf))
+    for line in range(30):   # prose, commas included
+        c.drawString(40, 800 - 16 * line, "Prose, with a comma or two, keeps going" + ", and on" * (line % 3))
+    c.showPage()
+    for row in range(3):     # ruled 3x2 grid
+        for col in range(2):
+            c.rect(40 + 100 * col, 700 - 20 * row, 100, 20)
+            c.drawString(45 + 100 * col, 706 - 20 * row, f"r{row}c{col}")
+    c.showPage()
+    for row in range(4):     # delimited rows
+        c.drawString(40, 800 - 16 * row, f"id{row},name{row},{row * 10}")
+    c.save()
+
+    out = tmp_path / "out.csv"
+    result = uc.pdf_to_csv(str(pdf), csv_path=str(out), csv_delimiter=",")
+    assert result["skipped_pages"] == [1]
+    assert result["rows"] == 7
+    lines = out.read_text(encoding="utf-8-sig").splitlines()
+    assert lines[0] == "r0c0,r0c1" and lines[-1] == "id3,name3,30"
+
+
+@pytest.mark.quick
+def test_docx_content_takes_images_from_their_streams(tmp_path, monkeypatch):
+    pytest.importorskip("pdfplumber")
+    canvas = pytest.importorskip("reportlab.pdfgen.canvas")
+    import io
+    import pdfplumber
+    from PIL import Image
+    from Converter.pdf_pages import PageAnalysis
+    from Converter.pdf_extract import docx_content
+
+    jpg, png, alpha = tmp_path / "a.jpg", tmp_path / "b.png", tmp_path / "c.png"
+    Image.new("RGB", (50, 30), (255, 0, 0)).save(jpg)
+    blue = Image.new("RGB", (40, 20), (0, 0, 255))
+    blue.putpixel((0, 0), (1, 2, 3))
+    blue.save(png)
+    Image.new("RGBA", (10, 10), (0, 255, 0, 128)).save(alpha)
+    pdf = tmp_path / "images.pdf"
+    c = canvas.Canvas(str(pdf))
+    c.drawImage(str(jpg), 100, 500, 100, 60)
+    c.drawImage(str(png), 300, 200, 80, 40)
+    c.drawImage(str(alpha), 300, 400, 20, 20, mask="auto")   # soft mask → rendered
+    c.save()
+
+    rendered = []
+    monkeypatch.setattr(PageAnalysis, "crop_image",
+                        lambda self, bbox, res=150: rendered.append(bbox) or Image.new("RGB", (5, 5)))
+    with pdfplumber.open(str(pdf)) as doc:
+        _, images = docx_content(doc.pages[0])
+
+    assert images[0] == jpg.read_bytes()          # JPEG stream passed through untouched
+    with Image.open(io.BytesIO(images[1])) as im:
+        assert im.size == (40, 20) and im.getpixel((0, 0)) == (1, 2, 3)
+    assert len(rendered) == 1 and len(images) == 3
+
+
+@pytest.mark.quick
+def test_page_analysis_tables_split_text_packed_against_cell_borders(tmp_path):
+    pytest.importorskip("pdfplumber")
+    canvas = pytest.importorskip("reportlab.pdfgen.canvas")
+    import pdfplumber
+    from Converter.pdf_pages import PageAnalysis
+
+    pdf = tmp_path / "tight.pdf"
+    c = canvas.Canvas(str(pdf))
+    for row, (left, right) in enumerate([("Item", "Amount"), ("Total0", "099")]):
+        top = 700 - 20 * row
+        c.rect(40, top, 100, 20)
+        c.rect(140, top, 100, 20)
+        # right-aligned flush to the shared border, next cell starting right after it
+        c.drawRightString(139.5, top + 6, left)
+        c.drawString(140.5, top + 6, right)
+    c.save()
+
+    with pdfplumber.open(str(pdf)) as doc:
+        page = doc.pages[0]
+        expected = page.extract_tables()
+        assert expected[0][1] == ["Total0", "099"]
+        assert PageAnalysis(page).tables == expected
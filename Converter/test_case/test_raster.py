@@ -0,0 +1,33 @@
+import pytest
+from PIL import Image
+
+from Converter import raster
+
+
+@pytest.fixture
+def fake_pdf(monkeypatch):
+    calls = []
+
+    def render_pages(pdf_path, first_page, last_page, dpi=200, **kwargs):
+        calls.append((first_page, last_page))
+        return [Image.new("L", (20, 30), n) for n in range(first_page, last_page + 1)]
+
+    monkeypatch.setattr(raster, "pdf_page_count", lambda pdf_path: 7)
+    monkeypatch.setattr(raster, "render_pages", render_pages)
+    return calls
+
+
+@pytest.mark.quick
+def test_pages_are_rendered_in_windows_and_yielded_in_order(fake_pdf):
+    pages = [(n, img.getpixel((0, 0))) for n, img in raster.iter_pdf_pages("x.pdf", window=3)]
+    assert pages == [(n, n) for n in range(1, 8)]
+    assert fake_pdf == [(1, 3), (4, 6), (7, 7)]
+
+
+@pytest.mark.quick
+def test_rasterize_to_pdf_appends_page_by_page(fake_pdf, tmp_path):
+    pdfplumber = pytest.importorskip("pdfplumber")
+    out = tmp_path / "out.pdf"
+    assert raster.rasterize_to_pdf("x.pdf", str(out), window=2) == 7
+    with pdfplumber.open(str(out)) as pdf:
+        assert len(pdf.pages) == 7
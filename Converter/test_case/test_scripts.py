@@ -0,0 +1,35 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from Converter.scripts import classify_scripts, script_of
+
+
+@pytest.mark.quick
+def test_classify_batch_matches_first_non_latin_character():
+    texts = ["plain", "नमस्ते world", "abc 日本", "カタカナ", "한국어", "مرحبا", "Ελληνικά", "café", "", None]
+    labels, hist = classify_scripts(texts)
+    assert labels == ["LATIN", "DEVANAGARI", "CJK", "CJK", "HANGUL", "ARABIC", "GREEK", "OTHER", "LATIN", "LATIN"]
+    assert hist["KANA"] == 4 and hist["HANGUL"] == 3 and hist["OTHER"] == 1
+    assert [script_of(t) for t in texts[:8]] == labels[:8]
+
+
+@pytest.mark.quick
+def test_classify_ascii_fast_path_and_merge():
+    labels, hist = classify_scripts(["a", "bc"])
+    assert labels == ["LATIN", "LATIN"] and hist["LATIN"] == 3
+    assert classify_scripts(["ひらがな"], merge=None)[0] == ["KANA"]
+
+
+
+@pytest.mark.quick
+def test_detect_scripts_ignores_non_ascii_whitespace(tmp_path):
+    import Converter.universal_converter as uc
+    from Converter import txt_converters
+
+    path = tmp_path / "nbsp.txt"
+    path.write_text("Total:\u00a0100\u3000units\nनमस्ते दुनिया\n", encoding="utf-8")
+    for detect in (uc._detect_non_english_and_scripts, txt_converters._detect_non_english_and_scripts):
+        assert detect(str(path))[3] == {"Devanagari"}
+    path.write_text("Total:\u00a0100 units\n", encoding="utf-8")
+    assert uc._detect_non_english_and_scripts(str(path))[3] == set()
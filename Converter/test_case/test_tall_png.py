@@ -0,0 +1,65 @@
+import pytest
+from PIL import Image
+
+from Converter import tall_png
+from Converter.tall_png import write_tall_png
+
+
+@pytest.mark.quick
+def test_streamed_png_matches_pasted_canvas(tmp_path, monkeypatch):
+    monkeypatch.setattr(tall_png, "IDAT_CHUNK_SIZE", 1000)   # force several IDAT chunks
+    pages = [Image.new("RGB", (40, 25), (10 * i, 0, 0)) for i in range(1, 4)]
+    pages.append(Image.new("L", (30, 7), 128))               # narrower, grayscale
+
+    expected = Image.new("RGB", (40, 82), "white")
+    y = 0
+    for page in pages:
+        expected.paste(page.convert("RGB"), (0, y))
+        y += page.height
+
+    out = tmp_path / "tall.png"
+    assert write_tall_png([p.copy() for p in pages], str(out), 40) == (40, 82)
+    with Image.open(out) as img:
+        assert img.size == (40, 82) and img.mode == "RGB"
+        assert img.tobytes() == expected.tobytes()
+
+
+@pytest.mark.quick
+def test_merge_pdf_pages_uses_page_box_width(tmp_path, monkeypatch):
+    canvas = pytest.importorskip("reportlab.pdfgen.canvas")
+    from Converter import raster
+
+    pdf = tmp_path / "in.pdf"
+    c = canvas.Canvas(str(pdf), pagesize=(72, 144))
+    c.showPage()
+    c.setPageSize((144, 72))
+    c.showPage()
+    c.save()
+    assert raster.pdf_page_pixel_widths(str(pdf), dpi=100) == [100, 200]
+
+    monkeypatch.setattr(raster, "pdf_page_count", lambda path: 2)
+    monkeypatch.setattr(raster, "render_pages", lambda path, a, b, dpi=200, **kw: [
+        Image.new("RGB", (100, 200)), Image.new("RGB", (200, 100))][a - 1:b])
+    assert raster.merge_pdf_pages(str(pdf), str(tmp_path / "m.png"), dpi=100) == (200, 300)
+
+
+@pytest.mark.quick
+def test_merge_width_follows_the_box_the_renderer_draws(tmp_path, monkeypatch):
+    canvas = pytest.importorskip("reportlab.pdfgen.canvas")
+    pytest.importorskip("pypdfium2")
+    from Converter import pdf_backends, raster
+
+    pdf = tmp_path / "cropped.pdf"
+    c = canvas.Canvas(str(pdf), pagesize=(144, 144))
+    c.setCropBox((0, 0, 72, 144))
+    c.showPage()
+    c.save()
+
+    monkeypatch.setattr(pdf_backends, "RASTER_ENGINE", "pdf2image")
+    assert raster.pdf_page_pixel_widths(str(pdf), dpi=100) == [200]   # pdftoppm: MediaBox
+
+    monkeypatch.setattr(pdf_backends, "RASTER_ENGINE", "pdfium")
+    assert raster.pdf_page_pixel_widths(str(pdf), dpi=100) == [100]   # pdfium: CropBox
+    assert raster.merge_pdf_pages(str(pdf), str(tmp_path / "m.png"), dpi=100) == (100, 200)
+    with Image.open(tmp_path / "m.png") as img:
+        assert img.size == (100, 200)
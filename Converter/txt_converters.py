@@ -31,6 +31,16 @@ from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet
 from langdetect import detect
 import regex  # better than re for Unicode script detection
+try:
+    from Converter.scripts import script_histogram
+    from Converter.line_analysis import analyze_lines, line_values
+except ImportError:  # run as a script from inside Converter/
+    from scripts import script_histogram
+    from line_analysis import analyze_lines, line_values
+try:
+    from Converter.fonts import load_font, register_pdf_fonts, pdf_font_for_text
+except ImportError:  # run as a script from inside Converter/
+    from fonts import load_font, register_pdf_fonts, pdf_font_for_text
 
 # For Colab file handling
 try:
@@ -42,21 +52,13 @@ except ImportError:
 PAGE_W, PAGE_H = A4
 
 def detect_script(text):
-    """Detect script of a line and return font name."""
-    # Register multiple fonts
-    pdfmetrics.registerFont(TTFont("NotoSans", "/content/NotoSans-Regular.ttf")) #Add Local path of font
-    pdfmetrics.registerFont(TTFont("NotoSansDevanagari", "/content/NotoSansDevanagari-Medium.ttf")) #Add Local path of font
-
-    if regex.search(r'\p{Devanagari}', text):
-        return "NotoSansDevanagari"
-    return "NotoSans"  # default English font
+    """Detect script of a line and return the (already registered) font name."""
+    return pdf_font_for_text(text)
 
 def txt_to_pdf(txt_path, pdf_path, font_size=12, margin=40, line_gap=16):
-    # Register multiple fonts
-    pdfmetrics.registerFont(TTFont("NotoSans", "/content/NotoSans-Regular.ttf")) #Add Local path of font
-    pdfmetrics.registerFont(TTFont("NotoSansDevanagari", "/content/NotoSansDevanagari-Medium.ttf")) #Add Local path of font
-
     try:
+        # Register fonts once per process (fonts.py); per-line lookups are cheap
+        register_pdf_fonts()
         c = canvas.Canvas(pdf_path, pagesize=A4)
 
         y = PAGE_H - margin
@@ -93,13 +95,16 @@ def txt_to_pdf(txt_path, pdf_path, font_size=12, margin=40, line_gap=16):
 
 def txt_to_doc(input_file, output_file):
     with open(input_file, "r", encoding="utf-8", errors="ignore") as f:
-        text = f.read()
+        lines = f.read().splitlines()
 
-    # ✅ Detect language
-    try:
-        language = detect(text)
-    except:
-        language = "en"
+    # ✅ Detect language once per run of same-script lines
+    runs = analyze_lines(lines)
+    line_langs = [None] * len(lines)
+    lang_lines = {}
+    for run in runs:
+        line_langs[run.start:run.stop] = [run.lang] * (run.stop - run.start)
+        lang_lines[run.lang] = lang_lines.get(run.lang, 0) + run.stop - run.start
+    language = max(lang_lines, key=lang_lines.get) if lang_lines else "en"
 
     # ✅ Font mapping by language
     font_map = {
@@ -144,12 +149,13 @@ def txt_to_doc(input_file, output_file):
     style.font.name = chosen_font
     style.font.size = Pt(12)
 
-    for line in text.splitlines():
+    for line, lang in zip(lines, line_langs):
         if line.strip():  # skip blank lines
+                line_font = font_map.get(lang, "Noto Sans")
                 p = doc.add_paragraph(line.strip())
                 r = p.runs[0]
-                r.font.name = chosen_font
-                r._element.rPr.rFonts.set(qn('w:eastAsia'), chosen_font)
+                r.font.name = line_font
+                r._element.rPr.rFonts.set(qn('w:eastAsia'), line_font)
 
     doc.save(output_file)
     print(f"✅ Saved {output_file} with font '{chosen_font}' (detected lang: {language})")
@@ -163,22 +169,17 @@ def txt_to_doc(input_file, output_file):
               f"manually set the font in MS Word to '{chosen_font}' for proper display.")
 
 #---------------- Font Detection ------------------
-def get_font_for_line(line, font_size):
-    # font mapping by language
-    FONT_MAP = {
-        "hi": "/content/NotoSansDevanagari-Medium.ttf",  # Hindi
-        "en": "/content/NotoSans-Regular.ttf",           # English
-        "zh-cn": "/content/NotoSansSC-Regular.ttf",      # Simplified Chinese
-        "ja": "/content/NotoSansJP-Regular.ttf",         # Japanese
-        "ko": "/content/NotoSansKR-Regular.ttf",         # Korean
-        "default": "/content/NotoSans-Regular.ttf"       # fallback
-    }
-
-    try:
-        lang = detect(line) if line.strip() else "en"
-    except:
-        lang = "en"
-
+# font mapping by language
+FONT_MAP = {
+    "hi": "/content/NotoSansDevanagari-Medium.ttf",  # Hindi
+    "en": "/content/NotoSans-Regular.ttf",           # English
+    "zh-cn": "/content/NotoSansSC-Regular.ttf",      # Simplified Chinese
+    "ja": "/content/NotoSansJP-Regular.ttf",         # Japanese
+    "ko": "/content/NotoSansKR-Regular.ttf",         # Korean
+    "default": "/content/NotoSans-Regular.ttf"       # fallback
+}
+
+def _font_for_lang(lang, font_size):
     # normalize
     if lang.startswith("zh"):
         lang = "zh-cn"
@@ -195,7 +196,16 @@ def get_font_for_line(line, font_size):
     if not os.path.exists(font_path):  # fallback if missing
         font_path = FONT_MAP["default"]
 
-    return ImageFont.truetype(font_path, font_size)
+    return load_font(font_path, font_size)
+
+def get_font_for_line(line, font_size):
+    # only Han text needs language ID here (Chinese vs Japanese font)
+    run = analyze_lines([line], detect_scripts=("CJK",))[0]
+    return _font_for_lang(run.lang, font_size)
+
+def fonts_for_lines(lines, font_size):
+    """One font per line, chosen once per run of same-script lines."""
+    return line_values(lines, lambda run: _font_for_lang(run.lang, font_size), detect_scripts=("CJK",))
 
 
 #---------------- TXT to Image ------------------
@@ -227,8 +237,7 @@ def txt_to_image(txt_path, output_dir, font_size=24, width=1240, height=1754,
             draw = ImageDraw.Draw(img)
 
             y = margin
-            for line in lines:
-                font = get_font_for_line(line, font_size)
+            for line, font in zip(lines, fonts_for_lines(lines, font_size)):
                 draw.text((margin, y), line.strip(), fill="black", font=font)
                 y += line_height
 
@@ -239,14 +248,15 @@ def txt_to_image(txt_path, output_dir, font_size=24, width=1240, height=1754,
         else:
             # Option 2: Split into multiple images
             chunks = [lines[i:i+max_lines_per_img] for i in range(0, len(lines), max_lines_per_img)]
+            fonts = fonts_for_lines(lines, font_size)
 
             for idx, chunk in enumerate(chunks, start=1):
                 img = Image.new("RGB", (width, height), "white")
                 draw = ImageDraw.Draw(img)
 
                 y = margin
-                for line in chunk:
-                    font = get_font_for_line(line, font_size)
+                first = (idx - 1) * max_lines_per_img
+                for line, font in zip(chunk, fonts[first:first + len(chunk)]):
                     draw.text((margin, y), line.strip(), fill="black", font=font)
                     y += line_height
 
@@ -314,7 +324,7 @@ def _detect_non_english_and_scripts(txt_path, max_chars=10000):
             if len(text_sample) >= max_chars:
                 break
 
-    has_non_ascii = any(ord(ch) > 127 for ch in text_sample)
+    has_non_ascii = not text_sample.isascii()
     top_langs = []
     non_english = False
 
@@ -334,21 +344,12 @@ def _detect_non_english_and_scripts(txt_path, max_chars=10000):
         non_english = has_non_ascii
 
     # simple script heuristics (return set like {'Devanagari','CJK','Arabic',...})
-    scripts = set()
-    for ch in text_sample[:2000]:
-        cp = ord(ch)
-        if 0x0900 <= cp <= 0x097F:
-            scripts.add("Devanagari")
-        elif 0x4E00 <= cp <= 0x9FFF:
-            scripts.add("CJK")
-        elif 0x3040 <= cp <= 0x30FF:
-            scripts.add("Japanese")
-        elif 0xAC00 <= cp <= 0xD7AF:
-            scripts.add("Hangul")
-        elif 0x0600 <= cp <= 0x06FF:
-            scripts.add("Arabic")
-        elif cp > 127 and not ch.isspace():
-            scripts.add("OtherNonASCII")
+    names = {"DEVANAGARI": "Devanagari", "CJK": "CJK", "KANA": "Japanese",
+             "HANGUL": "Hangul", "ARABIC": "Arabic"}
+    scripts = {names.get(label, "OtherNonASCII")
+               # whitespace (NBSP, ideographic space, ...) belongs to no script
+               for label, count in script_histogram("".join(text_sample[:2000].split())).items()
+               if count and label != "LATIN"}
 
     return non_english, top_langs, has_non_ascii, scripts
 
@@ -10,64 +10,87 @@ import threading
 import textwrap
 import zipfile
 import shutil
-from io import StringIO
+import tempfile
+import re
 import math
 import io
 import unicodedata
 import uuid
-import ijson
-import unicodedata # Import unicodedata for script detection
-import shutil
 import subprocess
 import platform
 import pathlib
-import stat, requests, glob
+import stat, glob
+import importlib.util
+import inspect
+import functools
+from typing import List, Union, Optional
+
+from PIL import Image, ImageDraw, ImageFont, ImageEnhance, ImageFilter
+from reportlab.lib.pagesizes import A4
+
+# `python Converter/universal_converter.py` puts Converter/ itself on sys.path;
+# make the Converter package importable from the directory that holds it.
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if not __package__ and os.path.basename(_HERE) == "Converter":
+    sys.path.insert(0, os.path.dirname(_HERE))
 
 # Third-party libs
-import langid
-import pytesseract
-import pdfplumber
-import unicodedata
-import pandas as pd
-import pdfkit
-import pypandoc
-import mammoth
-from tqdm import tqdm
-import langid
-from weasyprint import HTML
-from docx import Document
-from docx.shared import Pt
-from docx.oxml.ns import qn
-import easyocr # Import easyocr
-from typing import List, Union, Optional
-from langdetect import detect
-from docx.shared import Inches
-from docx.oxml import OxmlElement
-from openpyxl.styles import Font
-from reportlab.pdfgen import canvas
-from reportlab.lib import colors
-from reportlab.lib.units import cm
-from pdf2image import convert_from_path
-from reportlab.platypus import Spacer
-from reportlab.pdfbase import pdfmetrics
-from deep_translator import GoogleTranslator
-from reportlab.lib.utils import simpleSplit
-from openpyxl import Workbook, load_workbook
-from docx import Document as DocxReader
-from reportlab.platypus import Paragraph
-from PIL import Image, ImageEnhance, ImageFilter
-from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.lib.pagesizes import A4, letter
-from reportlab.pdfgen import canvas as rl_canvas
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.pdfbase.cidfonts import UnicodeCIDFont
-from pdfminer.high_level import extract_text as pdf_extract_text
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Preformatted, Image as RLImage
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from langdetect import detect
-import regex  # better than re for Unicode script detection
-import easyocr # Import easyocr
-from PyPDF2 import PdfMerger # Removed convert_from_path from this import
+# Heavy libraries are imported on first use (see Converter/lazy.py), so e.g. a
+# CSV → TXT run never pays for torch/easyocr, weasyprint or pdfplumber.
+from Converter.lazy import lazy_import
+from Converter.registry import ConverterRegistry
+# Script → font mapping (FALLBACK_FONTS) and the process-wide font cache
+from Converter.fonts import FALLBACK_FONTS, get_image_font, load_font, register_pdf_fonts, pdf_font_for_text
+# Batch (NumPy) Unicode script classification
+from Converter.scripts import classify_scripts, script_of, script_histogram
+# Per-run (not per-line) script + language analysis for TXT → image / DOCX fonts
+from Converter.line_analysis import analyze_lines, line_values
+# LRU pool of EasyOCR readers keyed by language set
+from Converter.ocr import get_reader, warm_readers, ocr_pdf_pages
+# LibreOffice daemon (UNO) / subprocess fallback for every DOC/DOCX conversion
+from Converter.office import office_convert, OfficePrefetch, find_soffice, uno_available
+# One-pass DOCX inspection (table widths, images, scripts) without building the python-docx DOM
+from Converter.docx_inspect import inspect_docx
+# Streaming DOCX body reader: paragraphs and table rows in document order
+from Converter.docx_body import iter_body, iter_tables, TableRow
+# Text/raster backends: pdfminer, pypdf or pdfplumber for plain text; poppler or pdfium for pages
+from Converter.pdf_backends import iter_page_texts, TEXT_ENGINES
+# Page-at-a-time rasterization (bounded memory for long PDFs)
+from Converter.raster import pdf_page_count, render_page, iter_pdf_pages, save_pages, rasterize_to_pdf, merge_pdf_pages
+# Text-layer quality check: which PDF pages actually need OCR
+from Converter.pdf_pages import has_usable_text, text_layer_stats
+# Page-parallel pdfplumber extraction (page ranges on worker processes, results in page order)
+from Converter.pdf_engine import extract_pages, pdf_page_total
+from Converter.pdf_extract import table_rows
+# Checkpoints for resumable PDF → CSV runs
+from Converter.checkpoint import (Checkpoint, RowSpool, source_stamp, synced_size, truncate_to,
+                                  CHECKPOINT_EVERY, CHECKPOINT_MIN_PAGES)
+# Incremental JSON array / NDJSON writers (PDF → JSON in constant memory)
+from Converter.json_stream import write_json_records
+
+ijson = lazy_import("ijson")
+langid = lazy_import("langid")
+regex = lazy_import("regex")  # better than re for Unicode script detection
+pytesseract = lazy_import("pytesseract")
+pdfplumber = lazy_import("pdfplumber")
+pd = lazy_import("pandas")
+pdfkit = lazy_import("pdfkit")
+pypandoc = lazy_import("pypandoc")
+mammoth = lazy_import("mammoth")
+HTML = lazy_import("weasyprint", "HTML")
+Document = lazy_import("docx", "Document")
+Pt = lazy_import("docx.shared", "Pt")
+Inches = lazy_import("docx.shared", "Inches")
+qn = lazy_import("docx.oxml.ns", "qn")
+Workbook = lazy_import("openpyxl", "Workbook")
+load_workbook = lazy_import("openpyxl", "load_workbook")
+Font = lazy_import("openpyxl.styles", "Font")
+WriteOnlyCell = lazy_import("openpyxl.cell", "WriteOnlyCell")
+canvas = lazy_import("reportlab.pdfgen.canvas")
+pdfmetrics = lazy_import("reportlab.pdfbase.pdfmetrics")
+TTFont = lazy_import("reportlab.pdfbase.ttfonts", "TTFont")
+simpleSplit = lazy_import("reportlab.lib.utils", "simpleSplit")
+GoogleTranslator = lazy_import("deep_translator", "GoogleTranslator")
 
 
 
@@ -80,19 +103,22 @@ PAGE_W, PAGE_H = A4
 def _which(cmd: str) -> Optional[str]:
     return shutil.which(cmd)
 
-# Optional libs
-try:
-    from langdetect import detect, detect_langs
-    _HAS_LANGDETECT = True
-except Exception:
-    _HAS_LANGDETECT = False
+# Prompt policy: the interactive menu may ask questions (split vs merge, ...).
+# The scriptable CLI (`convert`, `convert-dir`) turns INTERACTIVE off and every
+# unanswered question falls back to its default below.
+INTERACTIVE = True
+DEFAULT_SPLIT = True   # large outputs → separate page images (zipped) instead of one giant image
+
+def _should_prompt(answer):
+    """True when `answer` was not given explicitly and we may ask the user."""
+    return answer is None and INTERACTIVE
+
+# Optional libs (checked without importing them)
+_HAS_LANGDETECT = importlib.util.find_spec("langdetect") is not None
+detect_langs = lazy_import("langdetect", "detect_langs")
 
 # pandas only if user wants xlsx export or fallback viewing
-try:
-    import pandas as pd
-    _HAS_PANDAS = True
-except Exception:
-    _HAS_PANDAS = False
+_HAS_PANDAS = importlib.util.find_spec("pandas") is not None
 
 try:
     import tkinter as tk
@@ -116,6 +142,10 @@ def _auto_detect_delimiter(txt_path, sample_bytes=8192):
                 return d
     return "\t"
 
+# classify_scripts label → name reported by _detect_non_english_and_scripts
+_SCRIPT_NAMES = {"DEVANAGARI": "Devanagari", "CJK": "CJK", "KANA": "Japanese",
+                 "HANGUL": "Hangul", "ARABIC": "Arabic"}
+
 def _detect_non_english_and_scripts(txt_path, max_chars=10000):
     """
     Returns tuple (is_non_english_bool, top_languages_list, has_non_ascii_bool, scripts_set)
@@ -129,7 +159,7 @@ def _detect_non_english_and_scripts(txt_path, max_chars=10000):
             if len(text_sample) >= max_chars:
                 break
 
-    has_non_ascii = any(ord(ch) > 127 for ch in text_sample)
+    has_non_ascii = not text_sample.isascii()
     top_langs = []
     non_english = False
 
@@ -149,21 +179,10 @@ def _detect_non_english_and_scripts(txt_path, max_chars=10000):
         non_english = has_non_ascii
 
     # simple script heuristics (return set like {'Devanagari','CJK','Arabic',...})
-    scripts = set()
-    for ch in text_sample[:2000]:
-        cp = ord(ch)
-        if 0x0900 <= cp <= 0x097F:
-            scripts.add("Devanagari")
-        elif 0x4E00 <= cp <= 0x9FFF:
-            scripts.add("CJK")
-        elif 0x3040 <= cp <= 0x30FF:
-            scripts.add("Japanese")
-        elif 0xAC00 <= cp <= 0xD7AF:
-            scripts.add("Hangul")
-        elif 0x0600 <= cp <= 0x06FF:
-            scripts.add("Arabic")
-        elif cp > 127 and not ch.isspace():
-            scripts.add("OtherNonASCII")
+    # whitespace (NBSP, ideographic space, ...) belongs to no script
+    hist = script_histogram("".join(text_sample[:2000].split()))
+    scripts = {_SCRIPT_NAMES.get(label, "OtherNonASCII") for label, count in hist.items()
+               if count and label != "LATIN"}
 
     return non_english, top_langs, has_non_ascii, scripts
 
@@ -238,60 +257,45 @@ def ensure_parent_dir(path: str):
     except Exception as e:
         print(f"⚠️ Could not ensure parent dir for {path}: {e}")
 
-# ---------- Script to Font mapping (for image conversions) ----------
-FALLBACK_FONTS = {
-    "LATIN": "arial.ttf",
-    "DEVANAGARI": "NotoSansDevanagari-Medium.ttf",
-    "CJK": "arialuni.ttf",
-    "ARABIC": "arial.ttf",
-    "GREEK": "arial.ttf",
-    "OTHER": "arialuni.ttf",
-    "DEFAULT": "arial.ttf"
-}
-
 def detect_script_text(text):
-    """Detect script of a line and return font name."""
-    # Register multiple fonts
-    pdfmetrics.registerFont(TTFont("NotoSans", "/content/NotoSans-Regular.ttf")) #Add Local path of font
-    pdfmetrics.registerFont(TTFont("NotoSansDevanagari", "/content/NotoSansDevanagari-Medium.ttf")) #Add Local path of font
-
-    if regex.search(r'\p{Devanagari}', text):
-        return "NotoSansDevanagari"
-    return "NotoSans"  # default English font
-
-def get_font_for_line(line, font_size):
-    # font mapping by language
-    FONT_MAP = {
-        "hi": "/content/NotoSansDevanagari-Medium.ttf",  # Hindi
-        "en": "/content/NotoSans-Regular.ttf",           # English
-        "zh-cn": "/content/NotoSansSC-Regular.ttf",      # Simplified Chinese
-        "ja": "/content/NotoSansJP-Regular.ttf",         # Japanese
-        "ko": "/content/NotoSansKR-Regular.ttf",         # Korean
-        "default": "/content/NotoSans-Regular.ttf"       # fallback
-    }
+    """Detect script of a line and return the (already registered) ReportLab font name."""
+    return pdf_font_for_text(text)
+
+# TXT → image fonts by language (langdetect codes, normalized by _image_font_lang)
+TXT_IMAGE_FONTS = {
+    "hi": "/content/NotoSansDevanagari-Medium.ttf",  # Hindi
+    "en": "/content/NotoSans-Regular.ttf",           # English
+    "zh-cn": "/content/NotoSansSC-Regular.ttf",      # Simplified Chinese
+    "ja": "/content/NotoSansJP-Regular.ttf",         # Japanese
+    "ko": "/content/NotoSansKR-Regular.ttf",         # Korean
+    "default": "/content/NotoSans-Regular.ttf"       # fallback
+}
 
-    try:
-        lang = detect(line) if line.strip() else "en"
-    except:
-        lang = "en"
+# Only Han text needs language ID to pick an image font (Chinese vs Japanese)
+TXT_IMAGE_DETECT_SCRIPTS = ("CJK",)
 
+def _image_font_lang(lang):
     # normalize
-    if lang.startswith("zh"):
-        lang = "zh-cn"
-    elif lang.startswith("ja"):
-        lang = "ja"
-    elif lang.startswith("ko"):
-        lang = "ko"
-    elif lang.startswith("hi"):
-        lang = "hi"
-    else:
-        lang = "en"
+    for prefix, key in (("zh", "zh-cn"), ("ja", "ja"), ("ko", "ko"), ("hi", "hi")):
+        if lang.startswith(prefix):
+            return key
+    return "en"
 
-    font_path = FONT_MAP.get(lang, FONT_MAP["default"])
+def _font_for_lang(lang, font_size):
+    font_path = TXT_IMAGE_FONTS.get(_image_font_lang(lang), TXT_IMAGE_FONTS["default"])
     if not os.path.exists(font_path):  # fallback if missing
-        font_path = FONT_MAP["default"]
+        font_path = TXT_IMAGE_FONTS["default"]
+    return load_font(font_path, font_size)
 
-    return ImageFont.truetype(font_path, font_size)
+def get_font_for_line(line, font_size):
+    """Font for a single line; prefer fonts_for_lines() for a whole document."""
+    run = analyze_lines([line], detect_scripts=TXT_IMAGE_DETECT_SCRIPTS)[0]
+    return _font_for_lang(run.lang, font_size)
+
+def fonts_for_lines(lines, font_size):
+    """One font per line, chosen once per run of same-script lines."""
+    return line_values(lines, lambda run: _font_for_lang(run.lang, font_size),
+                       detect_scripts=TXT_IMAGE_DETECT_SCRIPTS)
 
 def flatten_json(obj, parent_key="", sep="."):
     """Flatten nested JSON (dicts/lists) into key-value pairs."""
@@ -318,111 +322,15 @@ def is_ndjson(json_path):
             return True
 
 def detect_script_simple(text: str) -> str:
-    if not text:
-        return "LATIN"
-    for ch in text:
-        cp = ord(ch)
-        # Devanagari
-        if 0x0900 <= cp <= 0x097F:
-            return "DEVANAGARI"
-        # CJK unified ideographs (Chinese)
-        if 0x4E00 <= cp <= 0x9FFF or 0x3400 <= cp <= 0x4DBF:
-            return "CJK"
-        # Hiragana / Katakana / Kanji ranges also considered CJK/Japanese
-        if 0x3040 <= cp <= 0x30FF:
-            return "CJK"
-        # Hangul (Korean)
-        if 0xAC00 <= cp <= 0xD7AF:
-            return "HANGUL"
-        # Arabic
-        if 0x0600 <= cp <= 0x06FF or 0x0750 <= cp <= 0x077F:
-            return "ARABIC"
-        # Greek
-        if 0x0370 <= cp <= 0x03FF:
-            return "GREEK"
-        # Basic Latin (ASCII)
-        if cp <= 0x007F:
-            continue
-        # If many other non-ascii chars, mark OTHER as fallback
-    # fallback: if there are non-ascii chars but not matched above
-    if any(ord(ch) > 127 for ch in text):
-        return "OTHER"
-    return "LATIN"
+    return script_of(text)
 
 def get_font(script, default_size=12):
-    font_name = FALLBACK_FONTS.get(script, FALLBACK_FONTS["DEFAULT"])
-    search_paths = [
-        f"/usr/share/fonts/truetype/liberation/{font_name}",
-        f"/usr/share/fonts/truetype/msttcorefonts/{font_name}",
-        f"/usr/share/fonts/truetype/noto/{font_name}",
-        f"/Library/Fonts/{font_name}",
-        f"C:/Windows/Fonts/{font_name}",
-        font_name
-    ]
-    for p in search_paths:
-        try:
-            if os.path.exists(p):
-                return ImageFont.truetype(p, default_size)
-        except Exception:
-            pass
-    # Fallbacks
-    for fb in ["arialuni.ttf", "NotoSans-Regular.ttf"]:
-        for p in search_paths:
-            try:
-                alt = p.replace(font_name, fb)
-                if os.path.exists(alt):
-                    return ImageFont.truetype(alt, default_size)
-            except Exception:
-                pass
-    # Last resort
-    try:
-        return ImageFont.load_default()
-    except Exception as e:
-        raise RuntimeError(f"Could not load any font: {e}")
+    """Cached PIL font for a script label (see Converter/fonts.py)."""
+    return get_image_font(script, default_size)
 
 def get_font_path(script, default_size=12):
-    font_name = FALLBACK_FONTS.get(script, FALLBACK_FONTS["DEFAULT"])
-    # In a Colab environment, commonly available fonts are in specific paths
-    # You might need to adjust these paths or download fonts if needed.
-    # Example paths (may vary):
-    colab_font_paths = [
-        f"/usr/share/fonts/truetype/liberation/{font_name}", # Liberation fonts often present
-        f"/usr/share/fonts/truetype/msttcorefonts/{font_name}", # If ttf-mscorefonts-installer is run
-        f"/usr/share/fonts/truetype/noto/{font_name}", # Noto fonts
-        f"/content/{font_name}", # If user uploaded
-        font_name # As a last resort, try just the name
-    ]
-
-    for font_path in colab_font_paths:
-        if os.path.exists(font_path):
-            try:
-                return ImageFont.truetype(font_path, default_size)
-            except Exception as e:
-                print(f"⚠️ Could not load font {font_path}: {e}")
-
-    # If specific font not found, try a generic fallback font that supports Unicode
-    try:
-        # Try a widely available Unicode font like Arial Unicode MS or Noto Sans
-        fallback_unicode_fonts = ["arialuni.ttf", "NotoSans-Regular.ttf"]
-        for fb_font_name in fallback_unicode_fonts:
-            for fb_path in colab_font_paths:
-                 potential_path = fb_path.replace(font_name, fb_font_name)
-                 if os.path.exists(potential_path):
-                     try:
-                         return ImageFont.truetype(potential_path, default_size)
-                     except Exception:
-                         pass # Try next fallback
-    except Exception:
-        pass # Continue to reportlab fallback
-
-    # Fallback to ReportLab's default font if Pillow fails
-    print(f"⚠️ Font {font_name} not found or could not be loaded. Using default Pillow font.")
-    try:
-        # Attempt to return a basic Pillow font if no TTF found
-        return ImageFont.load_default()
-    except Exception as e:
-        print(f"❌ Could not load default Pillow font: {e}")
-        raise RuntimeError("Could not load any font.")
+    """Kept for older callers; same cached lookup as get_font()."""
+    return get_image_font(script, default_size)
 
 
 def wrap_text(line: str, font_size: int, img_width: int, margin: int) -> list:
@@ -441,60 +349,16 @@ FALLBACK_FONTS_PDF = {
 }
 
 def _page_tables_to_rows(page):
-    """
-    Try to extract tables from a pdfplumber page as rows.
-    If no tables detected, fall back to extracting text lines and splitting heuristically.
-    Returns a list of row-lists.
-    """
-    rows = []
-    # 1) Try extract_tables (pdfplumber)
-    try:
-        tables = page.extract_tables()  # returns list of tables, each table is list of rows
-        if tables:
-            for table in tables:
-                # table: list of rows (cells may be None)
-                for row in table:
-                    rows.append([cell for cell in row])
-            if rows:
-                return rows
-    except Exception:
-        # continue to fallback
-        pass
-
-    # 2) Fallback: use page.extract_text() and split lines by common delimiters (tab or comma)
-    text = page.extract_text() or ""
-    if not text:
-        return []  # nothing to do
-    # attempt to detect delimiter by checking first non-empty line
-    lines = [ln for ln in text.splitlines() if ln.strip()]
-    if not lines:
-        return []
-    first = lines[0]
-    # choose delimiter heuristically
-    delim = "\t"
-    if "," in first and first.count(",") >= 1:
-        delim = ","
-    elif "|" in first and first.count("|") >= 1:
-        delim = "|"
-    # split each line
-    for ln in lines:
-        parts = [p.strip() for p in ln.split(delim)]
-        rows.append(parts)
-    return rows
+    """Table rows of a pdfplumber page (see Converter/pdf_extract.py:table_rows)."""
+    return table_rows(page)
+
+# Hangul is drawn with the CJK font in DOCX output; unknown scripts with the Latin one
+_PDF_SCRIPT = {"HANGUL": "CJK", "OTHER": "LATIN"}
 
 def detect_script_pdf(text):
-    """Detects script of the text based on Unicode names"""
-    for ch in text:
-        name = unicodedata.name(ch, "")
-        if "DEVANAGARI" in name:
-            return "DEVANAGARI"
-        elif any(x in name for x in ["CJK UNIFIED", "HIRAGANA", "KATAKANA", "HANGUL"]):
-            return "CJK"
-        elif "ARABIC" in name:
-            return "ARABIC"
-        elif "GREEK" in name:
-            return "GREEK"
-    return "LATIN"
+    """Detects script of the text (LATIN, DEVANAGARI, CJK, ARABIC, GREEK)"""
+    script = script_of(text)
+    return _PDF_SCRIPT.get(script, script)
 
 # ---------------- Helpers: Fonts -----------------
 FONTS_DIR = "fonts"
@@ -504,8 +368,9 @@ FONTS_DIR = "fonts"
 # -------------------------
 def convert_doc_to_docx_if_needed(input_path: str) -> str:
     """
-    Converts .doc to .docx using LibreOffice (headless). Returns a path to a .docx file.
-    Raises RuntimeError if soffice is missing or conversion fails.
+    Converts .doc to .docx using LibreOffice (the process-wide office, see
+    Converter/office.py). Returns a path to a .docx file.
+    Raises RuntimeError (OfficeError) if soffice is missing or conversion fails.
     """
     if input_path.lower().endswith(".docx"):
         return input_path
@@ -513,20 +378,9 @@ def convert_doc_to_docx_if_needed(input_path: str) -> str:
     if not input_path.lower().endswith(".doc"):
         raise RuntimeError("Unsupported file (expecting .doc/.docx): " + input_path)
 
-    soffice = _which("soffice")
-    if not soffice:
-        raise RuntimeError(
-            "LibreOffice (soffice) not found. Install it to support .doc -> .docx conversion.\n"
-            "Linux/Colab:  sudo apt-get update && sudo apt-get install -y libreoffice"
-        )
-
     tmp_out = tempfile.mkdtemp(prefix="doc2docx_")
-    cmd = [soffice, "--headless", "--convert-to", "docx", "--outdir", tmp_out, input_path]
-    subprocess.check_call(cmd)
     out = os.path.join(tmp_out, os.path.splitext(os.path.basename(input_path))[0] + ".docx")
-    if not os.path.exists(out):
-        raise RuntimeError("LibreOffice did not produce DOCX.")
-    return out
+    return office_convert(input_path, out, "docx")
 
 # -------------------------
 # Attempt to install Noto fonts (best-effort for Linux/Colab)
@@ -603,22 +457,7 @@ def ensure_noto_fonts_for_scripts(scripts: set):
 # Convert .docx -> .pdf using LibreOffice (preferred)
 # -------------------------
 def convert_docx_to_pdf_libreoffice(docx_path: str, output_pdf: str) -> str:
-    soffice = _which("soffice")
-    if not soffice:
-        raise RuntimeError(
-            "LibreOffice (soffice) not found. Install it for high-fidelity DOCX->PDF.\n"
-            "Linux/Colab:  sudo apt-get update && sudo apt-get install -y libreoffice"
-        )
-    outdir = os.path.dirname(os.path.abspath(output_pdf)) or "."
-    _ensure_dir(output_pdf)
-    cmd = [soffice, "--headless", "--convert-to", "pdf", "--outdir", outdir, docx_path]
-    subprocess.check_call(cmd)
-    produced = os.path.join(outdir, os.path.splitext(os.path.basename(docx_path))[0] + ".pdf")
-    if not os.path.exists(produced):
-        raise RuntimeError("LibreOffice did not produce PDF.")
-    if os.path.abspath(produced) != os.path.abspath(output_pdf):
-        os.replace(produced, output_pdf)
-    return output_pdf
+    return office_convert(docx_path, output_pdf, "pdf")
 
 # ---------- Rasterize (guaranteed readability) ----------
 def rasterize_pdf_to_pdf(input_pdf: str, output_pdf: str, dpi: int = 200) -> str:
@@ -626,43 +465,19 @@ def rasterize_pdf_to_pdf(input_pdf: str, output_pdf: str, dpi: int = 200) -> str
     Converts every page of PDF to an image, then merges them back into PDF.
     Ensures fonts, multilingual text, tables, JSON, etc. are preserved visually.
     """
-    _ensure_dir(output_pdf)
-    images = convert_from_path(input_pdf, dpi=dpi)
-    if not images:
+    ensure_parent_dir(output_pdf)
+    # one page at a time (see Converter/raster.py) instead of every page in RAM
+    if not rasterize_to_pdf(input_pdf, output_pdf, dpi=dpi):
         raise RuntimeError("No pages produced while rasterizing.")
-
-    pdf_pages = []
-    for img in images:
-        if img.mode != "RGB":
-            img = img.convert("RGB")
-        pdf_pages.append(img)
-
-    first, rest = pdf_pages[0], pdf_pages[1:]
-    first.save(output_pdf, save_all=True, append_images=rest)
     return output_pdf
 
 #==========================
 # OCR SETTINGS
 #==========================
 
-_EASYOCR_READER = None
-_EASYOCR_LANGS = []
-
 def _get_easyocr(langs=['en']):
-    global _EASYOCR_READER, _EASYOCR_LANGS
-    # Re-initialize if reader is not set or if requested languages are different from currently loaded languages
-    if _EASYOCR_READER is None or set(langs) != set(_EASYOCR_LANGS):
-        try:
-            import easyocr
-            # The Reader constructor takes a list of languages directly
-            _EASYOCR_READER = easyocr.Reader(langs, gpu=False) # Set gpu=True if you have a GPU
-            _EASYOCR_LANGS = langs # Update the stored languages
-            print(f"✅ Initialized EasyOCR with languages: {langs}")
-        except Exception as e:
-            print(f"Error initializing EasyOCR with languages {langs}: {e}")
-            _EASYOCR_READER = None
-            _EASYOCR_LANGS = [] # Clear languages on failure
-    return _EASYOCR_READER
+    """EasyOCR reader for langs from the shared LRU pool (see Converter/ocr.py); None if unavailable."""
+    return get_reader(langs)
 
 # Preprocessing function (optional but can help)
 def preprocess_image(image_path, strong=False):
@@ -733,21 +548,23 @@ def csv_to_xls(csv_path, xls_path, chunksize=10000):
         print(f"❌ CSV to XLSX failed: {e}")
         return None
 
-def csv_to_pdf(csv_path, pdf_path, margin=40, line_gap=14, font="Helvetica", size=10):
+def csv_to_pdf(csv_path, pdf_path, margin=40, line_gap=14, font=None, size=10):
+    """font=None → pick a registered font per line by script (Devanagari, ...)."""
     try:
         ensure_parent_dir(pdf_path)
         c = canvas.Canvas(pdf_path, pagesize=A4)
-        c.setFont(font, size)
         y = PAGE_H - margin
         max_chars = 180
         with open(csv_path, "r", encoding="utf-8", newline="") as f:
             reader = csv.reader(f)
             for row in reader:
                 line = " | ".join([str(x) for x in row])
+                line_font = font or pdf_font_for_text(line)
                 chunks = [line[i:i+max_chars] for i in range(0, len(line), max_chars)] or [" "]
                 for chunk in chunks:
                     if y < margin:
-                        c.showPage(); c.setFont(font, size); y = PAGE_H - margin
+                        c.showPage(); y = PAGE_H - margin
+                    c.setFont(line_font, size)
                     c.drawString(margin, y, chunk)
                     y -= line_gap
         c.save()
@@ -819,8 +636,8 @@ def _render_chunk_to_image(lines_chunk, img_path, font_size=12, margin=40, line_
         # Pre-measure wrapped line count
         total_wrapped_lines = 0
         wrapped_chunks = []
-        for line in lines_chunk:
-            script = detect_script_simple(line)
+        scripts, _ = classify_scripts(lines_chunk)
+        for line, script in zip(lines_chunk, scripts):
             font = get_font(script, font_size)
             wrapped = wrap_text(line, font_size, img_width, margin)
             if not wrapped:
@@ -847,11 +664,12 @@ def _render_chunk_to_image(lines_chunk, img_path, font_size=12, margin=40, line_
         print(f"❌ Render chunk failed: {e}")
         return None
 
-def csv_to_image(csv_path, out_path, font_size=12, margin=40, line_height=18, img_width=1200, max_lines_per_img=60):
+def csv_to_image(csv_path, out_path, font_size=12, margin=40, line_height=18, img_width=1200, max_lines_per_img=60, split=None):
     """
-    If CSV has > max_lines_per_img → ask:
+    If CSV has > max_lines_per_img → ask (unless `split` is given):
       1. Single image
       2. Multi images (ZIP)
+    Non-interactive runs use DEFAULT_SPLIT.
     """
     try:
         ensure_parent_dir(out_path)
@@ -864,15 +682,18 @@ def csv_to_image(csv_path, out_path, font_size=12, margin=40, line_height=18, im
             raise RuntimeError("CSV is empty.")
 
         total = len(lines)
-        split = total > max_lines_per_img
 
-        if split:
+        if total <= max_lines_per_img:
+            split = False
+        elif _should_prompt(split):
             print(f"CSV lines: {total} (> {max_lines_per_img})")
             print("Choose output option:")
             print("1. Single giant image (may be very tall)")
             print("2. Multiple images (zipped)")
             choice = input("Enter choice (1/2): ").strip()
             split = (choice != "1")
+        elif split is None:
+            split = DEFAULT_SPLIT
 
         images = []
         if not split:
@@ -957,21 +778,23 @@ def xls_to_txt(xls_path, txt_path, delimiter="\t", sheet_name=None):
         print(f"❌ XLSX to TXT failed: {e}")
         return None
 
-def xls_to_pdf(xls_path, pdf_path, margin=40, line_gap=14, font="Helvetica", size=10, sheet_name=None):
+def xls_to_pdf(xls_path, pdf_path, margin=40, line_gap=14, font=None, size=10, sheet_name=None):
+    """font=None → pick a registered font per line by script (Devanagari, ...)."""
     try:
         ensure_parent_dir(pdf_path)
         wb = load_workbook(xls_path, read_only=True, data_only=True)
         ws = wb[sheet_name] if sheet_name else wb.active
         c = canvas.Canvas(pdf_path, pagesize=A4)
-        c.setFont(font, size)
         y = PAGE_H - margin
         max_chars = 180
         for row in ws.iter_rows(values_only=True):
             line = " | ".join("" if v is None else str(v) for v in row)
+            line_font = font or pdf_font_for_text(line)
             chunks = [line[i:i+max_chars] for i in range(0, len(line), max_chars)] or [" "]
             for ch in chunks:
                 if y < margin:
-                    c.showPage(); c.setFont(font, size); y = PAGE_H - margin
+                    c.showPage(); y = PAGE_H - margin
+                c.setFont(line_font, size)
                 c.drawString(margin, y, ch)
                 y -= line_gap
         c.save()
@@ -1007,10 +830,11 @@ def xls_to_json(xls_path, json_path, sheet_name=None):
 
 
 def xls_to_image(xls_path, out_path, sheet_name=None, font_size=12, margin=40, line_height=18,
-                 img_width=1200, max_lines_per_img=60, max_safe_height=30000):
+                 img_width=1200, max_lines_per_img=60, max_safe_height=30000, split=None):
     """
     Converts an XLS/XLSX file to PNG image(s).
     Handles large files by splitting into multiple images.
+    split=True/False skips the prompt; non-interactive runs use DEFAULT_SPLIT.
     """
     try:
         if not os.path.exists(xls_path):
@@ -1030,7 +854,9 @@ def xls_to_image(xls_path, out_path, sheet_name=None, font_size=12, margin=40, l
         split_into_multiple = total_lines > max_lines_per_img
 
         # Ask user if too many lines
-        if split_into_multiple:
+        if split_into_multiple and not _should_prompt(split):
+            split_into_multiple = DEFAULT_SPLIT if split is None else split
+        elif split_into_multiple:
             print(f"Sheet has {total_lines} lines (>{max_lines_per_img}).")
             print("Choose output option:")
             print("1. Single giant image (may be very tall)")
@@ -1048,8 +874,8 @@ def xls_to_image(xls_path, out_path, sheet_name=None, font_size=12, margin=40, l
             # --- Measure wrapped line count first ---
             total_wrapped_lines = 0
             wrapped_chunks = []
-            for line in chunk:
-                script = detect_script_simple(line)
+            scripts, _ = classify_scripts(chunk)
+            for line, script in zip(chunk, scripts):
                 font = get_font_path(script, font_size)
                 wrapped = textwrap.wrap(line, width=int((img_width - 2*margin) / (font_size*0.6)))
                 if not wrapped:
@@ -1114,12 +940,9 @@ def xls_to_image(xls_path, out_path, sheet_name=None, font_size=12, margin=40, l
 # =========================
 
 def txt_to_pdf(txt_path, pdf_path, font_size=12, margin=40, line_gap=16):
-
-    # Register multiple fonts
-    pdfmetrics.registerFont(TTFont("NotoSans", "/content/NotoSans-Regular.ttf")) #Add Local path of font
-    pdfmetrics.registerFont(TTFont("NotoSansDevanagari", "/content/NotoSansDevanagari-Medium.ttf")) #Add Local path of font
-
     try:
+        # Register fonts once per process (Converter/fonts.py); per-line lookups are cheap
+        register_pdf_fonts()
         c = canvas.Canvas(pdf_path, pagesize=A4)
 
         y = PAGE_H - margin
@@ -1155,20 +978,24 @@ def txt_to_pdf(txt_path, pdf_path, font_size=12, margin=40, line_gap=16):
 
 def txt_to_doc(input_file, output_file):
     try:
-        if not txt_path.endswith(".txt"):
+        if not input_file.endswith(".txt"):
             raise RuntimeError("❌ Only TEXT files are supported!")
 
-        if not os.path.exists(txt_path):
+        if not os.path.exists(input_file):
             raise RuntimeError("❌ File not found!")
 
         with open(input_file, "r", encoding="utf-8", errors="ignore") as f:
-            text = f.read()
-
-        # ✅ Detect language
-        try:
-            language = detect(text)
-        except:
-            language = "en"
+            lines = f.read().splitlines()
+
+        # ✅ Detect language per run of same-script lines; the run covering most
+        # lines sets the document default
+        runs = analyze_lines(lines)
+        line_langs = [None] * len(lines)
+        lang_lines = {}
+        for run in runs:
+            line_langs[run.start:run.stop] = [run.lang] * (run.stop - run.start)
+            lang_lines[run.lang] = lang_lines.get(run.lang, 0) + run.stop - run.start
+        language = max(lang_lines, key=lang_lines.get) if lang_lines else "en"
 
         # ✅ Font mapping by language
         font_map = {
@@ -1213,15 +1040,18 @@ def txt_to_doc(input_file, output_file):
         style.font.name = chosen_font
         style.font.size = Pt(12)
 
-        for line in text.splitlines():
+        for line, lang in zip(lines, line_langs):
             if line.strip():  # skip blank lines
+                    line_font = font_map.get(lang, "Noto Sans")
                     p = doc.add_paragraph(line.strip())
                     r = p.runs[0]
-                    r.font.name = chosen_font
-                    r._element.rPr.rFonts.set(qn('w:eastAsia'), chosen_font)
+                    r.font.name = line_font
+                    r._element.rPr.rFonts.set(qn('w:eastAsia'), line_font)
 
         doc.save(output_file)
-        print(f"✅ Saved {output_file} with font '{chosen_font}' (detected lang: {language})")
+        other_langs = sorted(set(lang_lines) - {language})
+        extra = f", also: {', '.join(other_langs)}" if other_langs else ""
+        print(f"✅ Saved {output_file} with font '{chosen_font}' (detected lang: {language}{extra})")
 
         # ✅ Suggestion for user
         if language not in font_map:
@@ -1230,6 +1060,7 @@ def txt_to_doc(input_file, output_file):
         else:
             print(f"💡 Tip: If the text doesn’t render well, "
                   f"manually set the font in MS Word to '{chosen_font}' for proper display.")
+        return output_file
 
     except Exception as e:
         print(f"❌ TXT to DOC failed: {e}")
@@ -1347,6 +1178,8 @@ def txt_to_image(txt_path, output_dir, font_size=24, width=1240, height=1754, ma
         if split is None:
             if len(lines) <= 20:
                 split = False   # single image
+            elif not INTERACTIVE:
+                split = DEFAULT_SPLIT
             else:
                 # user choice
                 choice = input("Text has more than 20 lines. Do you want multiple images? (y/n): ")
@@ -1359,8 +1192,7 @@ def txt_to_image(txt_path, output_dir, font_size=24, width=1240, height=1754, ma
             draw = ImageDraw.Draw(img)
 
             y = margin
-            for line in lines:
-                font = get_font_for_line(line, font_size)
+            for line, font in zip(lines, fonts_for_lines(lines, font_size)):
                 draw.text((margin, y), line.strip(), fill="black", font=font)
                 y += line_height
 
@@ -1371,14 +1203,15 @@ def txt_to_image(txt_path, output_dir, font_size=24, width=1240, height=1754, ma
         else:
             # Option 2: Split into multiple images
             chunks = [lines[i:i+max_lines_per_img] for i in range(0, len(lines), max_lines_per_img)]
+            fonts = fonts_for_lines(lines, font_size)
 
             for idx, chunk in enumerate(chunks, start=1):
                 img = Image.new("RGB", (width, height), "white")
                 draw = ImageDraw.Draw(img)
 
                 y = margin
-                for line in chunk:
-                    font = get_font_for_line(line, font_size)
+                first = (idx - 1) * max_lines_per_img
+                for line, font in zip(chunk, fonts[first:first + len(chunk)]):
                     draw.text((margin, y), line.strip(), fill="black", font=font)
                     y += line_height
 
@@ -1721,7 +1554,7 @@ def json_to_doc(json_file, output_file):
         print(f"❌ JSON to DOC failed: {e}")
         return None
 
-def json_to_image(json_path, output_path):
+def json_to_image(json_path, output_path, split=None):
     try:
         if not json_path.endswith(".json"):
             raise RuntimeError("❌ Only JSON files are supported!")
@@ -1731,40 +1564,30 @@ def json_to_image(json_path, output_path):
 
         ndjson_mode = is_ndjson(json_path)
 
-        print("Choose conversion mode:")
-        print("1. Single big image (whole JSON in one PNG)")
-        print("2. Split into 30-line chunks (ZIP of PNGs)")
-        choice = input("Enter choice (1/2): ").strip()
+        if _should_prompt(split):
+            print("Choose conversion mode:")
+            print("1. Single big image (whole JSON in one PNG)")
+            print("2. Split into 30-line chunks (ZIP of PNGs)")
+            choice = input("Enter choice (1/2): ").strip()
+        else:
+            if split is None:
+                split = DEFAULT_SPLIT
+            choice = "2" if split else "1"
 
         if ndjson_mode:
             print("📂 NDJSON detected → routing via json_to_pdf()...")
             tmp_pdf = tempfile.mktemp(suffix=".pdf")
             json_to_pdf(json_path, tmp_pdf)   # use your fast code
 
-            # convert PDF → images
-            images = convert_from_path(tmp_pdf, dpi=100)
-
             if choice == "1":
                 # merge pages into one long PNG
-                total_height = sum(i.height for i in images)
-                max_width = max(i.width for i in images)
-                big_img = Image.new("RGB", (max_width, total_height), "white")
-                y_offset = 0
-                for img in images:
-                    big_img.paste(img, (0, y_offset))
-                    y_offset += img.height
-                big_img.save(output_path, "PNG")
+                merge_pdf_pages(tmp_pdf, output_path, dpi=100)
                 print(f"✅ NDJSON → single long image: {output_path}")
                 return output_path
             else:
                 # each page separate → zip
                 tmpdir = tempfile.mkdtemp()
-                img_files = []
-                base, ext = os.path.splitext(output_path)
-                for i, page in enumerate(images, 1):
-                    out_file = os.path.join(tmpdir, f"page_{i}.png")
-                    page.save(out_file, "PNG")
-                    img_files.append(out_file)
+                img_files = save_pages(tmp_pdf, tmpdir, fmt="png", dpi=100)
 
                 zip_path = output_path.replace(".png", ".zip")
                 with zipfile.ZipFile(zip_path, "w") as zipf:
@@ -1832,21 +1655,13 @@ def save_html_as_image(text, out_path, long_mode=False):
 
     tmp_pdf = out_path.replace(".png", f"_{uuid.uuid4().hex}.pdf")
     HTML(tmp_html).write_pdf(tmp_pdf)
-    images = convert_from_path(tmp_pdf, dpi=100)
-
-    if long_mode and len(images) > 1:
-        total_height = sum(i.height for i in images)
-        max_width = max(i.width for i in images)
-        big_img = Image.new("RGB", (max_width, total_height), "white")
-        y_offset = 0
-        for img in images:
-            big_img.paste(img, (0, y_offset))
-            y_offset += img.height
-        big_img.save(out_path, "PNG")
+
+    if long_mode and pdf_page_count(tmp_pdf) > 1:
+        merge_pdf_pages(tmp_pdf, out_path, dpi=100)
         print(f"✅ Saved single long image: {out_path}")
         return out_path
     else:
-        images[0].save(out_path, "PNG")
+        render_page(tmp_pdf, 1, dpi=100).save(out_path, "PNG")
         print(f"✅ Saved image: {out_path}")
         return out_path
 
@@ -1854,7 +1669,8 @@ def save_html_as_image(text, out_path, long_mode=False):
 # PDF Helpers
 # =========================
 
-def pdf_to_txt(pdf_path, txt_path, ocr_langs="eng+hin+jpn+chi_sim+chi_tra+deu+fra"):
+def pdf_to_txt(pdf_path, txt_path, ocr_langs="eng+hin+jpn+chi_sim+chi_tra+deu+fra", ocr_workers=None,
+               force_ocr=False, pdf_engine=None):
     '''Support English + Hindi + Japanese + Chinese (simplified + traditional)
     *Note : sudo apt-get install tesseract-ocr \
      tesseract-ocr-hin \
@@ -1864,6 +1680,11 @@ def pdf_to_txt(pdf_path, txt_path, ocr_langs="eng+hin+jpn+chi_sim+chi_tra+deu+fr
      tesseract-ocr-deu \
      tesseract-ocr-fra
      install languange pack for better experience 
+
+    Pages with a usable text layer are taken as is; only pages that are
+    (nearly) empty or garbled are rasterized and OCR'd. force_ocr=True OCRs
+    every page. pdf_engine picks the text extractor ("pdfminer" by default,
+    "pypdf" or "pdfplumber"; see Converter/pdf_backends.py).
     '''
     try:
         ensure_parent_dir(txt_path)
@@ -1872,23 +1693,27 @@ def pdf_to_txt(pdf_path, txt_path, ocr_langs="eng+hin+jpn+chi_sim+chi_tra+deu+fr
         if not os.path.exists(pdf_path):
             raise RuntimeError("❌ File not found!")
 
-        extracted_text = ""
-
-        # Try direct text extraction
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                text = page.extract_text()
-                if text and text.strip():
-                    extracted_text += text.rstrip() + "\n\n"
-
-        # Always run OCR as supplement
-        images = convert_from_path(pdf_path)
-        ocr_text = ""
-        for img in images:
-            ocr_text += pytesseract.image_to_string(img, lang=ocr_langs) + "\n"
-
-        # Combine both
-        final_text = (extracted_text + "\n" + ocr_text).strip()
+        # Try direct text extraction, and note pages without a usable text layer
+        if force_ocr:
+            page_texts = [""] * pdf_page_total(pdf_path)
+            ocr_pages = list(range(1, len(page_texts) + 1))
+        else:
+            page_texts = []
+            ocr_pages = []
+            # text-only engine: no table-capable layout analysis
+            for page in iter_page_texts(pdf_path, pdf_engine):
+                if not has_usable_text(text_layer_stats(page.text, page.width, page.height)):
+                    ocr_pages.append(page.number)
+                page_texts.append(page.text)
+
+        # OCR only the pages that need it (in parallel, joined in page order)
+        if ocr_pages:
+            print(f"🔍 OCR on {len(ocr_pages)}/{len(page_texts)} pages without a usable text layer")
+            for pageno, text in zip(ocr_pages, ocr_pdf_pages(pdf_path, ocr_langs, pages=ocr_pages,
+                                                             workers=ocr_workers)):
+                page_texts[pageno - 1] = text
+
+        final_text = "".join(text.rstrip() + "\n\n" for text in page_texts if text and text.strip()).strip()
 
         with open(txt_path, "w", encoding="utf-8") as out:
             out.write(final_text)
@@ -1898,14 +1723,10 @@ def pdf_to_txt(pdf_path, txt_path, ocr_langs="eng+hin+jpn+chi_sim+chi_tra+deu+fr
         print(f"❌ PDF to TXT failed: {e}")
         return None
 
-def pdf_to_txt_ocr(pdf_path, txt_path, lang="eng+hin"):
+def pdf_to_txt_ocr(pdf_path, txt_path, ocr_langs="eng+hin", ocr_workers=None):
     '''Support English + Hindi'''
     try:
-        images = convert_from_path(pdf_path)
-        full_text = ""
-        for img in images:
-            text = pytesseract.image_to_string(img, lang=lang)
-            full_text += text + "\n"
+        full_text = "".join(text + "\n" for text in ocr_pdf_pages(pdf_path, ocr_langs, workers=ocr_workers))
 
         # Ensure the output directory exists
         output_dir = os.path.dirname(txt_path)
@@ -1919,19 +1740,8 @@ def pdf_to_txt_ocr(pdf_path, txt_path, lang="eng+hin"):
         print(f"❌ OCR failed: {e}")
         return None
 
-#def pdf_to_txt(pdf_path, txt_path):
-#    try:
-#        ensure_parent_dir(txt_path)
-#        text = pdf_extract_text(pdf_path) or ""
-#        with open(txt_path, "w", encoding="utf-8") as out:
-#            out.write(text)
-#        print(f"✅ PDF → TXT: {txt_path}")
-#        return txt_path
-#    except Exception as e:
-#        print(f"❌ PDF to TXT failed: {e}")
-#        return None
-
-def pdf_to_docx(pdf_path, docx_path):
+
+def pdf_to_docx(pdf_path, docx_path, page_workers=None, max_rss_mb=None):
     try:
         if not pdf_path.endswith(".pdf"):
             raise RuntimeError("❌ Only PDF files are supported!")
@@ -1941,41 +1751,35 @@ def pdf_to_docx(pdf_path, docx_path):
 
         doc = Document()
 
-        with pdfplumber.open(pdf_path) as pdf:
-            for pageno, page in enumerate(pdf.pages, 1):
-
-                # --- Extract Text ---
-                text = page.extract_text() or ""
-                for line in text.splitlines():
-                    script = detect_script_pdf(line)
-                    font_name = FALLBACK_FONTS_PDF.get(script, FALLBACK_FONTS_PDF["DEFAULT"])
-                    para = doc.add_paragraph()
-                    run = para.add_run(line)
-                    run.font.name = font_name
-                    run.font.size = Pt(11)
-
-                    # set for East Asian / Complex Scripts
-                    rPr = run._element.rPr.rFonts
-                    rPr.set(qn('w:eastAsia'), font_name)
-                    rPr.set(qn('w:cs'), font_name)
-                    rPr.set(qn('w:hAnsi'), font_name)
-
-                # --- Extract Images ---
-                for img in page.images:
-                    try:
-                        x0, top, x1, bottom = img["x0"], img["top"], img["x1"], img["bottom"]
-                        cropped = page.crop((x0, top, x1, bottom))
-                        pil_img = cropped.to_image(resolution=150).original
-                        img_path = f"temp_img_{pageno}.png"
-                        pil_img.save(img_path)
-
-                        # insert into docx
-                        doc.add_picture(img_path, width=Inches(4))
-                    except Exception as e:
-                        print(f"⚠️ Image on page {pageno} skipped: {e}")
+        num_pages = pdf_page_total(pdf_path)
+        for pageno, (lines, images) in extract_pages(pdf_path, "Converter.pdf_extract:docx_content",
+                                                     workers=page_workers, max_rss_mb=max_rss_mb):
+
+            # --- Extracted Text ---
+            scripts, _ = classify_scripts(lines)
+            for line, script in zip(lines, scripts):
+                script = _PDF_SCRIPT.get(script, script)
+                font_name = FALLBACK_FONTS_PDF.get(script, FALLBACK_FONTS_PDF["DEFAULT"])
+                para = doc.add_paragraph()
+                run = para.add_run(line)
+                run.font.name = font_name
+                run.font.size = Pt(11)
+
+                # set for East Asian / Complex Scripts
+                rPr = run._element.rPr.rFonts
+                rPr.set(qn('w:eastAsia'), font_name)
+                rPr.set(qn('w:cs'), font_name)
+                rPr.set(qn('w:hAnsi'), font_name)
+
+            # --- Extracted Images (PNG bytes, no temp files) ---
+            for png in images:
+                try:
+                    doc.add_picture(io.BytesIO(png), width=Inches(4))
+                except Exception as e:
+                    print(f"⚠️ Image on page {pageno} skipped: {e}")
 
-                if pageno < len(pdf.pages):
-                    doc.add_page_break()
+            if pageno < num_pages:
+                doc.add_page_break()
 
         doc.save(docx_path)
         return docx_path
@@ -1984,7 +1788,7 @@ def pdf_to_docx(pdf_path, docx_path):
         print(f"❌ PDF to DOC failed: {e}")
         return None
 
-def pdf_to_image(pdf_path, out_dir, fmt="png", dpi=150, base_name="page"):
+def pdf_to_image(pdf_path, out_dir, fmt="png", dpi=150, base_name="page", split=None):
     try:
         os.makedirs(out_dir, exist_ok=True)
         if not pdf_path.endswith(".pdf"):
@@ -1993,45 +1797,49 @@ def pdf_to_image(pdf_path, out_dir, fmt="png", dpi=150, base_name="page"):
         if not os.path.exists(pdf_path):
             raise RuntimeError("❌ File not found!")
 
-        # convert all pages
-        images = convert_from_path(pdf_path, dpi=dpi)
-        page_count = len(images)
+        # pages are rendered a few at a time (Converter/raster.py), never all at once
+        page_count = pdf_page_count(pdf_path)
 
         if page_count == 1:
             # single page → direct save
             out_path = os.path.join(out_dir, f"{base_name}_1.{fmt}")
-            images[0].save(out_path, fmt.upper())
+            render_page(pdf_path, 1, dpi=dpi).save(out_path, fmt.upper())
             print(f"✅ Single-page PDF converted: {out_path}")
             return out_dir
 
-        # multi-page case → ask user choice
-        print("PDF has", page_count, "pages.")
-        print("Choose output option:")
-        print("1 → Merge all pages into ONE image")
-        print("2 → Save each page as separate image")
-        choice = input("Select option (1/2): ").strip()
+        # multi-page case → ask user choice (split=False merges, split=True separates)
+        if _should_prompt(split):
+            print("PDF has", page_count, "pages.")
+            print("Choose output option:")
+            print("1 → Merge all pages into ONE image")
+            print("2 → Save each page as separate image")
+            choice = input("Select option (1/2): ").strip()
+        else:
+            if split is None:
+                split = DEFAULT_SPLIT
+            choice = "2" if split else "1"
 
         if choice == "1":
             # merge vertically into single tall image
-            widths, heights = zip(*(img.size for img in images))
-            total_height = sum(heights)
-            max_width = max(widths)
-
-            merged_img = Image.new("RGB", (max_width, total_height), (255, 255, 255))
-
-            y_offset = 0
-            for img in images:
-                merged_img.paste(img, (0, y_offset))
-                y_offset += img.height
-
             out_path = os.path.join(out_dir, f"{base_name}_merged.{fmt}")
-            merged_img.save(out_path, fmt.upper())
+            if fmt.lower() == "png":
+                # streamed page by page into the PNG encoder (Converter/tall_png.py)
+                merge_pdf_pages(pdf_path, out_path, dpi=dpi)
+            else:
+                images = [img for _, img in iter_pdf_pages(pdf_path, dpi=dpi)]
+                widths, heights = zip(*(img.size for img in images))
+                merged_img = Image.new("RGB", (max(widths), sum(heights)), (255, 255, 255))
+
+                y_offset = 0
+                for img in images:
+                    merged_img.paste(img, (0, y_offset))
+                    y_offset += img.height
+                merged_img.save(out_path, fmt.upper())
             print(f"✅ All pages merged into one image: {out_path}")
 
         else:
             # separate images
-            for i, img in enumerate(images, 1):
-                img.save(os.path.join(out_dir, f"{base_name}_{i}.{fmt}"), fmt.upper())
+            save_pages(pdf_path, out_dir, fmt=fmt, dpi=dpi, base_name=base_name)
             print(f"✅ {page_count} pages saved as separate images in {out_dir}")
 
         return out_dir
@@ -2040,12 +1848,29 @@ def pdf_to_image(pdf_path, out_dir, fmt="png", dpi=150, base_name="page"):
         print(f"❌ PDF to IMAGE failed: {e}")
         return None
 
-def pdf_to_csv(pdf_path, csv_path=None, xlsx_path=None, csv_delimiter=", " , excel_font_map=FALLBACK_FONTS_PDF, batch_log_every=1000):
+def _xlsx_table_row(ws, out_row, excel_font_map):
+    """Write-only XLSX cells of one table row, each in the font of its script."""
+    cells = []
+    scripts, _ = classify_scripts(out_row)
+    for cell_val, script in zip(out_row, scripts):
+        font_name = excel_font_map.get(script, excel_font_map.get("DEFAULT", "Arial"))
+        cell = WriteOnlyCell(ws, value=cell_val)
+        cell.font = Font(name=font_name, size=11)
+        cells.append(cell)
+    return cells
+
+def pdf_to_csv(pdf_path, csv_path=None, xlsx_path=None, csv_delimiter=", " , excel_font_map=FALLBACK_FONTS_PDF, batch_log_every=1000,
+               page_workers=None, max_rss_mb=None, table_prefilter=True, resume=False, checkpoint_every=CHECKPOINT_EVERY):
     """
     PDF → CSV/XLSX converter (strict mode):
     - Converts only actual tables
     - Ignores all other content (JSON/plain text/XLS)
     - Exits if no tables found
+    - table_prefilter: skip table extraction on pages with no rulings, delimited
+      lines or aligned columns (reported as "skipped_pages")
+    - Long PDFs (CHECKPOINT_MIN_PAGES+) are checkpointed every `checkpoint_every`
+      pages to <output>.checkpoint.json; resume=True continues an interrupted run
+      from its last checkpoint (XLSX rows are spooled and the workbook built at the end)
     """
     if not pdf_path.endswith(".pdf"):
         raise RuntimeError("❌ Only PDF files are supported!")
@@ -2055,33 +1880,59 @@ def pdf_to_csv(pdf_path, csv_path=None, xlsx_path=None, csv_delimiter=", " , exc
 
     csv_file = None
     csv_writer = None
-    if csv_path:
-        csv_file = open(csv_path, "w", encoding="utf-8-sig", newline="")
-        csv_writer = csv.writer(csv_file, delimiter=csv_delimiter)
-
     wb = None
     ws = None
-    if xlsx_path:
-        wb = Workbook(write_only=True)
-        ws = wb.create_sheet(title="Extracted")
-
-    total_rows = 0
-    unsupported_pages = []
-    valid_table_found = False
+    spool = None
+    ckpt = None
 
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            num_pages = len(pdf.pages)
-            print(f"Opened PDF: {pdf_path} (pages: {num_pages})")
+        num_pages = pdf_page_total(pdf_path)
+        print(f"Opened PDF: {pdf_path} (pages: {num_pages})")
+
+        state = None
+        if resume or num_pages >= CHECKPOINT_MIN_PAGES:
+            ckpt = Checkpoint(f"{csv_path or xlsx_path}.checkpoint.json", identity={
+                "source": source_stamp(pdf_path), "csv": csv_path, "xlsx": xlsx_path,
+                "delimiter": csv_delimiter, "table_prefilter": table_prefilter})
+            state = ckpt.load() if resume else None
+            spool_path = f"{xlsx_path}.rows.jsonl" if xlsx_path else None
+            if state and not all(os.path.exists(p) for p in (csv_path, spool_path) if p):
+                print("⚠️ Checkpoint outputs are missing, starting over")
+                state = None
+            if state:
+                print(f"↩️ Resuming after page {state['page']}/{num_pages} ({state['rows']} rows written)")
+
+        total_rows = state["rows"] if state else 0
+        unsupported_pages = list(state["unsupported_pages"]) if state else []
+        skipped_pages = list(state["skipped_pages"]) if state else []
+        valid_table_found = state["valid_table_found"] if state else False
 
-            for pageno, page in enumerate(pdf.pages, start=1):
-                rows = _page_tables_to_rows(page)
+        if csv_path:
+            if state:
+                truncate_to(csv_path, state["csv_bytes"])  # drop rows of a half-written page
+            csv_file = open(csv_path, "a" if state else "w", encoding="utf-8-sig", newline="")
+            csv_writer = csv.writer(csv_file, delimiter=csv_delimiter)
 
-                # Strict table check: must have >1 row and >1 column
-                if not rows or len(rows) < 1 or all(len(r) < 2 for r in rows):
-                    unsupported_pages.append(pageno)
-                    continue
+        if xlsx_path:
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet(title="Extracted")
+            if ckpt:
+                spool = RowSpool(spool_path, resume_size=state["spool_bytes"] if state else None)
+
+        extract = "Converter.pdf_extract:strict_table_rows" if table_prefilter else "Converter.pdf_extract:table_rows"
+        # pages are extracted in parallel and arrive in page order
+        for pageno, rows in extract_pages(pdf_path, extract, workers=page_workers, max_rss_mb=max_rss_mb,
+                                          first_page=state["page"] + 1 if state else 1):
+
+            # Prefilter: no table on this page, extraction was skipped
+            if rows is None:
+                skipped_pages.append(pageno)
 
+            # Strict table check: must have >1 row and >1 column
+            elif not rows or len(rows) < 1 or all(len(r) < 2 for r in rows):
+                unsupported_pages.append(pageno)
+
+            else:
                 # Valid table found
                 valid_table_found = True
 
@@ -2096,36 +1947,48 @@ def pdf_to_csv(pdf_path, csv_path=None, xlsx_path=None, csv_delimiter=", " , exc
                             safe_row = [s.encode("utf-8", errors="ignore").decode("utf-8") for s in out_row]
                             csv_writer.writerow(safe_row)
 
-                    if ws:
-                        cells = []
-                        for cell_val in out_row:
-                            script = detect_script_simple(cell_val)
-                            font_name = excel_font_map.get(script, excel_font_map.get("DEFAULT", "Arial"))
-                            cell = WriteOnlyCell(ws, value=cell_val)
-                            cell.font = Font(name=font_name, size=11)
-                            cells.append(cell)
-                        ws.append(cells)
+                    if spool:
+                        spool.append(out_row)
+                    elif ws:
+                        ws.append(_xlsx_table_row(ws, out_row, excel_font_map))
 
                     total_rows += 1
                     if total_rows % batch_log_every == 0:
                         print(f"Processed rows: {total_rows} (page {pageno}/{num_pages})")
 
+            if ckpt and pageno % max(1, checkpoint_every) == 0:
+                ckpt.save(page=pageno, rows=total_rows, valid_table_found=valid_table_found,
+                          unsupported_pages=unsupported_pages, skipped_pages=skipped_pages,
+                          csv_bytes=synced_size(csv_file) if csv_file else 0,
+                          spool_bytes=spool.sync() if spool else 0)
+
         if not valid_table_found:
             # Close any opened files
             if csv_file:
                 csv_file.close()
                 os.remove(csv_path)  # remove empty CSV
-            if wb:
-                os.remove(xlsx_path)
+            if spool:
+                spool.remove()
+            if ckpt:
+                ckpt.clear()
             print("❌ No embedded table/CSV found in PDF. Only actual tables can be converted in strict mode.")
             return None
 
         # Close/save files
         if csv_file:
             csv_file.close()
+        if spool:
+            for out_row in spool:
+                ws.append(_xlsx_table_row(ws, out_row, excel_font_map))
         if wb:
             wb.save(xlsx_path)
+        if spool:
+            spool.remove()
+        if ckpt:
+            ckpt.clear()
 
+        if skipped_pages:
+            print(f"ℹ️ Pages without tables (not extracted): {len(skipped_pages)}/{num_pages}")
         if unsupported_pages:
             print(f"⚠️ Pages skipped (unsupported content): {unsupported_pages}")
             print("Only actual tables converted. JSON/XLS/plain text ignored.")
@@ -2137,6 +2000,7 @@ def pdf_to_csv(pdf_path, csv_path=None, xlsx_path=None, csv_delimiter=", " , exc
         if xlsx_path:
             out["xlsx"] = os.path.abspath(xlsx_path)
         out["rows"] = total_rows
+        out["skipped_pages"] = skipped_pages
         return out
 
     except Exception as exc:
@@ -2146,13 +2010,15 @@ def pdf_to_csv(pdf_path, csv_path=None, xlsx_path=None, csv_delimiter=", " , exc
         except Exception:
             pass
         try:
-            if wb:
+            if spool:
+                spool.close()  # kept, with the checkpoint, for resume=True
+            elif wb:
                 wb.save(xlsx_path)
         except Exception:
             pass
         raise RuntimeError(f"Error converting PDF to CSV/XLSX: {exc}") from exc
 
-def pdf_to_xls(pdf_path, xls_path):
+def pdf_to_xls(pdf_path, xls_path, page_workers=None, max_rss_mb=None):
     try:
         if not pdf_path.endswith(".pdf"):
             raise RuntimeError("❌ Only PDF files are supported!")
@@ -2162,11 +2028,10 @@ def pdf_to_xls(pdf_path, xls_path):
 
         wb = Workbook(write_only=True)
         ws = wb.create_sheet("Sheet1")
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                rows = _page_tables_to_rows(page)
-                for r in rows:
-                    ws.append([str(x) if x is not None else "" for x in r])
+        for _, rows in extract_pages(pdf_path, "Converter.pdf_extract:table_rows", workers=page_workers,
+                                     max_rss_mb=max_rss_mb):
+            for r in rows:
+                ws.append([str(x) if x is not None else "" for x in r])
         wb.save(xls_path)
         return xls_path
 
@@ -2174,7 +2039,12 @@ def pdf_to_xls(pdf_path, xls_path):
         print(f"❌ PDF to XLS failed: {e}")
         return None
 
-def pdf_to_json(pdf_path, json_path):
+def pdf_to_json(pdf_path, json_path, page_workers=None, max_rss_mb=None, ndjson=None):
+    '''
+    PDF → JSON: one {"page", "text", "tables"?} object per page, written as soon as
+    the page is extracted. ndjson=True (or a .ndjson/.jsonl json_path) writes one
+    page object per line instead of a JSON array.
+    '''
     try:
         if not pdf_path.endswith(".pdf"):
             raise RuntimeError("❌ Only PDF files are supported!")
@@ -2182,17 +2052,9 @@ def pdf_to_json(pdf_path, json_path):
         if not os.path.exists(pdf_path):
             raise RuntimeError("❌ File not found!")
 
-        pages_data = []
-        with pdfplumber.open(pdf_path) as pdf:
-            for idx, page in enumerate(pdf.pages, 1):
-                page_dict = {"page": idx, "text": page.extract_text() or ""}
-                # Try tables too
-                tables = page.extract_tables() or []
-                if tables:
-                    page_dict["tables"] = tables
-                pages_data.append(page_dict)
-        with open(json_path, "w", encoding="utf-8") as out:
-            json.dump(pages_data, out, ensure_ascii=False, indent=2)
+        records = (record for _, record in extract_pages(pdf_path, "Converter.pdf_extract:page_record",
+                                                         workers=page_workers, max_rss_mb=max_rss_mb))
+        write_json_records(records, json_path, ndjson=ndjson)
         return json_path
 
     except Exception as e:
@@ -2215,7 +2077,7 @@ def doc_to_pdf(input_path: str, output_pdf: str, mode: str = "auto", raster_dpi:
         if not os.path.exists(input_path):
             raise RuntimeError("Input file not found: " + input_path)
 
-        _ensure_dir(output_pdf)
+        ensure_parent_dir(output_pdf)
 
         # 1) Ensure DOCX
         docx_path = convert_doc_to_docx_if_needed(input_path)
@@ -2223,12 +2085,7 @@ def doc_to_pdf(input_path: str, output_pdf: str, mode: str = "auto", raster_dpi:
         # --- Check if doc has wide tables (>=5 columns) ---
         has_wide_tables = False
         try:
-            from docx import Document
-            doc = Document(docx_path)
-            for tbl in doc.tables:
-                if tbl.rows and len(tbl.rows[0].cells) >= 5:
-                    has_wide_tables = True
-                    break
+            has_wide_tables = inspect_docx(docx_path).max_columns >= 5
         except Exception as e:
             print(f"⚠️ Could not inspect tables in DOCX: {e}")
 
@@ -2238,10 +2095,15 @@ def doc_to_pdf(input_path: str, output_pdf: str, mode: str = "auto", raster_dpi:
 
                 with open(docx_path, "rb") as f:
                     html = mammoth.convert_to_html(f).value
-                tmp_html = os.path.join(tempfile.gettempdir(), "doc_tmp.html")
-                with open(tmp_html, "w", encoding="utf-8") as f:
-                    f.write(html)
-                pdfkit.from_file(tmp_html, output_pdf)
+                # per-call scratch dir: parallel conversions must not share one HTML file
+                html_dir = tempfile.mkdtemp(prefix="doc2html_")
+                try:
+                    tmp_html = os.path.join(html_dir, "doc.html")
+                    with open(tmp_html, "w", encoding="utf-8") as f:
+                        f.write(html)
+                    pdfkit.from_file(tmp_html, output_pdf)
+                finally:
+                    shutil.rmtree(html_dir, ignore_errors=True)
                 print(f"✅ Converted via HTML path (wide table support): {output_pdf}")
                 return output_pdf
             except Exception as e:
@@ -2275,39 +2137,28 @@ def doc_to_pdf(input_path: str, output_pdf: str, mode: str = "auto", raster_dpi:
         print(f"❌ DOCX to PDF failed: {e}")
         return None
 
-#def doc_to_txt(docx_path, txt_path):
-#    try:
-#        ensure_parent_dir(txt_path)
-#        doc = Document(docx_path)
-#        lines = []
-#        for p in doc.paragraphs:
-#            lines.append(p.text)
-#        with open(txt_path, "w", encoding="utf-8") as out:
-#            out.write("\n".join(lines))
-#        print(f"✅ DOCX → TXT: {txt_path}")
-#        return txt_path
-#    except Exception as e:
-#        print(f"❌ DOCX to TXT failed: {e}")
-#        return None
+def _docx_cell(text):
+    """Cell text for CSV/JSON rows: one line, trimmed, unencodable characters dropped."""
+    text = text.replace("\n", " ").strip()
+    if text:
+        text = text.encode("utf-8", "ignore").decode("utf-8")
+    return text
 
 def doc_to_txt(docx_path, txt_path):
     try:
-        if not docx_path.endswith(".docs"):
+        if not docx_path.lower().endswith(".docx"):
             raise RuntimeError("❌ Only DOCX files are supported!")
 
         if not os.path.exists(docx_path):
             raise RuntimeError("❌ File not found!")
 
-        doc = Document(docx_path)
         with open(txt_path, "w", encoding="utf-8") as out:
-            # Paragraphs
-            for para in doc.paragraphs:
-                out.write((para.text or "") + "\n")
-            # Tables (append as TSV)
-            for table in doc.tables:
-                for row in table.rows:
-                    cells = [c.text.replace("\n"," ").strip() for c in row.cells]
-                    out.write("\t".join(cells) + "\n")
+            # Paragraphs as lines, table rows as TSV, in document order
+            for item in iter_body(docx_path):
+                if isinstance(item, TableRow):
+                    out.write("\t".join(c.replace("\n", " ").strip() for c in item.cells) + "\n")
+                else:
+                    out.write(item.text + "\n")
         return txt_path
 
     except Exception as e:
@@ -2319,35 +2170,18 @@ def doc_to_docx_image(input_path: str) -> str:
     Ensure the input is in DOCX format.
     If it's a .doc, convert using LibreOffice headless.
     """
-    import tempfile, subprocess, os, glob
-
-    if input_path.lower().endswith(".docx"):
-        return input_path
-
-    if input_path.lower().endswith(".doc"):
-        tmp_dir = tempfile.mkdtemp(prefix="doc2docx_")
-        try:
-            subprocess.check_call([
-                "soffice", "--headless", "--convert-to", "docx",
-                "--outdir", tmp_dir, input_path
-            ])
-
-            # ✅ Find the .docx file inside tmp_dir
-            converted_files = glob.glob(os.path.join(tmp_dir, "*.docx"))
-            if not converted_files:
-                raise RuntimeError("DOC→DOCX conversion failed, file not created.")
-
-            return converted_files[0]  # Return the actual converted path
-        except Exception as e:
-            raise RuntimeError(f"Failed to convert .doc to .docx: {e}")
-    else:
+    if not input_path.lower().endswith((".doc", ".docx")):
         raise RuntimeError(f"Unsupported file type: {input_path}")
+    try:
+        return convert_doc_to_docx_if_needed(input_path)
+    except Exception as e:
+        raise RuntimeError(f"Failed to convert .doc to .docx: {e}")
 
-def doc_to_image(input_path, out_path, dpi=200):
+def doc_to_image(input_path, out_path, dpi=200, split=None):
     """
     Convert .doc/.docx → PNG image(s) with full formatting (tables, images, layout preserved).
     - If 1 page → single PNG
-    - If multiple pages → user chooses:
+    - If multiple pages → user chooses (or pass split=False/True, default DEFAULT_SPLIT when unattended):
         1 = merge into single long PNG
         2 = separate PNG per page (zipped)
     """
@@ -2358,11 +2192,7 @@ def doc_to_image(input_path, out_path, dpi=200):
         # ✅ Detect wide tables
         wide_table = False
         try:
-            doc = Document(docx_path)
-            for table in doc.tables:
-                if len(table.columns) > 5:
-                    wide_table = True
-                    break
+            wide_table = inspect_docx(docx_path).max_columns > 5
         except Exception as e:
             print(f"⚠️ Could not inspect tables: {e}")
 
@@ -2389,47 +2219,37 @@ def doc_to_image(input_path, out_path, dpi=200):
         else:
             print("✅ No wide tables → Using LibreOffice pipeline")
             tmp_dir = tempfile.mkdtemp(prefix="doc2pdf_")
-            subprocess.check_call([
-                "soffice", "--headless", "--convert-to", "pdf",
-                "--outdir", tmp_dir, docx_path
-            ])
-
-            pdf_files = glob.glob(os.path.join(tmp_dir, "*.pdf"))
-            if not pdf_files:
-                raise RuntimeError("DOCX→PDF failed, no PDF generated.")
-            pdf_path = pdf_files[0]
+            pdf_path = convert_docx_to_pdf_libreoffice(
+                docx_path, os.path.join(tmp_dir, os.path.splitext(os.path.basename(docx_path))[0] + ".pdf"))
 
         print(f"✅ PDF ready at: {pdf_path}", '3')
 
-        # ✅ PDF → PNG(s)
-        pages = convert_from_path(pdf_path, dpi=dpi)
-        print(f"pages: {len(pages)}", "4")
+        # ✅ PDF → PNG(s), rendered a few pages at a time
+        page_count = pdf_page_count(pdf_path)
+        print(f"pages: {page_count}", "4")
 
-        if len(pages) == 1:
+        if page_count == 1:
             if not out_path.lower().endswith(".png"):
                 out_path += ".png"
-            pages[0].save(out_path, "PNG")
+            render_page(pdf_path, 1, dpi=dpi).save(out_path, "PNG")
             print(f"✅ Converted single page image: {out_path}")
             return out_path
 
         # Multiple pages → ask user
-        print("Document has multiple pages. Choose output format:")
-        print("1. Single PNG (all pages merged vertically)")
-        print("2. Separate PNG per page (zipped)")
-        choice = input("Enter choice (1/2): ").strip()
+        if _should_prompt(split):
+            print("Document has multiple pages. Choose output format:")
+            print("1. Single PNG (all pages merged vertically)")
+            print("2. Separate PNG per page (zipped)")
+            choice = input("Enter choice (1/2): ").strip()
+        else:
+            if split is None:
+                split = DEFAULT_SPLIT
+            choice = "2" if split else "1"
 
         if choice == "1":
-            widths, heights = zip(*(p.size for p in pages))
-            total_height = sum(heights)
-            max_width = max(widths)
-            merged_img = Image.new("RGB", (max_width, total_height), "white")
-            y = 0
-            for p in pages:
-                merged_img.paste(p, (0, y))
-                y += p.height
             if not out_path.lower().endswith(".png"):
                 out_path += ".png"
-            merged_img.save(out_path, "PNG")
+            merge_pdf_pages(pdf_path, out_path, dpi=dpi)
             print(f"✅ Merged multi-page image saved: {out_path}")
             return out_path
 
@@ -2437,11 +2257,7 @@ def doc_to_image(input_path, out_path, dpi=200):
             if not out_path.lower().endswith(".zip"):
                 out_path += ".zip"
             img_dir = tempfile.mkdtemp(prefix="doc2img_")
-            image_files = []
-            for i, page in enumerate(pages, 1):
-                img_path = os.path.join(img_dir, f"page_{i}.png")
-                page.save(img_path, "PNG")
-                image_files.append(img_path)
+            image_files = save_pages(pdf_path, img_dir, fmt="png", dpi=dpi)
 
             with zipfile.ZipFile(out_path, "w") as zipf:
                 for f in image_files:
@@ -2462,47 +2278,35 @@ def doc_to_csv(input_path, csv_path):
     try:
         # Step 1: normalize DOC → DOCX
         docx_path = doc_to_docx_image(input_path)
-        doc = Document(docx_path)
 
         # 🚫 Step 2: Reject if any images exist
-        for rel in doc.part.rels.values():
-            if "image" in rel.target_ref:
-                raise RuntimeError("❌ Not supported: Document contains images, cannot export to CSV.")
-
-        # Step 3: Scan all tables first
-        valid_tables = []
-        for table in doc.tables:
-            col_count = len(table.rows[0].cells) if table.rows else 0
-            row_count = len(table.rows)
+        if inspect_docx(docx_path).has_images:
+            raise RuntimeError("❌ Not supported: Document contains images, cannot export to CSV.")
 
-            if col_count < 4 or row_count < 2:
-                continue
+        # Step 3: Stream the tables (one in memory at a time), writing only valid ones
+        wrote_any = False
+        with open(csv_path, "w", encoding="utf-8-sig", newline="") as out:
+            writer = csv.writer(out)
+            for _, rows in iter_tables(docx_path):
+                col_count = len(rows[0])
+                if col_count < 4 or len(rows) < 2:
+                    continue
 
-            meaningful_rows = 0
-            for row in table.rows:
-                texts = [c.text.strip() for c in row.cells if c.text.strip()]
-                if len(texts) >= (col_count // 2) and any(len(t) >= 3 for t in texts):
-                    meaningful_rows += 1
+                meaningful_rows = 0
+                for row in rows:
+                    texts = [c.strip() for c in row if c.strip()]
+                    if len(texts) >= (col_count // 2) and any(len(t) >= 3 for t in texts):
+                        meaningful_rows += 1
+                if meaningful_rows < 2:
+                    continue
 
-            if meaningful_rows >= 2:
-                valid_tables.append(table)
+                for row in rows:
+                    writer.writerow([_docx_cell(c) for c in row])
+                wrote_any = True
 
-        if not valid_tables:
+        if not wrote_any:
             raise RuntimeError("❌ Not supported: No valid table (≥4 columns, ≥2 rows, with real data).")
 
-        # ✅ Step 4: Now open CSV only if conversion is confirmed
-        with open(csv_path, "w", encoding="utf-8-sig", newline="") as out:
-            writer = csv.writer(out)
-            for table in valid_tables:
-                for row in table.rows:
-                    row_data = []
-                    for c in row.cells:
-                        text = c.text.replace("\n", " ").strip()
-                        if text:
-                            text = text.encode("utf-8", "ignore").decode("utf-8")
-                        row_data.append(text)
-                    writer.writerow(row_data)
-
         return csv_path
 
     except Exception as e:
@@ -2573,16 +2377,20 @@ def doc_to_json(input_path, json_path):
         # ✅ DOC → DOCX ensure
         docx_path = doc_to_docx_image(input_path)
 
-        # ✅ Load DOCX
-        doc = Document(docx_path)
-
         # ✅ Step 3: Image check
-        for rel in doc.part.rels.values():
-            if "image" in rel.reltype:
-                raise RuntimeError("❌ Not supported: Document contains images.")
-
-        # ✅ Step 4: Raw text join
-        raw_text = "\n".join([p.text.strip() for p in doc.paragraphs if p.text.strip()])
+        if inspect_docx(docx_path).has_images:
+            raise RuntimeError("❌ Not supported: Document contains images.")
+
+        # ✅ Step 4: One pass over the body: non-empty paragraph lines + candidate tables
+        lines, tables = [], []
+        for item in iter_body(docx_path):
+            if isinstance(item, TableRow):
+                if not tables or item.table != tables[-1][0]:
+                    tables.append((item.table, []))
+                tables[-1][1].append([_docx_cell(c) for c in item.cells])
+            elif item.text.strip():
+                lines.append(item.text.strip())
+        raw_text = "\n".join(lines)
 
         # ✅ Step 5: Detect JSON-like content
         if raw_text.strip().startswith(("{", "[")):
@@ -2594,24 +2402,11 @@ def doc_to_json(input_path, json_path):
             except Exception:
                 pass  # not valid JSON, fallback
 
-        # ✅ Step 6: Detect table data
-        valid_tables = []
-        for table in doc.tables:
-            if len(table.columns) >= 4 and len(table.rows) >= 2:
-                table_data = []
-                for row in table.rows:
-                    row_data = []
-                    for c in row.cells:
-                        text = c.text.replace("\n", " ").strip()
-                        if text:
-                            text = text.encode("utf-8", "ignore").decode("utf-8")
-                        row_data.append(text)
-                    table_data.append(row_data)
-                valid_tables.append(table_data)
+        # ✅ Step 6: Keep tables with ≥4 columns and ≥2 rows
+        valid_tables = [rows for _, rows in tables if len(rows) >= 2 and len(rows[0]) >= 4]
 
         # ✅ Step 7: Detect tab/comma separated plain text (like csv.docx)
         if not valid_tables:
-            lines = [p.text.strip() for p in doc.paragraphs if p.text.strip()]
             table_data = []
             for line in lines:
                 if "," in line or "\t" in line or ";" in line:
@@ -2664,23 +2459,16 @@ def image_to_txt_ocr(in_path, txt_path, lang="auto"):
         # Handle 'auto' language detection
         target_langs = []
         if lang.lower() == 'auto':
-            # For auto-detection, load default EasyOCR languages and then try to detect
-            target_langs_for_easyocr = _parse_langs_for_easyocr(lang)
-            reader = _get_easyocr(target_langs_for_easyocr) # Load initial languages
-            if reader:
-                # Now try to detect language from the image
-                detected = detect_language_from_image(img)
-                print(f"🌐 Detected language: {detected}")
-                # Re-initialize EasyOCR with the detected language + English for robustness
-                target_langs = list(set([detected, 'en'])) # Use set to avoid duplicates
-                # Ensure the detected language is in the supported list for EasyOCR if not English
-                if detected != 'en' and detected not in ['hi', 'es', 'fr', 'de', 'ru', 'ja', 'ko', 'ch_sim', 'ch_tra']: # Add more supported languages if needed
-                    print(f"⚠️ Detected language {detected} might not be fully supported by EasyOCR. Using English.")
-                    target_langs = ['en'] # Fallback to English
-                reader = _get_easyocr(target_langs) # Re-initialize with detected/fallback languages
-            else:
-                # If EasyOCR couldn't even initialize with defaults
-                target_langs = ['en'] # Fallback to Tesseract with English
+            # Detect the language first (quick Tesseract pass), then load a single
+            # reader for detected + English instead of loading a default reader too
+            detected = detect_language_from_image(img)
+            print(f"🌐 Detected language: {detected}")
+            target_langs = list(set([detected, 'en'])) # Use set to avoid duplicates
+            # Ensure the detected language is in the supported list for EasyOCR if not English
+            if detected != 'en' and detected not in ['hi', 'es', 'fr', 'de', 'ru', 'ja', 'ko', 'ch_sim', 'ch_tra']: # Add more supported languages if needed
+                print(f"⚠️ Detected language {detected} might not be fully supported by EasyOCR. Using English.")
+                target_langs = ['en'] # Fallback to English
+            reader = _get_easyocr(target_langs)
         else:
             target_langs = _parse_langs_for_easyocr(lang)
             reader = _get_easyocr(target_langs) # Initialize with specified languages
@@ -2820,73 +2608,78 @@ def bmp_to_txt(in_path, out_path, lang="auto"):  return image_to_txt_ocr(in_path
 # Dispatcher
 # =========================
 
-CONVERTERS = {
+# Different spellings of the same format (menus say "png", the PDF/DOCX entries say "image", ...)
+FORMAT_ALIASES = [("xlsx", "xls"), ("docx", "doc"), ("png", "image")]
+
+# Entries are function names resolved on first use (see Converter/registry.py);
+# "module:function" targets are also accepted for converters living elsewhere.
+CONVERTERS = ConverterRegistry(__name__, {
     # CSV →
-    ("csv", "xlsx"): csv_to_xls,
-    ("csv", "pdf"): csv_to_pdf,
-    ("csv", "docx"): csv_to_doc,
-    ("csv", "txt"): csv_to_txt,
-    ("csv", "json"): csv_to_json,
-    ("csv", "png"): csv_to_image,
+    ("csv", "xlsx"): "csv_to_xls",
+    ("csv", "pdf"): "csv_to_pdf",
+    ("csv", "docx"): "csv_to_doc",
+    ("csv", "txt"): "csv_to_txt",
+    ("csv", "json"): "csv_to_json",
+    ("csv", "png"): "csv_to_image",
 
     # XLSX →
-    ("xlsx", "csv"): xls_to_csv,
-    ("xlsx", "docx"): xls_to_doc,
-    ("xlsx", "txt"): xls_to_txt,
-    ("xlsx", "pdf"): xls_to_pdf,
-    ("xlsx", "json"): xls_to_json,
-    ("xlsx", "png"): xls_to_image,
+    ("xlsx", "csv"): "xls_to_csv",
+    ("xlsx", "docx"): "xls_to_doc",
+    ("xlsx", "txt"): "xls_to_txt",
+    ("xlsx", "pdf"): "xls_to_pdf",
+    ("xlsx", "json"): "xls_to_json",
+    ("xlsx", "png"): "xls_to_image",
 
     # TXT →
-    ("txt", "pdf"): txt_to_pdf,
-    ("txt", "docx"): txt_to_doc,
-    ("txt", "json"): txt_to_json,
-    ("txt", "csv"): txt_to_csv,
-    ("txt", "png"): txt_to_image,
-    ("txt", "xlsx"): txt_to_xls,
+    ("txt", "pdf"): "txt_to_pdf",
+    ("txt", "docx"): "txt_to_doc",
+    ("txt", "json"): "txt_to_json",
+    ("txt", "csv"): "txt_to_csv",
+    ("txt", "png"): "txt_to_image",
+    ("txt", "xlsx"): "txt_to_xls",
 
     # JSON →
-    ("json", "csv"): json_to_csv,
-    ("json", "xlsx"): json_to_xls,
-    ("json", "txt"): json_to_txt,
-    ("json", "pdf"): json_to_pdf,
-    ("json", "docx"): json_to_doc,
-    ("json", "png"): json_to_image,
+    ("json", "csv"): "json_to_csv",
+    ("json", "xlsx"): "json_to_xls",
+    ("json", "txt"): "json_to_txt",
+    ("json", "pdf"): "json_to_pdf",
+    ("json", "docx"): "json_to_doc",
+    ("json", "png"): "json_to_image",
 
     # DOCX → (helpers)
-    ("docx", "txt"): doc_to_txt,
-    ("docx", "pdf"): doc_to_pdf,
-    ("docx", "xls"): doc_to_xls,
-    ("docx", "csv"): doc_to_csv,
-    ("docx", "json"): doc_to_json,
-    ("docx", "image"): doc_to_image,
+    ("docx", "txt"): "doc_to_txt",
+    ("docx", "pdf"): "doc_to_pdf",
+    ("docx", "xls"): "doc_to_xls",
+    ("docx", "csv"): "doc_to_csv",
+    ("docx", "json"): "doc_to_json",
+    ("docx", "image"): "doc_to_image",
 
     # PDF → (helpers)
-    ("pdf", "txt"): pdf_to_txt,
-    ("pdf", "docx"): pdf_to_docx,
-    ("pdf", "image"): pdf_to_image,
-    ("pdf", "csv"): pdf_to_csv,
-    ("pdf", "xls"): pdf_to_xls,
-    ("pdf", "json"): pdf_to_json,
-    ("pdf", "txt ocr"): pdf_to_txt_ocr,
+    ("pdf", "txt"): "pdf_to_txt",
+    ("pdf", "docx"): "pdf_to_docx",
+    ("pdf", "image"): "pdf_to_image",
+    ("pdf", "csv"): "pdf_to_csv",
+    ("pdf", "xls"): "pdf_to_xls",
+    ("pdf", "json"): "pdf_to_json",
+    ("pdf", "txt ocr"): "pdf_to_txt_ocr",
 
     # IMAGE → (helpers)
-    ("png", "jpg"): image_to_image,
-    ("png", "jpeg"): image_to_image,
-    ("jpg", "jpeg"): image_to_image,
-    ("jpg", "png"): image_to_image,
-    ("jpeg", "jpg"): image_to_image,
-    ("jpeg", "png"): image_to_image,
-    ("gif", "png") : image_to_image,
-
-    ("jpg", "txt"): image_to_txt_ocr,
-    ("jpeg", "txt"): image_to_txt_ocr,
-    ("png", "txt"): image_to_txt_ocr,
-    ("gif", "txt"): image_to_txt_ocr,
-    ("tiff", "txt"): image_to_txt_ocr,
-    ("bmp", "txt"): image_to_txt_ocr,
-
-}
+    ("png", "jpg"): "png_to_jpg",
+    ("png", "jpeg"): "png_to_jpeg",
+    ("jpg", "jpeg"): "jpg_to_jpeg",
+    ("jpg", "png"): "jpg_to_png",
+    ("jpeg", "jpg"): "jpeg_to_jpg",
+    ("jpeg", "png"): "jpeg_to_png",
+    ("gif", "png") : "gif_to_png",
+
+    ("jpg", "txt"): "jpg_to_txt",
+    ("jpeg", "txt"): "jpeg_to_txt",
+    ("png", "txt"): "png_to_txt",
+    ("gif", "txt"): "gif_to_txt",
+    ("tiff", "txt"): "tiff_to_txt",
+    ("bmp", "txt"): "bmp_to_txt",
+
+}, aliases=FORMAT_ALIASES)
 
 SUPPORTED_MENUS = {
     "pdf": [
@@ -2944,12 +2737,19 @@ SUPPORTED_MENUS = {
 def infer_ext(path):
     return os.path.splitext(path)[1].lower().strip(".") if "." in os.path.basename(path) else ""
 
-def run_conversion(src_fmt, dst_fmt, in_path, out_path):
-    key = (src_fmt.lower(), dst_fmt.lower())
-    if key not in CONVERTERS:
+def _accepted_options(func, options):
+    """Keep only the keyword options `func` accepts (e.g. split= for the image converters)."""
+    if not options:
+        return {}
+    params = inspect.signature(func).parameters
+    return {k: v for k, v in options.items() if k in params}
+
+def run_conversion(src_fmt, dst_fmt, in_path, out_path, **options):
+    func = CONVERTERS.find(src_fmt, dst_fmt)
+    if func is None:
         print(f"❌ Conversion not supported: {src_fmt} → {dst_fmt}")
         return None
-    return CONVERTERS[key](in_path, out_path)
+    return func(in_path, out_path, **_accepted_options(func, options))
 
 # =========================
 # CLI Menu
@@ -3016,7 +2816,7 @@ def cli_menu():
                     out_path = f"{base}.{dst_fmt}"
 
                 # Run conversion
-                func = CONVERTERS.get((src_fmt, dst_fmt))
+                func = CONVERTERS.find(src_fmt, dst_fmt)
                 if func:
                     try:
                         result = func(in_path, out_path)
@@ -3058,11 +2858,267 @@ def cli_menu():
         else:
             print("❌ Invalid choice!")
 
+# =========================
+# Scriptable CLI
+# =========================
+
+# Output file extension for targets whose format name is not an extension
+_OUTPUT_EXT = {"image": "png", "txt ocr": "txt", "xls": "xlsx"}
+
+def _output_path_for(in_path, out_dir, dst_fmt, in_root=None):
+    """out_dir/<name relative to in_root>.<ext of dst_fmt>"""
+    rel = os.path.relpath(in_path, in_root) if in_root else os.path.basename(in_path)
+    ext = _OUTPUT_EXT.get(dst_fmt, dst_fmt)
+    return os.path.join(out_dir, os.path.splitext(rel)[0] + "." + ext)
+
+def plan_dir_jobs(in_dir, out_dir, dst_fmt, src_fmt=None, recursive=False):
+    """
+    List (src_fmt, dst_fmt, in_path, out_path) jobs for every convertible file in in_dir.
+    Files whose format has no converter to dst_fmt are skipped.
+    """
+    jobs = []
+    walker = os.walk(in_dir) if recursive else [(in_dir, [], sorted(os.listdir(in_dir)))]
+    for root, _, names in walker:
+        for name in sorted(names):
+            in_path = os.path.join(root, name)
+            if not os.path.isfile(in_path):
+                continue
+            fmt = src_fmt or infer_ext(in_path)
+            if not fmt or CONVERTERS.find_key(fmt, dst_fmt) is None:
+                continue
+            jobs.append((fmt, dst_fmt, in_path, _output_path_for(in_path, out_dir, dst_fmt, in_dir)))
+    return jobs
+
+def _run_job(job, options=None):
+    """Run one (src_fmt, dst_fmt, in_path, out_path) job; returns (in_path, result, error)."""
+    src_fmt, dst_fmt, in_path, out_path = job
+    try:
+        ensure_parent_dir(out_path)
+        result = run_conversion(src_fmt, dst_fmt, in_path, out_path, **(options or {}))
+        return in_path, result, None if result else "converter returned no output"
+    except Exception as e:
+        return in_path, None, str(e)
+
+# Run once in every batch worker process before its first job ("module:function" or callables)
+BATCH_WARMUP = ["Converter.fonts:warm_fonts"]
+
+# Image → TXT jobs go through EasyOCR; their reader is preloaded once per worker
+_OCR_SOURCES = ("png", "jpg", "jpeg", "gif", "tiff", "bmp", "image")
+
+# .doc inputs, and DOCX → PDF/image jobs, go through LibreOffice
+_OFFICE_JOBS = (("docx", "pdf"), ("docx", "image"), ("docx", "png"))
+
+def _batch_worker_defaults():
+    """Batch worker set-up: nobody answers prompts in a worker, so use the default policies.
+    (Spawned workers re-import this module with INTERACTIVE=True.)"""
+    global INTERACTIVE
+    INTERACTIVE = False
+
+def _batch_warmup(planned, options):
+    """BATCH_WARMUP plus OCR reader / office daemon warm-ups when the batch needs them."""
+    hooks = list(BATCH_WARMUP)
+    if any(src == "doc" or (src, dst) in _OFFICE_JOBS for src, dst, _, _ in planned):
+        hooks.append("Converter.office:warm_office")
+    if any(src in _OCR_SOURCES and dst == "txt" for src, dst, _, _ in planned):
+        lang = options.get("lang") or "auto"
+        if "+" not in lang:   # Tesseract-style codes have no EasyOCR reader
+            langs = ["en"] if lang.lower() == "auto" else _parse_langs_for_easyocr(lang)
+            hooks.append(functools.partial(warm_readers, [tuple(langs)]))
+    return hooks
+
+# DOCX → these formats starts with a LibreOffice PDF (unless doc_to_pdf takes its HTML path)
+_OFFICE_PDF_TARGETS = ("pdf", "image", "png")
+
+def _takes_html_path(docx_path, dst_fmt):
+    """True when doc_to_pdf / doc_to_image render this DOCX via HTML (wide tables), not LibreOffice."""
+    try:
+        columns = inspect_docx(docx_path).max_columns
+    except Exception:
+        return False
+    return columns >= 5 if dst_fmt == "pdf" else columns > 5
+
+def _office_prefetch(planned, workers=None):
+    """
+    Without a UNO daemon, run the batch's DOC → DOCX and DOCX → PDF LibreOffice
+    steps up front, many files per soffice call (see Converter/office.py:
+    OfficePrefetch). Returns the active prefetch, or None when it would not pay off.
+    """
+    office_jobs = [job for job in planned if job[0] == "doc" or (job[0], job[1]) in _OFFICE_JOBS]
+    if len(office_jobs) < 2 or uno_available() or not find_soffice():
+        return None
+    print(f"📦 Converting {len(office_jobs)} office files in batches")
+    prefetch = OfficePrefetch()
+    docx_for = {job[2]: job[2] for job in office_jobs if job[0] != "doc"}
+    made = prefetch.run([job[2] for job in office_jobs if job[0] == "doc"], "docx", workers=workers)
+    docx_for.update((src, out) for src, out in made.items() if out)
+    prefetch.run([docx_for[job[2]] for job in office_jobs
+                  if job[1] in _OFFICE_PDF_TARGETS and job[2] in docx_for
+                  and not _takes_html_path(docx_for[job[2]], job[1])], "pdf", workers=workers)
+    prefetch.activate()
+    return prefetch
+
+def convert_dir(in_dir, out_dir, dst_fmt, src_fmt=None, jobs=1, recursive=False,
+                max_jobs_per_worker=None, max_worker_rss_mb=None, **options):
+    """
+    Convert every matching file in in_dir into out_dir on `jobs` worker processes
+    (see Converter/batch.py). Returns list of (in_path, result, error).
+    """
+    from Converter.batch import BatchEngine
+
+    planned = plan_dir_jobs(in_dir, out_dir, dst_fmt, src_fmt=src_fmt, recursive=recursive)
+    if not planned:
+        print(f"⚠️ Nothing to convert to {dst_fmt} in {in_dir}")
+        return []
+    for job in planned:
+        ensure_parent_dir(job[3])
+    if jobs and jobs > 1:
+        # files already run in parallel; don't also fan pages out per file
+        options.setdefault("ocr_workers", 1)
+        options.setdefault("page_workers", 1)
+
+    done = [0]
+    def _progress(res):
+        done[0] += 1
+        if res.error:
+            print(f"❌ [{done[0]}/{len(planned)}] {res.job[2]}: {res.error}")
+
+    prefetch = _office_prefetch(planned, workers=jobs)
+    try:
+        warmup = _batch_warmup(planned, options)
+        if jobs and jobs > 1:
+            warmup.insert(0, _batch_worker_defaults)
+        engine = BatchEngine(run_conversion, workers=jobs, max_jobs_per_worker=max_jobs_per_worker,
+                             max_rss_mb=max_worker_rss_mb, warmup=warmup)
+        results = engine.run(planned, options, on_result=_progress)
+    finally:
+        if prefetch:
+            prefetch.close()
+    return [(res.job[2], res.result, res.error) for res in results]
+
+def _add_prompt_options(p):
+    """Every interactive question as an explicit option (unset → default policy)."""
+    g = p.add_mutually_exclusive_group()
+    g.add_argument("--split", dest="split", action="store_const", const=True, default=None,
+                   help="multi-page/long output → separate images (default)")
+    g.add_argument("--merge", dest="split", action="store_const", const=False,
+                   help="multi-page/long output → one tall image")
+    p.add_argument("--lang", default=None,
+                   help="OCR language(s), e.g. auto, en,hi or eng+hin (PDF → TXT maps en,hi to eng+hin)")
+    p.add_argument("--force-ocr", action="store_true",
+                   help="PDF → TXT: OCR every page, even pages with a usable text layer")
+
+def _add_pdf_options(p):
+    """Tuning for the pdfplumber converters (PDF → CSV/XLS/JSON/DOCX)."""
+    p.add_argument("--page-workers", type=int, default=None,
+                   help="worker processes for PDF page extraction (default: auto)")
+    p.add_argument("--max-rss", type=int, default=None, metavar="MB",
+                   help="fail with a clear error if PDF extraction goes above this resident memory")
+    p.add_argument("--resume", action="store_true",
+                   help="PDF → CSV: continue an interrupted conversion from its last checkpoint")
+    p.add_argument("--pdf-engine", choices=sorted(TEXT_ENGINES), default=None,
+                   help="PDF → TXT text extractor (default: pdfminer; pdfplumber is slowest)")
+    p.add_argument("--ndjson", action="store_true",
+                   help="PDF → JSON: one page object per line (default for .ndjson/.jsonl outputs)")
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(
+        prog="file_toolkit",
+        description="Universal file converter & translator. Run without a command for the interactive menu.")
+    sub = parser.add_subparsers(dest="command")
+
+    sub.add_parser("menu", help="interactive menu (default)")
+
+    p = sub.add_parser("convert", help="convert one file")
+    p.add_argument("src", help="input file")
+    p.add_argument("dst", help="output file")
+    p.add_argument("--to", dest="dst_fmt", required=True, help="target format, e.g. pdf, csv, png")
+    p.add_argument("--from", dest="src_fmt", default=None, help="source format (default: input extension)")
+    _add_prompt_options(p)
+    _add_pdf_options(p)
+
+    p = sub.add_parser("convert-dir", help="convert every matching file in a directory")
+    p.add_argument("in_dir")
+    p.add_argument("out_dir")
+    p.add_argument("--to", dest="dst_fmt", required=True, help="target format, e.g. pdf, csv, png")
+    p.add_argument("--from", dest="src_fmt", default=None, help="only convert this source format")
+    p.add_argument("--jobs", type=int, default=1, help="parallel worker processes (default 1)")
+    p.add_argument("--max-jobs-per-worker", type=int, default=500,
+                   help="recycle a worker process after this many files (default 500)")
+    p.add_argument("--max-worker-rss", type=int, default=None, metavar="MB",
+                   help="recycle a worker once it exceeds this resident memory")
+    p.add_argument("--recursive", action="store_true", help="descend into sub-directories")
+    _add_prompt_options(p)
+    _add_pdf_options(p)
+
+    p = sub.add_parser("translate", help="translate a file to text")
+    p.add_argument("src")
+    p.add_argument("dst")
+    p.add_argument("--src-lang", default="auto")
+    p.add_argument("--dest-lang", default="en")
+    return parser
+
+def main(argv=None):
+    global INTERACTIVE
+    args = build_arg_parser().parse_args(argv)
+
+    if args.command in (None, "menu"):
+        cli_menu()
+        return 0
+
+    INTERACTIVE = False
+
+    if args.command == "translate":
+        return 0 if translate_file(args.src, args.dst, args.src_lang, args.dest_lang) else 1
+
+    options = {k: v for k, v in (("split", args.split), ("lang", args.lang)) if v is not None}
+    if args.lang and args.lang.lower() != "auto":
+        # the PDF → TXT converters OCR with Tesseract and take ocr_langs=, not the
+        # EasyOCR-style lang= of the image converters: en,hi → eng+hin (eng+hin as is)
+        options["ocr_langs"] = (args.lang if "+" in args.lang
+                                else _langs_for_tesseract(_parse_langs_for_easyocr(args.lang)))
+    if args.force_ocr:
+        options["force_ocr"] = True
+    if args.page_workers:
+        options["page_workers"] = args.page_workers
+    if args.max_rss:
+        options["max_rss_mb"] = args.max_rss
+    if args.resume:
+        options["resume"] = True
+    if args.ndjson:
+        options["ndjson"] = True
+    if args.pdf_engine:
+        options["pdf_engine"] = args.pdf_engine
+
+    if args.command == "convert":
+        src_fmt = args.src_fmt or infer_ext(args.src)
+        if not os.path.exists(args.src):
+            print(f"❌ Input file not found: {args.src}")
+            return 1
+        if not src_fmt:
+            print("❌ Could not infer source format. Pass --from.")
+            return 1
+        _, result, error = _run_job((src_fmt, args.dst_fmt, args.src, args.dst), options)
+        if error:
+            print(f"❌ Conversion failed: {error}")
+            return 1
+        print(f"✅ Converted successfully: {result}")
+        return 0
+
+    if args.command == "convert-dir":
+        results = convert_dir(args.in_dir, args.out_dir, args.dst_fmt, src_fmt=args.src_fmt,
+                              jobs=args.jobs, recursive=args.recursive,
+                              max_jobs_per_worker=args.max_jobs_per_worker,
+                              max_worker_rss_mb=args.max_worker_rss, **options)
+        failed = [(path, error) for path, _, error in results if error]
+        print(f"✅ {len(results) - len(failed)}/{len(results)} files converted into {args.out_dir}")
+        return 1 if failed else 0
+
+    return 2
+
 # =========================
 # Entry
 # =========================
 
 if __name__ == "__main__":
-    # If you also want a non-interactive mode, you can add argparse here.
-    # For now, we use the requested menu UI:
-    cli_menu()
+    # No arguments → interactive menu; see `python file_toolkit.py -h` for the scriptable commands.
+    sys.exit(main())